@@ -0,0 +1,8 @@
+"""
+Benchmarks for Albion Radar
+
+Standalone scripts that time the handler hot paths with synthetic data.
+Run them as modules, for example:
+
+    python -m albion_radar.benchmarks.bench_harvestables
+"""
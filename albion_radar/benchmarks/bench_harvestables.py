@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Harvestables handler benchmark
+
+Simulates a T8 zone with 5,000 resources: one bulk
+NewSimpleHarvestableObjectList, then per-resource updates, size updates,
+harvest completions, range culling and removals. Pass --columnar to run
+against the struct-of-arrays resource store.
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from ..handlers.harvestables_handler import HarvestablesHandler
+from ..config.settings import Settings
+
+
+def build_simple_list_event(count: int, rng: random.Random, first_id: int = 1) -> Dict:
+    """Build a NewSimpleHarvestableObjectList event with `count` resources"""
+    ids = list(range(first_id, first_id + count))
+    locations: List[float] = []
+    for _ in ids:
+        locations.extend((rng.uniform(-400, 400), rng.uniform(-400, 400)))
+    return {
+        0: {'data': ids},
+        1: {'data': [rng.randrange(28) for _ in ids]},
+        2: {'data': [rng.choice((6, 7, 8)) for _ in ids]},
+        3: locations,
+        4: {'data': [rng.randrange(1, 6) for _ in ids]}
+    }
+
+
+def timed(label: str, operations: int, func: Callable[[], None], results: Dict) -> None:
+    """Run func once and record total and per-operation time"""
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    results[label] = (elapsed, operations)
+
+
+def measure_memory(count: int = 5000, seed: int = 8, columnar: bool = False) -> float:
+    """Bytes allocated per resource by a bulk add, spatial grid included"""
+    bulk_event = build_simple_list_event(count, random.Random(seed))
+    handler = HarvestablesHandler(Settings(), columnar=columnar)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        handler.handle_simple_harvestable_object(bulk_event)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / count
+
+
+def run(count: int = 5000, seed: int = 8, columnar: bool = False) -> Dict:
+    """Run the benchmark and return {label: (seconds, operations)}"""
+    rng = random.Random(seed)
+    handler = HarvestablesHandler(Settings(), columnar=columnar)
+    results: Dict = {}
+
+    bulk_event = build_simple_list_event(count, rng)
+    timed('bulk add (simple list)', count,
+          lambda: handler.handle_simple_harvestable_object(bulk_event), results)
+
+    ids = list(range(1, count + 1))
+    rng.shuffle(ids)
+
+    def update_all():
+        for resource_id in ids:
+            handler.handle_new_harvestable_object(resource_id, {
+                5: rng.randrange(28), 7: 8, 8: [0.0, 0.0], 10: rng.randrange(1, 6), 11: 2
+            })
+    timed('update', count, update_all, results)
+
+    def size_update_all():
+        for resource_id in ids:
+            handler.update_harvestable_size(resource_id, 3)
+    timed('size update', count, size_update_all, results)
+
+    def harvest_all():
+        for resource_id in ids:
+            handler.harvest_finished(resource_id, 1)
+    timed('harvest finished', count, harvest_all, results)
+
+    def range_queries():
+        for step in range(1000):
+            handler.get_in_range(rng.uniform(-300, 300), rng.uniform(-300, 300), 80.0)
+    timed('get_in_range r=80 (x1000)', 1000, range_queries, results)
+
+    def cull():
+        for step in range(100):
+            handler.remove_not_in_range(step * 0.5, 0.0, 400.0)
+    timed('remove_not_in_range (x100)', 100, cull, results)
+
+    remaining = [h.id for h in handler.get_harvestable_list()]
+    def remove_all():
+        for resource_id in remaining:
+            handler.remove_harvestable(resource_id)
+    timed('remove', len(remaining), remove_all, results)
+
+    return results
+
+
+def main() -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark HarvestablesHandler")
+    parser.add_argument('--count', type=int, default=5000, help="resources in the zone")
+    parser.add_argument('--seed', type=int, default=8)
+    parser.add_argument('--columnar', action='store_true', help="use the columnar resource store")
+    args = parser.parse_args()
+
+    layout = "columnar" if args.columnar else "dict"
+    print(f"HarvestablesHandler benchmark, {args.count} resources (T6-T8), {layout} store")
+    for label, (seconds, operations) in run(args.count, args.seed, args.columnar).items():
+        per_op = seconds / operations * 1e6 if operations else 0.0
+        print(f"  {label:<28} {seconds * 1000:10.2f} ms  {per_op:9.2f} us/op")
+    print(f"  {'memory per resource':<28} {measure_memory(args.count, args.seed, args.columnar):10.0f} bytes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Entity model benchmark
+
+Measures memory per instance and creation throughput of the radar's entity
+classes, comparing the slotted classes in use with plain dataclass twins
+(what the classes were before @compact).
+"""
+
+import argparse
+import time
+import tracemalloc
+from dataclasses import MISSING, field, fields, make_dataclass
+from typing import Callable, Dict, List, Tuple
+
+from ..models.player import Player
+from ..models.mob import Mob
+from ..models.resource import Resource, ResourceType
+from ..handlers.harvestables_handler import Harvestable
+from ..handlers.mobs_handler import Mist
+from ..handlers.dungeons_handler import DungeonData, DungeonType
+from ..handlers.fishing_handler import Fish
+from ..handlers.wisp_cage_handler import Cage
+from ..handlers.chests_handler import ChestData
+
+
+# Creation is timed this many times and the best run is reported
+REPEATS = 5
+
+# class -> factory building instance i
+FACTORIES: Dict[type, Callable[[type, int], object]] = {
+    Player: lambda cls, i: cls(id=i, nickname=f"Player{i}", guild_name="Guild", pos_x=i * 0.5, pos_y=-i * 0.5),
+    Mob: lambda cls, i: cls(id=i, name="Mob", type_id=i % 800, pos_x=i * 0.5, pos_y=1.0,
+                            health=1000, max_health=1000),
+    Resource: lambda cls, i: cls(id=i, type=ResourceType.FIBER, tier=6, pos_x=i * 0.5, pos_y=1.0),
+    Harvestable: lambda cls, i: cls(id=i, type=i % 28, tier=6, pos_x=i * 0.5, pos_y=1.0, size=3),
+    Mist: lambda cls, i: cls(id=i, pos_x=i * 0.5, pos_y=1.0, name="MIST", enchant=2, draw_name="mist_2"),
+    DungeonData: lambda cls, i: cls(id=i, pos_x=i * 0.5, pos_y=1.0, name="SOLO", enchant=1,
+                                    type=DungeonType.SOLO, draw_name="dungeon_1"),
+    Fish: lambda cls, i: cls(id=i, pos_x=i * 0.5, pos_y=1.0, type="FISH", size_spawned=2, size_left_to_spawn=3),
+    Cage: lambda cls, i: cls(id=i, pos_x=i * 0.5, pos_y=1.0, name="CAGE"),
+    ChestData: lambda cls, i: cls(id=i, pos_x=i * 0.5, pos_y=1.0, chest_name="CHEST")
+}
+
+
+def plain_twin(cls: type) -> type:
+    """Build an equivalent dataclass with a per-instance __dict__"""
+    specs = []
+    for entity_field in fields(cls):
+        if entity_field.default is not MISSING:
+            spec = field(default=entity_field.default)
+        elif entity_field.default_factory is not MISSING:
+            spec = field(default_factory=entity_field.default_factory)
+        else:
+            spec = field()
+        specs.append((entity_field.name, entity_field.type, spec))
+    namespace = {}
+    if hasattr(cls, '__post_init__'):
+        namespace['__post_init__'] = cls.__post_init__
+    return make_dataclass(cls.__name__, specs, namespace=namespace)
+
+
+def measure(cls: type, factory: Callable[[type, int], object], count: int) -> Tuple[float, float]:
+    """(bytes per instance, best instances created per second) for one class"""
+    instances: List[object] = [None] * count
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(count):
+            instances[i] = factory(cls, i + 1)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    memory = (after - before) / count
+
+    del instances
+    elapsed = float('inf')
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        instances = [factory(cls, i + 1) for i in range(count)]
+        elapsed = min(elapsed, time.perf_counter() - started)
+        del instances
+    return memory, count / elapsed if elapsed else 0.0
+
+
+def run(count: int = 20000) -> Dict[str, Tuple[float, float, float, float]]:
+    """Run the benchmark and return {class name: (plain bytes, slotted bytes, plain/s, slotted/s)}"""
+    results = {}
+    for cls, factory in FACTORIES.items():
+        plain_memory, plain_rate = measure(plain_twin(cls), factory, count)
+        slotted_memory, slotted_rate = measure(cls, factory, count)
+        results[cls.__name__] = (plain_memory, slotted_memory, plain_rate, slotted_rate)
+    return results
+
+
+def main() -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark entity model memory and creation")
+    parser.add_argument('--count', type=int, default=20000, help="instances per class")
+    args = parser.parse_args()
+
+    print(f"Entity model benchmark, {args.count} instances per class (plain dataclass -> slotted)")
+    print(f"  {'class':<12} {'bytes/entity':>21}  {'creations/s':>25}")
+    for name, (plain_memory, slotted_memory, plain_rate, slotted_rate) in run(args.count).items():
+        print(f"  {name:<12} {plain_memory:8.0f} -> {slotted_memory:8.0f}  "
+              f"{plain_rate:11,.0f} -> {slotted_rate:11,.0f}")
+
+
+if __name__ == '__main__':
+    main()
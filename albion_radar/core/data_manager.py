@@ -5,8 +5,8 @@ Manages data flow and coordination between handlers.
 """
 
 import asyncio
-import time
-from typing import Dict, List, Optional, Callable
+from functools import partial
+from typing import Dict, List, Optional, Callable, Tuple
 from ..handlers.players_handler import PlayersHandler
 from ..handlers.harvestables_handler import HarvestablesHandler
 from ..handlers.mobs_handler import MobsHandler
@@ -16,22 +16,50 @@ from ..handlers.fishing_handler import FishingHandler
 from ..handlers.wisp_cage_handler import WispCageHandler
 from ..handlers.items_info import ItemsInfo
 from ..handlers.mobs_info import MobsInfo
+from .world_snapshot import SnapshotBuffer, WorldSnapshot, freeze_entities
+from .timing_wheel import TimingWheel
+from .generation import GenerationReclaimer
+from .event_journal import EventJournalWriter
+from .spatial_grid import DEFAULT_RADAR_RANGE
+from .ignore_list import IgnoreList
+from .frame_clock import FRAME_CLOCK, FrameClock
 from ..config.settings import Settings
 
 
+# Seconds without any event before an entity is considered gone
+DEFAULT_ENTITY_TTLS: Dict[str, float] = {
+    'player': 60.0,
+    'resource': 600.0,
+    'mob': 180.0,
+    'chest': 900.0,
+    'dungeon': 900.0,
+    'fish': 300.0,
+    'cage': 900.0
+}
+
+
 class DataManager:
     """
     Manages data flow and coordination between handlers.
     
     Acts as a central coordinator for all radar data processing.
+    
+    `columnar_harvestables` switches resources to the experimental
+    struct-of-arrays store (HarvestableColumns); it is off by default.
+    Without an `ignore_list` nothing is ignored and ignore_list.json is
+    neither read nor written; AlbionRadar passes the file-backed one.
     """
     
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, entity_ttls: Optional[Dict[str, float]] = None,
+                 use_proximity_engine: bool = False, columnar_harvestables: bool = False,
+                 ignore_list: Optional[IgnoreList] = None, dead_reckoning: bool = False,
+                 object_pooling: bool = False):
         self.settings = settings
+        self.ignore_list = ignore_list if ignore_list is not None else IgnoreList(path=None)
         
         # Initialize handlers
-        self.players_handler = PlayersHandler(settings)
-        self.harvestables_handler = HarvestablesHandler(settings)
+        self.players_handler = PlayersHandler(settings, self.ignore_list)
+        self.harvestables_handler = HarvestablesHandler(settings, columnar=columnar_harvestables)
         self.mobs_handler = MobsHandler(settings)
         self.chests_handler = ChestsHandler(settings)
         self.dungeons_handler = DungeonsHandler(settings)
@@ -39,6 +67,36 @@ class DataManager:
         self.wisp_cage_handler = WispCageHandler(settings)
         self.items_info = ItemsInfo()
         self.mobs_info = MobsInfo()
+        self._handlers = [
+            self.players_handler,
+            self.harvestables_handler,
+            self.mobs_handler,
+            self.chests_handler,
+            self.dungeons_handler,
+            self.fishing_handler,
+            self.wisp_cage_handler
+        ]
+        
+        # Optional vectorized distance computation for players and mobs
+        self.proximity_enabled = False
+        if use_proximity_engine:
+            self.proximity_enabled = (self.players_handler.enable_proximity_engine()
+                                      and self.mobs_handler.enable_proximity_engine())
+            if not self.proximity_enabled:
+                print("numpy not available, proximity engine disabled")
+        
+        # Optional velocity tracking so renderers can extrapolate positions
+        self.dead_reckoning = dead_reckoning
+        if dead_reckoning:
+            self.players_handler.enable_motion_tracking()
+            self.mobs_handler.enable_motion_tracking()
+        
+        # Optional recycling of removed mobs and resources (fewer allocations
+        # and garbage collector passes while farming)
+        self.object_pooling = object_pooling
+        if object_pooling:
+            self.mobs_handler.enable_pooling()
+            self.harvestables_handler.enable_pooling()
         
         # Event callbacks
         self.callbacks: Dict[str, List[Callable]] = {
@@ -49,10 +107,59 @@ class DataManager:
             'dungeon_detected': [],
             'fish_detected': [],
             'cage_detected': [],
+            'player_equipment_changed': [],
+            'player_removed': [],
+            'resource_removed': [],
+            'mob_removed': [],
+            'chest_removed': [],
+            'dungeon_removed': [],
+            'fish_removed': [],
+            'cage_removed': [],
+            'zone_changed': [],
             'data_updated': []
         }
         
-        self._last_update = time.time()
+        # Removal method per entity kind, used by expiry
+        self._removers: Dict[str, Callable[[int], None]] = {
+            'player': self.players_handler.remove_player,
+            'resource': self.harvestables_handler.remove_harvestable,
+            'mob': self.mobs_handler.remove_mob,
+            'chest': self.chests_handler.remove_chest,
+            'dungeon': self.dungeons_handler.remove_dungeon,
+            'fish': self.fishing_handler.remove_fish,
+            'cage': self.wisp_cage_handler.remove_cage
+        }
+        
+        # Frame time shared with the models and handlers, sampled once per
+        # packet, batch and tick
+        self.clock: FrameClock = FRAME_CLOCK
+        
+        # Stale entity expiry
+        self.entity_ttls: Dict[str, float] = dict(DEFAULT_ENTITY_TTLS)
+        if entity_ttls:
+            self.entity_ttls.update(entity_ttls)
+        self._expiry_wheel = TimingWheel()
+        self._last_seen: Dict[Tuple[str, int], Tuple[float, int]] = {}
+        # Moves, health, items and charges count as activity too, not only
+        # the events that announce an entity
+        self.players_handler.on_activity = partial(self._touch, 'player')
+        self.harvestables_handler.on_activity = partial(self._touch, 'resource')
+        self.mobs_handler.on_activity = partial(self._touch, 'mob')
+        
+        # Zone generation; bumping it invalidates everything from the old zone
+        self.zone_generation = 0
+        self._reclaimer = GenerationReclaimer()
+        
+        # Optional on-disk recording of decoded events
+        self._journal: Optional[EventJournalWriter] = None
+        
+        # Published world state for readers on other threads
+        self._snapshots = SnapshotBuffer()
+        self._dirty = True
+        # Set by settings_changed(), applied on the next tick
+        self._settings_changed = False
+        
+        self._last_update = self.clock.wall()
     
     def add_callback(self, event_type: str, callback: Callable) -> None:
         """Add event callback"""
@@ -76,8 +183,38 @@ class DataManager:
                 except Exception as e:
                     print(f"Error in callback for {event_type}: {e}")
     
+    def enable_journal(self, path: str, **options) -> None:
+        """
+        Start recording every decoded event to a journal file.
+        
+        Options are passed to EventJournalWriter (max_bytes, backups,
+        fsync_interval, buffer_size).
+        """
+        self.disable_journal()
+        self._journal = EventJournalWriter(path, **options)
+    
+    def disable_journal(self) -> None:
+        """Stop recording and close the journal file"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+    
     def process_packet_data(self, packet_data: Dict) -> None:
         """Process packet data and route to appropriate handlers"""
+        self.clock.tick()
+        try:
+            self._process_packet(packet_data)
+        finally:
+            self.clock.end_frame()
+    
+    def _process_packet(self, packet_data: Dict) -> None:
+        """Process packet data at the current frame time"""
+        if self._journal is not None:
+            try:
+                self._journal.append(packet_data, self.clock.wall())
+            except Exception as e:
+                print(f"Error writing event journal: {e}")
+        
         try:
             event_type = packet_data.get('type')
             event_code = packet_data.get('code', 0)
@@ -89,6 +226,8 @@ class DataManager:
                 self._process_request(event_code, parameters)
             elif event_type == 'response':
                 self._process_response(event_code, parameters)
+            
+            self._dirty = True
                 
         except Exception as e:
             print(f"Error processing packet data: {e}")
@@ -98,37 +237,51 @@ class DataManager:
         try:
             if event_code == 1:  # Player event
                 self.players_handler.handle_new_player_event(parameters)
-                self._emit_event('player_detected', parameters)
+                if parameters.get(0) in self.players_handler.players:
+                    # Ignored players are never tracked
+                    self._touch('player', parameters.get(0))
+                    self._emit_event('player_detected', parameters)
                 
             elif event_code == 2:  # Resource event
                 self.harvestables_handler.handle_new_harvestable_object(
                     parameters.get(0, 0), parameters
                 )
+                self._touch('resource', parameters.get(0))
                 self._emit_event('resource_detected', parameters)
                 
             elif event_code == 3:  # Mob event
                 self.mobs_handler.handle_new_mob_event(parameters)
+                self._touch('mob', parameters.get(0))
                 self._emit_event('mob_detected', parameters)
                 
             elif event_code == 4:  # Chest event
                 self.chests_handler.handle_chest_event(parameters)
+                self._touch('chest', parameters.get(0))
                 self._emit_event('chest_detected', parameters)
                 
             elif event_code == 5:  # Dungeon event
                 self.dungeons_handler.handle_dungeon_event(parameters)
+                self._touch('dungeon', parameters.get(0))
                 self._emit_event('dungeon_detected', parameters)
                 
             elif event_code == 6:  # Fish event
                 self.fishing_handler.handle_new_fish_event(parameters)
+                self._touch('fish', parameters.get(0))
                 self._emit_event('fish_detected', parameters)
                 
             elif event_code == 7:  # Cage event
                 self.wisp_cage_handler.handle_new_cage_event(parameters)
+                self._touch('cage', parameters.get(0))
                 self._emit_event('cage_detected', parameters)
+                
+            elif event_code == 8:  # Equipment changed event
+                slots = self.players_handler.handle_equipment_changed_event(parameters)
+                if slots:
+                    self._emit_event('player_equipment_changed', {'id': parameters.get(0), 'slots': slots})
             
             # Emit general data update
             self._emit_event('data_updated', {
-                'timestamp': time.time(),
+                'timestamp': self.clock.wall(),
                 'event_code': event_code
             })
             
@@ -145,6 +298,143 @@ class DataManager:
         # TODO: Implement response processing
         pass
     
+    def _touch(self, kind: str, entity_id: Optional[int]) -> None:
+        """Record activity for an entity and make sure its expiry is scheduled"""
+        ttl = self.entity_ttls.get(kind)
+        if not entity_id or not ttl:
+            return
+        
+        key = (kind, entity_id)
+        now = self.clock.now
+        self._last_seen[key] = (now, self.zone_generation)
+        
+        # Refreshes only update the timestamp; the wheel entry is checked
+        # lazily when it fires, so repeat events cost O(1)
+        if key not in self._expiry_wheel:
+            self._expiry_wheel.start(now)
+            self._expiry_wheel.schedule(key, now + ttl)
+    
+    def settings_changed(self) -> None:
+        """Notify that settings were edited; visibility filters are rebuilt on the next tick"""
+        self._settings_changed = True
+    
+    def expire_stale_entities(self) -> int:
+        """Remove entities that have not been seen within their TTL"""
+        now = self.clock.now
+        expired = 0
+        
+        for key in self._expiry_wheel.advance(now):
+            seen = self._last_seen.get(key)
+            if seen is None:
+                continue
+            
+            last_seen, generation = seen
+            if generation != self.zone_generation:
+                # Left over from a previous zone, the entity is already gone
+                del self._last_seen[key]
+                continue
+            
+            kind, entity_id = key
+            deadline = last_seen + self.entity_ttls.get(kind, 0.0)
+            if deadline > now:
+                # Seen again since it was scheduled
+                self._expiry_wheel.schedule(key, deadline)
+                continue
+            
+            self.remove_entity(kind, entity_id)
+            expired += 1
+        
+        return expired
+    
+    def remove_entity(self, kind: str, entity_id: int) -> None:
+        """Remove an entity through its handler and notify removal callbacks"""
+        remover = self._removers.get(kind)
+        if remover is None:
+            return
+        
+        key = (kind, entity_id)
+        self._expiry_wheel.cancel(key)
+        self._last_seen.pop(key, None)
+        
+        remover(entity_id)
+        self._dirty = True
+        self._emit_event(f'{kind}_removed', {'id': entity_id, 'kind': kind})
+    
+    def process_batch(self, packets: List[Dict]) -> WorldSnapshot:
+        """Process a batch of packet data as one tick and publish the result"""
+        self.clock.tick()
+        try:
+            for packet_data in packets:
+                self._process_packet(packet_data)
+        finally:
+            self.clock.end_frame()
+        return self.end_tick()
+    
+    def end_tick(self) -> WorldSnapshot:
+        """Publish an immutable snapshot of the world if anything changed"""
+        self.clock.tick()
+        try:
+            return self._end_tick()
+        finally:
+            self.clock.end_frame()
+    
+    def _end_tick(self) -> WorldSnapshot:
+        """Body of end_tick(), run inside a frame"""
+        # Queued mob updates count as activity, so apply them before expiry
+        if self.mobs_handler.apply_pending_updates():
+            self._dirty = True
+        self.expire_stale_entities()
+        self._reclaimer.reclaim()
+        if self._settings_changed:
+            self._settings_changed = False
+            if self.harvestables_handler.refresh_visibility():
+                self._dirty = True
+        for player_id in self.players_handler.collect_ignored_players():
+            self.remove_entity('player', player_id)
+        
+        if not self._dirty:
+            return self._snapshots.read()
+        
+        local_player = self.players_handler.local_player
+        if self.proximity_enabled:
+            self._update_proximity(local_player.pos_x, local_player.pos_y)
+        
+        changed_mobs, removed_mob_ids = self.mobs_handler.take_mob_changes()
+        snapshot = self._snapshots.publish(
+            generation=self.zone_generation,
+            local_player=(local_player.pos_x, local_player.pos_y),
+            players=self.players_handler.snapshot(),
+            resources=self.harvestables_handler.snapshot(),
+            mobs=self.mobs_handler.snapshot(),
+            mists=self.mobs_handler.snapshot_mists(),
+            chests=self.chests_handler.snapshot(),
+            dungeons=self.dungeons_handler.snapshot(),
+            fishes=self.fishing_handler.snapshot(),
+            cages=self.wisp_cage_handler.snapshot(),
+            changed_mobs=freeze_entities(changed_mobs),
+            removed_mob_ids=tuple(removed_mob_ids),
+            player_motion=self.players_handler.motion.freeze() if self.dead_reckoning else None,
+            mob_motion=self.mobs_handler.motion.freeze() if self.dead_reckoning else None
+        )
+        self._dirty = False
+        self._last_update = snapshot.timestamp
+        return snapshot
+    
+    def _update_proximity(self, center_x: float, center_y: float,
+                          max_distance: float = DEFAULT_RADAR_RANGE) -> None:
+        """Recompute player and mob distances in one vectorized pass each"""
+        for engine in (self.players_handler.proximity, self.mobs_handler.proximity):
+            if not engine.is_current(center_x, center_y, max_distance):
+                engine.compute(center_x, center_y, max_distance)
+    
+    def get_snapshot(self) -> WorldSnapshot:
+        """
+        Get the last published world snapshot.
+        
+        Safe to call from any thread without locking.
+        """
+        return self._snapshots.read()
+    
     def get_all_data(self) -> Dict:
         """Get all current radar data"""
         return {
@@ -156,29 +446,54 @@ class DataManager:
             'dungeons': self.dungeons_handler.get_dungeon_list(),
             'fishes': self.fishing_handler.get_fishes_list(),
             'cages': self.wisp_cage_handler.get_cages_list(),
-            'timestamp': time.time()
+            'timestamp': self.clock.wall()
         }
     
     def clear_all_data(self) -> None:
         """Clear all data from all handlers"""
-        self.players_handler.clear()
-        self.harvestables_handler.clear()
-        self.mobs_handler.clear()
-        self.chests_handler.clear()
-        self.dungeons_handler.clear()
-        self.fishing_handler.clear()
-        self.wisp_cage_handler.clear()
+        self.change_zone()
+    
+    def change_zone(self) -> int:
+        """
+        Start a new zone generation.
+        
+        Handlers swap in empty storage in O(1); the old containers are released
+        incrementally at the end of later ticks, and expiry entries stamped
+        with the old generation are dropped when they fire.
+        """
+        self.zone_generation += 1
+        for handler in self._handlers:
+            self._reclaimer.retire(handler.detach())
+        
+        self._dirty = True
+        self._emit_event('zone_changed', {'generation': self.zone_generation})
+        return self.zone_generation
     
     def update_local_player_position(self, pos_x: float, pos_y: float) -> None:
         """Update local player position"""
         self.players_handler.update_local_player_position(pos_x, pos_y)
+        self._dirty = True
     
     def get_players_in_range(self, max_distance: float = 80.0) -> List:
         """Get players in range"""
         return self.players_handler.get_players_in_range(max_distance)
     
+    def get_objects_in_range(self, center_x: float, center_y: float, radius: float) -> Dict[str, List]:
+        """Get every tracked entity within radius of a point"""
+        return {
+            'players': self.players_handler.get_in_range(center_x, center_y, radius),
+            'resources': self.harvestables_handler.get_in_range(center_x, center_y, radius),
+            'mobs': self.mobs_handler.get_in_range(center_x, center_y, radius),
+            'mists': self.mobs_handler.get_mists_in_range(center_x, center_y, radius),
+            'chests': self.chests_handler.get_in_range(center_x, center_y, radius),
+            'dungeons': self.dungeons_handler.get_in_range(center_x, center_y, radius),
+            'fishes': self.fishing_handler.get_in_range(center_x, center_y, radius),
+            'cages': self.wisp_cage_handler.get_in_range(center_x, center_y, radius)
+        }
+    
     def get_resources_in_range(self, local_pos_x: float, local_pos_y: float, 
                               max_distance: float = 80.0) -> List:
         """Get resources in range"""
         self.harvestables_handler.remove_not_in_range(local_pos_x, local_pos_y, max_distance)
+        self._dirty = True
         return self.harvestables_handler.get_harvestable_list() 
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""
+Entity Store for Albion Radar
+
+Keyed container shared by the handlers that track entities by id in
+arrival order (chests, wisp cages, fishing spots, dungeons).
+"""
+
+from typing import Dict, Generic, Hashable, Iterator, List, Optional, Tuple, TypeVar
+
+
+T = TypeVar('T')
+
+
+class EntityStore(Generic[T]):
+    """
+    Insertion-ordered entity container with O(1) id lookup.
+
+    `values()` returns a tuple that is cached until the next mutation, so
+    repeated reads between changes (getters, snapshots, drawing) share one
+    copy and callers can iterate it while the store is being modified.
+    Replacing an existing id keeps its position, like updating a list slot.
+    """
+
+    def __init__(self):
+        self._entities: Dict[Hashable, T] = {}
+        self._values: Optional[Tuple[T, ...]] = ()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __contains__(self, entity_id: Hashable) -> bool:
+        return entity_id in self._entities
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.values())
+
+    def get(self, entity_id: Hashable) -> Optional[T]:
+        """Get an entity by id"""
+        return self._entities.get(entity_id)
+
+    def add(self, entity_id: Hashable, entity: T) -> bool:
+        """Add an entity unless its id is already stored, returning whether it was added"""
+        if entity_id in self._entities:
+            return False
+        self._entities[entity_id] = entity
+        self._values = None
+        return True
+
+    def put(self, entity_id: Hashable, entity: T) -> None:
+        """Add an entity or replace the one stored under its id"""
+        self._entities[entity_id] = entity
+        self._values = None
+
+    def remove(self, entity_id: Hashable) -> Optional[T]:
+        """Remove an entity by id, returning it"""
+        entity = self._entities.pop(entity_id, None)
+        if entity is not None:
+            self._values = None
+        return entity
+
+    def values(self) -> Tuple[T, ...]:
+        """Get every entity in insertion order, as a stable tuple"""
+        if self._values is None:
+            self._values = tuple(self._entities.values())
+        return self._values
+
+    def to_list(self) -> List[T]:
+        """Get every entity in insertion order, as a new list"""
+        return list(self.values())
+
+    def clear(self) -> None:
+        """Remove every entity"""
+        self._entities.clear()
+        self._values = ()
+
+    def detach(self) -> Dict[Hashable, T]:
+        """Swap in empty storage and return the old mapping for deferred release"""
+        retired = self._entities
+        self._entities = {}
+        self._values = ()
+        return retired
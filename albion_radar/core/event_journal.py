@@ -0,0 +1,355 @@
+"""
+Event Journal for Albion Radar
+
+Compact binary journal of decoded events, so radar sessions can be recorded
+and replayed without keeping the raw capture or running the parser again.
+
+File layout::
+
+    header  : MAGIC (4 bytes) + base timestamp (float64, little endian)
+    record  : varint length + body
+    body    : varint kind + varint timestamp delta (ms) + packed parameters
+    segment : varint 0 + absolute timestamp (float64, little endian)
+
+`kind` packs the zigzag-encoded event code and the message type as
+``(zigzag(code) << 2) | type``. Parameters are written with a one byte tag
+per value followed by a varint, float64 or length-prefixed payload.
+
+Reopening an existing journal cuts off a trailing partial record and starts
+a new segment, whose absolute timestamp the following deltas build on.
+"""
+
+import mmap
+import os
+import struct
+import time
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+
+MAGIC = b'ARJ2'
+
+MESSAGE_TYPES = ('event', 'request', 'response')
+
+# Value tags
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_STR = 5
+TAG_BYTES = 6
+TAG_LIST = 7
+TAG_DICT = 8
+
+_DOUBLE = struct.Struct('<d')
+
+
+class JournalError(Exception):
+    """Raised when a journal file is malformed"""
+
+
+def encode_varint(value: int, out: bytearray) -> None:
+    """Append an unsigned LEB128 varint"""
+    if value < 0:
+        raise ValueError(f"Varints are unsigned, got {value}; zigzag encode signed values")
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """Read an unsigned varint, returning (value, new offset)"""
+    result = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise JournalError("Truncated varint")
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, offset
+        shift += 7
+
+
+def zigzag(value: int) -> int:
+    """Map a signed integer to an unsigned one, keeping small negatives small"""
+    return (value << 1) if value >= 0 else ((-value << 1) - 1)
+
+
+def unzigzag(raw: int) -> int:
+    """Inverse of zigzag()"""
+    return (raw >> 1) if not raw & 1 else -((raw + 1) >> 1)
+
+
+def encode_value(value: Any, out: bytearray) -> None:
+    """Append a tagged parameter value"""
+    if value is None:
+        out.append(TAG_NONE)
+    elif value is True:
+        out.append(TAG_TRUE)
+    elif value is False:
+        out.append(TAG_FALSE)
+    elif isinstance(value, int):
+        out.append(TAG_INT)
+        encode_varint(zigzag(value), out)
+    elif isinstance(value, float):
+        out.append(TAG_FLOAT)
+        out += _DOUBLE.pack(value)
+    elif isinstance(value, str):
+        raw = value.encode('utf-8')
+        out.append(TAG_STR)
+        encode_varint(len(raw), out)
+        out += raw
+    elif isinstance(value, (bytes, bytearray)):
+        out.append(TAG_BYTES)
+        encode_varint(len(value), out)
+        out += value
+    elif isinstance(value, (list, tuple)):
+        out.append(TAG_LIST)
+        encode_varint(len(value), out)
+        for item in value:
+            encode_value(item, out)
+    elif isinstance(value, dict):
+        out.append(TAG_DICT)
+        encode_varint(len(value), out)
+        for key, item in value.items():
+            encode_value(key, out)
+            encode_value(item, out)
+    else:
+        raise TypeError(f"Cannot journal value of type {type(value).__name__}")
+
+
+def decode_value(data: bytes, offset: int) -> Tuple[Any, int]:
+    """Read a tagged parameter value, returning (value, new offset)"""
+    if offset >= len(data):
+        raise JournalError("Truncated value")
+    tag = data[offset]
+    offset += 1
+
+    if tag == TAG_NONE:
+        return None, offset
+    if tag == TAG_TRUE:
+        return True, offset
+    if tag == TAG_FALSE:
+        return False, offset
+    if tag == TAG_INT:
+        raw, offset = decode_varint(data, offset)
+        return unzigzag(raw), offset
+    if tag == TAG_FLOAT:
+        return _DOUBLE.unpack_from(data, offset)[0], offset + _DOUBLE.size
+    if tag in (TAG_STR, TAG_BYTES):
+        length, offset = decode_varint(data, offset)
+        raw = bytes(data[offset:offset + length])
+        return (raw.decode('utf-8') if tag == TAG_STR else raw), offset + length
+    if tag == TAG_LIST:
+        count, offset = decode_varint(data, offset)
+        items = []
+        for _ in range(count):
+            item, offset = decode_value(data, offset)
+            items.append(item)
+        return items, offset
+    if tag == TAG_DICT:
+        count, offset = decode_varint(data, offset)
+        mapping = {}
+        for _ in range(count):
+            key, offset = decode_value(data, offset)
+            mapping[key], offset = decode_value(data, offset)
+        return mapping, offset
+
+    raise JournalError(f"Unknown value tag {tag}")
+
+
+class EventJournalWriter:
+    """
+    Appends decoded events to a journal file.
+
+    Writes go through a buffered file; the file is fsynced every
+    `fsync_interval` seconds and rotated to ``path.1`` ... ``path.N`` once it
+    grows past `max_bytes`.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 64 * 1024 * 1024, backups: int = 5,
+                 fsync_interval: float = 5.0, buffer_size: int = 64 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.fsync_interval = fsync_interval
+        self.buffer_size = buffer_size
+
+        self._file: Optional[BinaryIO] = None
+        self._size = 0
+        self._last_timestamp: Optional[float] = None
+        self._last_fsync = time.monotonic()
+        self._record = bytearray()
+        self._open()
+
+    def append(self, packet_data: Dict, timestamp: float) -> None:
+        """Append one decoded packet (as passed to DataManager.process_packet_data)"""
+        message_type = packet_data.get('type')
+        type_index = MESSAGE_TYPES.index(message_type) if message_type in MESSAGE_TYPES else 3
+        code = packet_data.get('code', 0) or 0
+
+        if self._last_timestamp is None:
+            # The first record's timestamp becomes the base: in the header of
+            # a new file, in a segment record when appending to an existing one
+            self._last_timestamp = timestamp
+            start = MAGIC if self._size == 0 else b'\x00'
+            self._file.write(start + _DOUBLE.pack(timestamp))
+            self._size += len(start) + _DOUBLE.size
+
+        body = self._record
+        body.clear()
+        encode_varint((zigzag(code) << 2) | type_index, body)
+        delta_ms = max(0, int(round((timestamp - self._last_timestamp) * 1000)))
+        encode_varint(delta_ms, body)
+        encode_value(packet_data.get('parameters', {}), body)
+        # Keep deltas anchored to what the reader will reconstruct
+        self._last_timestamp += delta_ms / 1000
+
+        header = bytearray()
+        encode_varint(len(body), header)
+        self._file.write(header)
+        self._file.write(body)
+        self._size += len(header) + len(body)
+
+        if self._size >= self.max_bytes:
+            self._rotate()
+        elif time.monotonic() - self._last_fsync >= self.fsync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        """Flush buffers and fsync the journal to disk"""
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_fsync = time.monotonic()
+
+    def close(self) -> None:
+        """Flush and close the journal"""
+        if self._file is None:
+            return
+        self.sync()
+        self._file.close()
+        self._file = None
+
+    def _open(self) -> None:
+        """Open the journal file; the first append writes a header or a segment start"""
+        self._last_timestamp = None
+        end = complete_length(self.path) if os.path.exists(self.path) else 0
+        if end and os.path.getsize(self.path) > end:
+            # Drop the partial record of an interrupted write, or every
+            # record appended after it would be misread
+            os.truncate(self.path, end)
+        elif not end and os.path.exists(self.path):
+            os.truncate(self.path, 0)
+        self._file = open(self.path, 'ab', buffering=self.buffer_size)
+        self._size = self._file.tell()
+
+    def _rotate(self) -> None:
+        """Shift path -> path.1 -> ... -> path.N and start a fresh file"""
+        self.close()
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._open()
+
+    def __enter__(self) -> 'EventJournalWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_journal(path: str) -> Iterator[Tuple[float, Dict]]:
+    """Yield (timestamp, packet_data) for every record in a journal file"""
+    with open(path, 'rb') as journal:
+        data = journal.read()
+
+    if len(data) < len(MAGIC) + _DOUBLE.size and MAGIC.startswith(data[:len(MAGIC)]):
+        # Freshly rotated or interrupted before the header was complete
+        return
+    if data[:len(MAGIC)] != MAGIC:
+        raise JournalError(f"{path} is not an event journal")
+
+    offset = len(MAGIC)
+    timestamp = _DOUBLE.unpack_from(data, offset)[0]
+    offset += _DOUBLE.size
+
+    while offset < len(data):
+        try:
+            length, offset = decode_varint(data, offset)
+        except JournalError:
+            return
+        if length == 0:
+            # Segment start: later deltas build on its absolute timestamp
+            if offset + _DOUBLE.size > len(data):
+                return
+            timestamp = _DOUBLE.unpack_from(data, offset)[0]
+            offset += _DOUBLE.size
+            continue
+        end = offset + length
+        if end > len(data):
+            # Partial record from an interrupted write
+            return
+
+        kind, cursor = decode_varint(data, offset)
+        delta_ms, cursor = decode_varint(data, cursor)
+        parameters, _ = decode_value(data, cursor)
+        offset = end
+
+        timestamp += delta_ms / 1000
+        type_index = kind & 0x3
+        yield timestamp, {
+            'type': MESSAGE_TYPES[type_index] if type_index < len(MESSAGE_TYPES) else None,
+            'code': unzigzag(kind >> 2),
+            'parameters': parameters
+        }
+
+
+def journal_files(path: str) -> List[str]:
+    """List a journal and its rotated backups, oldest first"""
+    files = []
+    index = 1
+    while os.path.exists(f"{path}.{index}"):
+        files.append(f"{path}.{index}")
+        index += 1
+    files.reverse()
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def complete_length(path: str) -> int:
+    """
+    Get the length of a journal file up to the end of its last complete record.
+
+    Only the record lengths are read, the records themselves are skipped.
+    Returns 0 for a file without a valid header.
+    """
+    header_size = len(MAGIC) + _DOUBLE.size
+    if os.path.getsize(path) < header_size:
+        return 0
+    with open(path, 'rb') as journal:
+        with mmap.mmap(journal.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(MAGIC)] != MAGIC:
+                raise JournalError(f"{path} is not an event journal")
+            offset = end = header_size
+            size = len(data)
+            while offset < size:
+                try:
+                    length, offset = decode_varint(data, offset)
+                except JournalError:
+                    break
+                offset += length if length else _DOUBLE.size
+                if offset > size:
+                    break
+                end = offset
+    return end
@@ -0,0 +1,77 @@
+"""
+Frame Clock for Albion Radar
+
+Radar-wide clock sampled once per packet batch or tick. Entity timestamps,
+TTLs and motion tracking read the cached frame time instead of calling
+time.time() for every attribute write. Frame time is monotonic, so wall
+clock adjustments cannot make entities expire early or jump; a wall clock
+anchor converts it for display. Outside a frame (nothing ticking, e.g.
+handlers used without a DataManager) the clock reads its source directly.
+"""
+
+import time
+from typing import Callable, Optional
+
+
+class FrameClock:
+    """
+    Monotonic clock with a cached per-frame reading.
+
+    tick() opens a frame and fixes `now` until end_frame(); outside a frame
+    `now` samples the source on every read. wall() converts frame times to
+    Unix time using the offset between the two clocks measured when the
+    source was set.
+    """
+
+    def __init__(self, source: Callable[[], float] = time.monotonic,
+                 wall_source: Callable[[], float] = time.time):
+        self._frame: Optional[float] = None
+        self._wall_offset = 0.0
+        self.set_source(source, wall_source)
+
+    @property
+    def now(self) -> float:
+        """Time of the current frame, or of the source when no frame is open"""
+        frame = self._frame
+        return frame if frame is not None else self._source()
+
+    def set_source(self, source: Callable[[], float],
+                   wall_source: Optional[Callable[[], float]] = None) -> None:
+        """
+        Drive the clock from another time source (e.g. recorded timestamps).
+
+        Without a wall source the source is assumed to already be Unix time.
+        """
+        self._source = source
+        self._frame = None
+        self._wall_offset = wall_source() - source() if wall_source is not None else 0.0
+
+    def reset(self) -> None:
+        """Go back to the monotonic system clock"""
+        self.set_source(time.monotonic, time.time)
+
+    def tick(self) -> float:
+        """Sample the source and make it the current frame time until end_frame()"""
+        self._frame = self._source()
+        return self._frame
+
+    def end_frame(self) -> None:
+        """Close the current frame; `now` follows the source again"""
+        self._frame = None
+
+    def sample(self) -> float:
+        """Read the source without advancing the frame (for render-time math)"""
+        return self._source()
+
+    def wall(self, frame_time: Optional[float] = None) -> float:
+        """Convert a frame time (default: the current frame) to Unix time"""
+        return (self.now if frame_time is None else frame_time) + self._wall_offset
+
+
+# Shared by models, handlers and the DataManager
+FRAME_CLOCK = FrameClock()
+
+
+def frame_time() -> float:
+    """Get the current frame time, or the source time outside a frame (usable as a dataclass default_factory)"""
+    return FRAME_CLOCK.now
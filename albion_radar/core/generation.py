@@ -0,0 +1,54 @@
+"""
+Zone Generations for Albion Radar
+
+Makes zone changes O(1): handlers swap in empty storage, the zone generation
+counter is bumped, and the old map's entities are released a little at a time.
+"""
+
+from collections import deque
+from typing import Deque, Iterable, Union
+
+
+Container = Union[dict, list]
+
+
+class GenerationReclaimer:
+    """
+    Releases containers retired on zone change in bounded chunks.
+
+    Dropping a container with thousands of entities in one go frees them all
+    at once, which shows up as a hitch right when the new zone loads. Retired
+    containers are emptied incrementally instead, `budget` entries per call.
+    """
+
+    def __init__(self, budget: int = 2000):
+        self.budget = budget
+        self._pending: Deque[Container] = deque()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def retire(self, containers: Iterable[Container]) -> None:
+        """Queue containers for deferred release"""
+        self._pending.extend(c for c in containers if c)
+
+    def reclaim(self, budget: int = 0) -> int:
+        """Release up to `budget` entries and return how many were released"""
+        budget = budget or self.budget
+        released = 0
+
+        while self._pending and released < budget:
+            container = self._pending[0]
+            if isinstance(container, dict):
+                while container and released < budget:
+                    container.popitem()
+                    released += 1
+            else:
+                count = min(len(container), budget - released)
+                del container[len(container) - count:]
+                released += count
+
+            if not container:
+                self._pending.popleft()
+
+        return released
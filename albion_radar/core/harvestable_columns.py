@@ -0,0 +1,235 @@
+"""
+Harvestable Columns for Albion Radar
+
+Struct-of-arrays storage for harvestable resources. Each field lives in its
+own typed array, so a resource costs a few dozen bytes of column data instead
+of a dataclass instance, and settings filters run over whole columns at once.
+Experimental: only used by HarvestablesHandler(columnar=True).
+"""
+
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+# (field name, array typecode); `charges` holds the enchantment level
+COLUMNS = (
+    ('id', 'q'),
+    ('type', 'B'),
+    ('tier', 'B'),
+    ('charges', 'B'),
+    ('size', 'i'),
+    ('pos_x', 'f'),
+    ('pos_y', 'f'),
+    ('h_x', 'f'),
+    ('h_y', 'f'),
+    ('living', 'B')
+)
+
+# Shape of the visibility table used by visible_mask: [type 0-27][tier 1-8][enchant 0-4]
+TYPE_COUNT = 28
+TIER_COUNT = 8
+ENCHANT_COUNT = 5
+TABLE_SIZE = TYPE_COUNT * TIER_COUNT * ENCHANT_COUNT
+
+
+def table_index(resource_type: int, tier: int, enchant: int) -> int:
+    """Index of a (type, tier, enchant) combination in a visibility table"""
+    return (resource_type * TIER_COUNT + (tier - 1)) * ENCHANT_COUNT + enchant
+
+
+def fits_columns(resource_type: int, tier: int, charges: int) -> bool:
+    """Whether the byte-wide type, tier and charges columns can hold these values"""
+    return 0 <= resource_type <= 255 and 0 <= tier <= 255 and 0 <= charges <= 255
+
+
+class HarvestableRow:
+    """
+    Live view of one resource in a HarvestableColumns store.
+
+    Only valid while the resource is stored: after removal reads raise
+    KeyError, and if the id is reused they show the new resource. Never hand
+    rows to code outside the handler; detach() them instead.
+    """
+
+    __slots__ = ('_store', 'id')
+
+    def __init__(self, store: 'HarvestableColumns', resource_id: int):
+        self._store = store
+        self.id = resource_id
+
+    def set_charges(self, charges: int) -> None:
+        """Update resource charges"""
+        self.charges = charges
+
+    def detach(self) -> Any:
+        """Copy the row into a standalone entity"""
+        return self._store.materialize(self.id)
+
+    def __copy__(self) -> Any:
+        # Snapshots must not follow later writes to the columns
+        return self.detach()
+
+    def __repr__(self) -> str:
+        return f"HarvestableRow({self.detach()!r})"
+
+
+def _column_property(name: str) -> property:
+    """Property reading and writing one column of the row's resource"""
+
+    def getter(row: HarvestableRow) -> Any:
+        store = row._store
+        return getattr(store, '_' + name)[store._rows[row.id]]
+
+    def setter(row: HarvestableRow, value: Any) -> None:
+        store = row._store
+        getattr(store, '_' + name)[store._rows[row.id]] = value
+
+    return property(getter, setter, doc=f"Resource {name}")
+
+
+for _name, _ in COLUMNS[1:]:
+    setattr(HarvestableRow, _name, _column_property(_name))
+
+
+class HarvestableColumns:
+    """
+    Parallel typed arrays of resource fields, keyed by resource id.
+
+    Supports the subset of the dict interface the handler uses. Lookups
+    return live HarvestableRow views; pop() and copies return standalone
+    entities built with `entity_factory`. Rows are kept dense by moving the
+    last row into the slot of a removed one, while iteration follows
+    insertion order like a dict.
+    """
+
+    def __init__(self, entity_factory: Callable[..., Any]):
+        self.entity_factory = entity_factory
+        self._rows: Dict[int, int] = {}
+        self._columns: List[array] = []
+        self._reset_columns()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, resource_id: int) -> bool:
+        return resource_id in self._rows
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._rows)
+
+    def __getitem__(self, resource_id: int) -> HarvestableRow:
+        if resource_id not in self._rows:
+            raise KeyError(resource_id)
+        return HarvestableRow(self, resource_id)
+
+    def __setitem__(self, resource_id: int, entity: Any) -> None:
+        row = self._rows.get(resource_id)
+        columns = self._columns
+        if row is None:
+            self._rows[resource_id] = len(self._id)
+            self._id.append(resource_id)
+            for index in range(1, len(COLUMNS)):
+                columns[index].append(getattr(entity, COLUMNS[index][0]))
+        else:
+            for index in range(1, len(COLUMNS)):
+                columns[index][row] = getattr(entity, COLUMNS[index][0])
+
+    def __delitem__(self, resource_id: int) -> None:
+        row = self._rows.pop(resource_id)
+        last = len(self._id) - 1
+        if row != last:
+            self._rows[self._id[last]] = row
+            for column in self._columns:
+                column[row] = column.pop()
+        else:
+            for column in self._columns:
+                column.pop()
+
+    def get(self, resource_id: int, default: Any = None) -> Any:
+        """Get a live view of a resource"""
+        if resource_id not in self._rows:
+            return default
+        return HarvestableRow(self, resource_id)
+
+    def pop(self, resource_id: int, default: Any = None) -> Any:
+        """Remove a resource and return it as a standalone entity"""
+        if resource_id not in self._rows:
+            return default
+        entity = self.materialize(resource_id)
+        del self[resource_id]
+        return entity
+
+    def values(self) -> Iterator[HarvestableRow]:
+        """Live views of every resource in insertion order"""
+        return (HarvestableRow(self, resource_id) for resource_id in self._rows)
+
+    def clear(self) -> None:
+        """Remove all resources"""
+        self._rows = {}
+        self._reset_columns()
+
+    def materialize(self, resource_id: int) -> Any:
+        """Build a standalone entity from a resource's columns"""
+        row = self._rows[resource_id]
+        return self.entity_factory(**{
+            name: column[row] for (name, _), column in zip(COLUMNS, self._columns)
+        })
+
+    def visible_mask(self, table: Sequence[int], outside: bool = False,
+                     living_table: Optional[Sequence[int]] = None) -> List[bool]:
+        """
+        Evaluate a visibility table for every row at once.
+
+        `table` is a flat sequence of TABLE_SIZE flags indexed with
+        table_index(); combinations outside the table get `outside`. Rows
+        marked living use `living_table` instead, when given.
+        """
+        if not self._id:
+            return []
+        if living_table is None:
+            living_table = table
+
+        if NUMPY_AVAILABLE:
+            types = np.frombuffer(self._type, dtype=np.uint8).astype(np.intp)
+            tiers = np.frombuffer(self._tier, dtype=np.uint8).astype(np.intp)
+            enchants = np.frombuffer(self._charges, dtype=np.uint8).astype(np.intp)
+            valid = (types < TYPE_COUNT) & (tiers >= 1) & (tiers <= TIER_COUNT) & (enchants < ENCHANT_COUNT)
+            indices = ((types * TIER_COUNT + (tiers - 1)) * ENCHANT_COUNT + enchants)[valid]
+            # Living rows index the second half of the two tables laid end to end
+            indices += np.frombuffer(self._living, dtype=np.uint8)[valid].astype(np.intp) * TABLE_SIZE
+            flags = np.frombuffer(bytes(bytearray(table)) + bytes(bytearray(living_table)), dtype=np.uint8)
+            mask = np.full(len(types), outside, dtype=bool)
+            mask[valid] = flags[indices] != 0
+            return mask.tolist()
+
+        mask = []
+        for resource_type, tier, enchant, living in zip(self._type, self._tier, self._charges, self._living):
+            if resource_type < TYPE_COUNT and 1 <= tier <= TIER_COUNT and enchant < ENCHANT_COUNT:
+                flags = living_table if living else table
+                mask.append(bool(flags[(resource_type * TIER_COUNT + (tier - 1)) * ENCHANT_COUNT + enchant]))
+            else:
+                mask.append(outside)
+        return mask
+
+    def hidden_ids(self, table: Sequence[int], outside: bool = False,
+                   living_table: Optional[Sequence[int]] = None) -> List[int]:
+        """Ids of the resources the visibility tables hide"""
+        mask = self.visible_mask(table, outside, living_table)
+        return [resource_id for resource_id, visible in zip(self._id, mask) if not visible]
+
+    def nbytes(self) -> int:
+        """Bytes used by the column data"""
+        return sum(column.itemsize * len(column) for column in self._columns)
+
+    def _reset_columns(self) -> None:
+        """Start every column empty; `_<field>` names alias the same arrays"""
+        self._columns = [array(typecode) for _, typecode in COLUMNS]
+        for (name, _), column in zip(COLUMNS, self._columns):
+            setattr(self, '_' + name, column)
@@ -0,0 +1,162 @@
+"""
+Ignore List for Albion Radar
+
+Keeps the ignored player and guild names in memory so player ingestion and
+the web interface can check them without touching ignore_list.json.
+"""
+
+import json
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+
+IGNORE_LIST_FILE = 'ignore_list.json'
+
+# Ignore list sections, as stored in the JSON file
+KINDS = ('players', 'guilds')
+
+
+def ignore_key(name: str) -> str:
+    """Normalize a name for lookup (surrounding spaces are dropped; case matters, as in the drawing code)"""
+    return name.strip()
+
+
+@dataclass(frozen=True)
+class IgnoreListState:
+    """Immutable ignore list contents; every update publishes a new one"""
+    version: int = 0
+    players: Tuple[str, ...] = ()
+    guilds: Tuple[str, ...] = ()
+    player_keys: FrozenSet[str] = frozenset()
+    guild_keys: FrozenSet[str] = frozenset()
+
+    def names(self, kind: str) -> Tuple[str, ...]:
+        """Get the names of one section in insertion order"""
+        if kind not in KINDS:
+            raise ValueError(f"Unknown ignore list type: {kind}")
+        return self.players if kind == 'players' else self.guilds
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """Convert to the ignore_list.json layout"""
+        return {'players': list(self.players), 'guilds': list(self.guilds)}
+
+
+class IgnoreList:
+    """
+    In-memory ignore list with copy-on-write updates.
+
+    Readers take `state` once and use it without locking; writers build a new
+    IgnoreListState under a lock, persist it atomically and only then swap
+    it in, so a failed save leaves the list unchanged. The file is only read
+    at construction (or on an explicit load()).
+    """
+
+    def __init__(self, path: Optional[str] = IGNORE_LIST_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self.state = IgnoreListState()
+        if path is not None:
+            self.load()
+
+    @property
+    def version(self) -> int:
+        return self.state.version
+
+    def is_ignored(self, nickname: str, guild_name: str = "") -> bool:
+        """Check whether a player or their guild is ignored"""
+        state = self.state
+        if nickname and ignore_key(nickname) in state.player_keys:
+            return True
+        return bool(guild_name) and ignore_key(guild_name) in state.guild_keys
+
+    def add(self, kind: str, name: str) -> bool:
+        """Add a name to a section, returning False if it could not be saved"""
+        with self._lock:
+            names = self.state.names(kind)
+            name = name.strip()
+            if not name or ignore_key(name) in {ignore_key(existing) for existing in names}:
+                return True
+            return self._publish(kind, names + (name,))
+
+    def remove(self, kind: str, name: str) -> bool:
+        """Remove a name from a section, returning False if it could not be saved"""
+        with self._lock:
+            names = self.state.names(kind)
+            key = ignore_key(name)
+            kept = tuple(existing for existing in names if ignore_key(existing) != key)
+            if len(kept) == len(names):
+                return True
+            return self._publish(kind, kept)
+
+    def remove_at(self, kind: str, index: int) -> bool:
+        """Remove the name at a position of a section as listed by to_dict(), returning False if it could not be saved"""
+        with self._lock:
+            names = self.state.names(kind)
+            if not 0 <= index < len(names):
+                return True
+            return self._publish(kind, names[:index] + names[index + 1:])
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """Get the ignore list in the ignore_list.json layout"""
+        return self.state.to_dict()
+
+    def load(self) -> bool:
+        """Replace the in-memory list with the contents of the file"""
+        if self.path is None or not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error loading ignore list: {e}")
+            return False
+
+        with self._lock:
+            self.state = self._build(
+                self.state.version + 1,
+                tuple(str(name) for name in data.get('players', [])),
+                tuple(str(name) for name in data.get('guilds', []))
+            )
+        return True
+
+    def save(self, state: Optional[IgnoreListState] = None) -> bool:
+        """Write a state (default: the current one) to the file atomically"""
+        if self.path is None:
+            return True
+        if state is None:
+            state = self.state
+        temp_path = self.path + '.tmp'
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump(state.to_dict(), f, indent=2)
+            os.replace(temp_path, self.path)
+            return True
+        except OSError as e:
+            print(f"Error saving ignore list: {e}")
+            return False
+
+    def _publish(self, kind: str, names: Tuple[str, ...]) -> bool:
+        """Persist a state with one section replaced and swap it in once saved (lock held)"""
+        state = self.state
+        players = names if kind == 'players' else state.players
+        guilds = names if kind == 'guilds' else state.guilds
+        new_state = self._build(state.version + 1, players, guilds)
+        # Readers only ever see states that made it to disk
+        if not self.save(new_state):
+            return False
+        self.state = new_state
+        return True
+
+    @staticmethod
+    def _build(version: int, players: Tuple[str, ...], guilds: Tuple[str, ...]) -> IgnoreListState:
+        """Build a state with interned lookup keys"""
+        return IgnoreListState(
+            version=version,
+            players=players,
+            guilds=guilds,
+            player_keys=frozenset(sys.intern(ignore_key(name)) for name in players),
+            guild_keys=frozenset(sys.intern(ignore_key(name)) for name in guilds)
+        )
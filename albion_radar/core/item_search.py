@@ -0,0 +1,179 @@
+"""
+Item Search for Albion Radar
+
+Search index over item unique and display names, used by the items page to
+look items up by prefix or substring without scanning every name.
+"""
+
+import re
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Longest n-gram indexed; substring queries up to this length are answered
+# straight from the postings, longer ones are verified against the names
+MAX_GRAM = 3
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+SEARCH_MODES = ('prefix', 'substring')
+
+_TIER = re.compile(r'^T(\d)_')
+_ENCHANT = re.compile(r'@(\d)$')
+
+
+class ItemSearchIndex:
+    """
+    Prefix and substring index over item names.
+
+    Prefix search bisects a sorted list of lowercase unique and display names.
+    Substring search picks the shortest posting list among the query's
+    n-grams (n <= MAX_GRAM) and checks only those candidates. Rows are item
+    table order, so substring results come back ordered by item id.
+    """
+
+    def __init__(self, items: Iterable[Tuple[int, str, str]]):
+        self._ids = array('I')
+        self._names: List[str] = []
+        self._display_names: List[str] = []
+        self._texts: List[str] = []
+        self._tiers = bytearray()
+        self._enchants = bytearray()
+        self._postings: Dict[str, array] = {}
+
+        prefix_keys: List[Tuple[str, int]] = []
+        for row, (item_id, name, display_name) in enumerate(sorted(items)):
+            self._ids.append(item_id)
+            self._names.append(name)
+            self._display_names.append(display_name)
+            tier = _TIER.match(name)
+            enchant = _ENCHANT.search(name)
+            self._tiers.append(int(tier.group(1)) if tier else 0)
+            self._enchants.append(int(enchant.group(1)) if enchant else 0)
+
+            # Names are joined with a separator no query can contain, so no
+            # match spans both names
+            text = f"{name}\n{display_name}".lower()
+            self._texts.append(text)
+            self._index_grams(row, text)
+
+            prefix_keys.append((name.lower(), row))
+            if display_name:
+                prefix_keys.append((display_name.lower(), row))
+
+        prefix_keys.sort()
+        self._prefix_keys = [key for key, _ in prefix_keys]
+        self._prefix_rows = array('I', (row for _, row in prefix_keys))
+
+    @classmethod
+    def from_items_info(cls, items_info) -> 'ItemSearchIndex':
+        """Build an index over every item known to an ItemsInfo"""
+        return cls(items_info.iter_items())
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def search(self, query: str, mode: str = 'substring', tiers: Optional[Sequence[int]] = None,
+               offset: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> Dict:
+        """
+        Find items whose unique or display name matches `query`.
+
+        `mode` is 'prefix' or 'substring'; `tiers` restricts results to the
+        given tiers. Returns the total match count and one page of results.
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode: {mode}")
+        query = query.strip().lower()
+        offset = max(0, offset)
+        limit = max(0, min(limit, MAX_PAGE_SIZE))
+        tier_filter = bytearray(10)
+        for tier in tiers or range(10):
+            if 0 <= tier < 10:
+                tier_filter[tier] = 1
+
+        if not query:
+            rows: Iterable[int] = range(len(self._ids))
+        elif mode == 'prefix':
+            rows = self._prefix_rows_for(query)
+        else:
+            rows = self._substring_rows_for(query)
+
+        end = offset + limit
+        if tiers is None and isinstance(rows, (array, range)):
+            # Unfiltered postings are already the full result, in order
+            return self._page(query, mode, len(rows), offset, limit, rows[offset:end])
+
+        total = 0
+        page: List[int] = []
+        item_tiers = self._tiers
+        for row in rows:
+            if not tier_filter[item_tiers[row]]:
+                continue
+            if offset <= total < end:
+                page.append(row)
+            total += 1
+
+        return self._page(query, mode, total, offset, limit, page)
+
+    def _index_grams(self, row: int, text: str) -> None:
+        """Add a row to the postings of every distinct n-gram of its text"""
+        grams = {text[start:start + size]
+                 for size in range(1, MAX_GRAM + 1)
+                 for start in range(len(text) - size + 1)}
+
+        postings = self._postings
+        for gram in grams:
+            if '\n' in gram:
+                continue
+            posting = postings.get(gram)
+            if posting is None:
+                postings[gram] = posting = array('I')
+            posting.append(row)
+
+    def _prefix_rows_for(self, query: str) -> array:
+        """Rows with a name starting with the query, in name order, each once"""
+        keys = self._prefix_keys
+        start = bisect_left(keys, query)
+        stop = bisect_left(keys, query + '\uffff', start)
+        # An item whose unique and display names both match appears twice
+        return array('I', dict.fromkeys(self._prefix_rows[start:stop]))
+
+    def _substring_rows_for(self, query: str) -> Iterable[int]:
+        """Rows with a name containing the query, in row order"""
+        if len(query) <= MAX_GRAM:
+            return self._postings.get(query, ())
+
+        candidates = None
+        for start in range(len(query) - MAX_GRAM + 1):
+            posting = self._postings.get(query[start:start + MAX_GRAM])
+            if posting is None:
+                return ()
+            if candidates is None or len(posting) < len(candidates):
+                candidates = posting
+
+        texts = self._texts
+        return (row for row in candidates if query in texts[row])
+
+    def _page(self, query: str, mode: str, total: int, offset: int, limit: int,
+              rows: Iterable[int]) -> Dict:
+        """Build the search response for one page of rows"""
+        return {
+            'query': query,
+            'mode': mode,
+            'total': total,
+            'offset': offset,
+            'limit': limit,
+            'items': [self._result(row) for row in rows]
+        }
+
+    def _result(self, row: int) -> Dict:
+        """Build the result entry for a row"""
+        return {
+            'id': self._ids[row],
+            'name': self._names[row],
+            'display_name': self._display_names[row],
+            'tier': self._tiers[row],
+            'enchant': self._enchants[row]
+        }
@@ -0,0 +1,172 @@
+"""
+Motion Tracker for Albion Radar
+
+Dead reckoning for moving entities: velocities are estimated from consecutive
+position updates and positions are extrapolated at render time, so the
+display can run at a higher frame rate than positions are received or sent.
+"""
+
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .frame_clock import FRAME_CLOCK
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+# Positions are never extrapolated further than this past their last update
+MAX_EXTRAPOLATION = 0.5
+
+# Updates closer together than this keep the previous velocity estimate
+MIN_UPDATE_INTERVAL = 0.01
+
+# Updates further apart than this say nothing about the current velocity
+STALE_INTERVAL = 2.0
+
+# Faster apparent movement is a teleport (mount skills, zone edges, missed
+# updates), which resets the velocity instead of flinging the entity along
+MAX_SPEED = 30.0
+
+# Key the local player is tracked under in the players' tracker
+LOCAL_PLAYER_KEY = 0
+
+
+class MotionFrame:
+    """
+    Columnar positions, velocities and update times of tracked entities.
+
+    Columns are array('d'). extrapolate() works on zero-copy numpy views of
+    them when numpy is installed and falls back to a Python loop otherwise.
+    Frames returned by MotionTracker.freeze() are private copies and safe to
+    read from other threads.
+    """
+
+    def __init__(self, max_extrapolation: float = MAX_EXTRAPOLATION,
+                 clock: Callable[[], float] = FRAME_CLOCK.sample):
+        self.max_extrapolation = max_extrapolation
+        self.clock = clock
+        self._ids: List[int] = []
+        self._xs = array('d')
+        self._ys = array('d')
+        self._vxs = array('d')
+        self._vys = array('d')
+        self._times = array('d')
+        self._rows: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, entity_id: int) -> bool:
+        return entity_id in self._rows
+
+    def velocity_of(self, entity_id: int) -> Optional[Tuple[float, float]]:
+        """Estimated velocity of an entity in units per second"""
+        row = self._rows.get(entity_id)
+        if row is None:
+            return None
+        return self._vxs[row], self._vys[row]
+
+    def position_of(self, entity_id: int, timestamp: Optional[float] = None) -> Optional[Tuple[float, float]]:
+        """Extrapolated position of one entity"""
+        row = self._rows.get(entity_id)
+        if row is None:
+            return None
+        now = self.clock() if timestamp is None else timestamp
+        elapsed = min(max(now - self._times[row], 0.0), self.max_extrapolation)
+        return self._xs[row] + self._vxs[row] * elapsed, self._ys[row] + self._vys[row] * elapsed
+
+    def extrapolate(self, timestamp: Optional[float] = None) -> Tuple[List[int], List[float], List[float]]:
+        """Extrapolated (ids, xs, ys) of every tracked entity"""
+        now = self.clock() if timestamp is None else timestamp
+        limit = self.max_extrapolation
+        if not self._ids:
+            return [], [], []
+
+        if NUMPY_AVAILABLE:
+            elapsed = np.clip(now - np.frombuffer(self._times), 0.0, limit)
+            xs = np.frombuffer(self._xs) + np.frombuffer(self._vxs) * elapsed
+            ys = np.frombuffer(self._ys) + np.frombuffer(self._vys) * elapsed
+            return list(self._ids), xs.tolist(), ys.tolist()
+
+        xs = []
+        ys = []
+        for x, y, vx, vy, updated in zip(self._xs, self._ys, self._vxs, self._vys, self._times):
+            elapsed = min(max(now - updated, 0.0), limit)
+            xs.append(x + vx * elapsed)
+            ys.append(y + vy * elapsed)
+        return list(self._ids), xs, ys
+
+    def states(self) -> List[Tuple[int, float, float, float, float, float]]:
+        """(id, x, y, vx, vy, timestamp) of every entity, for clients that extrapolate themselves"""
+        return list(zip(self._ids, self._xs, self._ys, self._vxs, self._vys, self._times))
+
+
+class MotionTracker(MotionFrame):
+    """
+    Dead reckoning store fed with position updates.
+
+    Rows are kept dense by moving the last row into a removed slot, so the
+    columns stay contiguous for extrapolate().
+    """
+
+    def observe(self, entity_id: int, x: float, y: float, timestamp: Optional[float] = None) -> None:
+        """Record a position update, re-estimating the entity's velocity"""
+        now = self.clock() if timestamp is None else timestamp
+        row = self._rows.get(entity_id)
+        if row is None:
+            self._rows[entity_id] = len(self._ids)
+            self._ids.append(entity_id)
+            for column, value in ((self._xs, x), (self._ys, y), (self._vxs, 0.0),
+                                  (self._vys, 0.0), (self._times, now)):
+                column.append(value)
+            return
+
+        elapsed = now - self._times[row]
+        if elapsed >= MIN_UPDATE_INTERVAL:
+            vx = (x - self._xs[row]) / elapsed
+            vy = (y - self._ys[row]) / elapsed
+            if elapsed > STALE_INTERVAL or vx * vx + vy * vy > MAX_SPEED * MAX_SPEED:
+                vx = vy = 0.0
+            self._vxs[row] = vx
+            self._vys[row] = vy
+        # Extrapolation runs from the time of the position it starts at
+        self._xs[row] = x
+        self._ys[row] = y
+        self._times[row] = now
+
+    def remove(self, entity_id: int) -> None:
+        """Stop tracking an entity, moving the last row into its slot"""
+        row = self._rows.pop(entity_id, None)
+        if row is None:
+            return
+        last_id = self._ids.pop()
+        columns = (self._xs, self._ys, self._vxs, self._vys, self._times)
+        if row < len(self._ids):
+            self._ids[row] = last_id
+            self._rows[last_id] = row
+            for column in columns:
+                column[row] = column.pop()
+        else:
+            for column in columns:
+                column.pop()
+
+    def clear(self) -> None:
+        """Stop tracking every entity"""
+        self._ids = []
+        self._rows = {}
+        for name in ('_xs', '_ys', '_vxs', '_vys', '_times'):
+            setattr(self, name, array('d'))
+
+    def freeze(self) -> MotionFrame:
+        """Copy the current state into a frame other threads can read"""
+        frame = MotionFrame(self.max_extrapolation, self.clock)
+        frame._ids = list(self._ids)
+        frame._rows = dict(self._rows)
+        for name in ('_xs', '_ys', '_vxs', '_vys', '_times'):
+            setattr(frame, name, array('d', getattr(self, name)))
+        return frame
@@ -0,0 +1,70 @@
+"""
+Name Cache for Albion Radar
+
+Bounded memo of entity name classifications (dungeon names), which come
+from a small, static set but arrive with every spawn event.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+DEFAULT_MAX_SIZE = 1024
+
+
+class NameCache:
+    """
+    Memoizes `classify(name, enchant)` per (kind, name, enchant).
+
+    Once full, the oldest entry is evicted for each new one. Hit, miss and
+    eviction counters are kept for stats().
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self._entries: Dict[Tuple[str, Hashable, int], Any] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, kind: str, name: Hashable, enchant: int,
+            classify: Callable[[Any, int], Any]) -> Any:
+        """Get the classification of a name, computing it on first use"""
+        key = (kind, name, enchant)
+        try:
+            value = self._entries[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = classify(name, enchant)
+        if len(self._entries) >= self.max_size:
+            del self._entries[next(iter(self._entries))]
+            self.evictions += 1
+        self._entries[key] = value
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters"""
+        return {
+            'size': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+# Shared by the name classifying handlers
+NAME_CACHE = NameCache()
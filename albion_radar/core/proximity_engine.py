@@ -0,0 +1,146 @@
+"""
+Proximity Engine for Albion Radar
+
+Optional NumPy-backed columnar store of entity positions. Distances from the
+local player, in-range masks and distance ordering for every live entity are
+computed in one vectorized pass per tick instead of per-object Python math.
+"""
+
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+class ProximityEngine:
+    """
+    Contiguous float32 position columns with vectorized range computation.
+
+    Rows are kept dense: removing an entity moves the last row into its slot.
+    Results of the last compute() are kept alongside the ids they were
+    computed for and looked up on demand, so entities only receive their
+    distance when somebody asks for it.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for ProximityEngine (pip install numpy)")
+
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._xs = np.zeros(capacity, dtype=np.float32)
+        self._ys = np.zeros(capacity, dtype=np.float32)
+        self._rows: Dict[int, int] = {}
+        self._count = 0
+
+        # Results of the last compute()
+        self.center = (0.0, 0.0)
+        self.max_distance = 0.0
+        self._result_rows: Dict[int, int] = {}
+        self._distances = np.zeros(0, dtype=np.float32)
+        self._in_range = np.zeros(0, dtype=bool)
+        self._sorted_ids = np.zeros(0, dtype=np.int64)
+        self._stale = True
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, entity_id: int) -> bool:
+        return entity_id in self._rows
+
+    def insert(self, entity_id: int, x: float, y: float) -> None:
+        """Add an entity (or move it if already present)"""
+        row = self._rows.get(entity_id)
+        if row is None:
+            if self._count == len(self._ids):
+                self._grow()
+            row = self._count
+            self._count += 1
+            self._rows[entity_id] = row
+            self._ids[row] = entity_id
+        self._xs[row] = x
+        self._ys[row] = y
+        self._stale = True
+
+    def move(self, entity_id: int, x: float, y: float) -> None:
+        """Update an entity's position"""
+        row = self._rows.get(entity_id)
+        if row is not None:
+            self._xs[row] = x
+            self._ys[row] = y
+            self._stale = True
+
+    def remove(self, entity_id: int) -> None:
+        """Remove an entity, moving the last row into its slot"""
+        row = self._rows.pop(entity_id, None)
+        if row is None:
+            return
+        last = self._count - 1
+        if row != last:
+            moved_id = int(self._ids[last])
+            self._ids[row] = moved_id
+            self._xs[row] = self._xs[last]
+            self._ys[row] = self._ys[last]
+            self._rows[moved_id] = row
+        self._count = last
+        self._stale = True
+
+    def clear(self) -> None:
+        """Remove all entities"""
+        self._rows = {}
+        self._count = 0
+        self._result_rows = {}
+        self._stale = True
+
+    def compute(self, center_x: float, center_y: float, max_distance: float) -> None:
+        """Compute distance, in-range mask and distance order for every entity"""
+        count = self._count
+        dx = self._xs[:count] - np.float32(center_x)
+        dy = self._ys[:count] - np.float32(center_y)
+        distances = np.sqrt(dx * dx + dy * dy)
+        in_range = distances <= max_distance
+
+        in_range_rows = np.flatnonzero(in_range)
+        order = in_range_rows[np.argsort(distances[in_range_rows], kind='stable')]
+
+        self.center = (center_x, center_y)
+        self.max_distance = max_distance
+        self._distances = distances
+        self._in_range = in_range
+        self._sorted_ids = self._ids[order]
+        # Rows move on removal, so remember which row each id had for these results
+        self._result_rows = dict(self._rows)
+        self._stale = False
+
+    def is_current(self, center_x: float, center_y: float, max_distance: float) -> bool:
+        """Whether the last results still hold for this center and range"""
+        return (not self._stale and self.center == (center_x, center_y)
+                and self.max_distance == max_distance)
+
+    def distance_of(self, entity_id: int) -> Optional[float]:
+        """Distance of an entity from the last computed center"""
+        row = self._result_rows.get(entity_id)
+        if row is None:
+            return None
+        return float(self._distances[row])
+
+    def in_range(self, entity_id: int) -> bool:
+        """Whether an entity was in range at the last compute()"""
+        row = self._result_rows.get(entity_id)
+        return row is not None and bool(self._in_range[row])
+
+    def sorted_in_range_ids(self) -> List[int]:
+        """Ids in range at the last compute(), nearest first"""
+        return self._sorted_ids.tolist()
+
+    def _grow(self) -> None:
+        """Double the column capacity"""
+        capacity = len(self._ids) * 2
+        for name in ('_ids', '_xs', '_ys'):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
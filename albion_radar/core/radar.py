@@ -11,6 +11,7 @@ from enum import Enum
 from .packet_capture import PacketCapture
 from .photon_parser import PhotonParser
 from .data_manager import DataManager
+from .ignore_list import IgnoreList, IGNORE_LIST_FILE
 from ..handlers.players_handler import PlayersHandler
 from ..handlers.harvestables_handler import HarvestablesHandler
 from ..handlers.mobs_handler import MobsHandler
@@ -43,15 +44,20 @@ class AlbionRadar:
     Albion Online network data.
     """
     
-    def __init__(self, settings: Optional[Settings] = None):
+    def __init__(self, settings: Optional[Settings] = None, dead_reckoning: bool = False,
+                 ignore_list: Optional[IgnoreList] = None):
         """
         Initialize AlbionRadar.
         
         Args:
             settings: Optional settings object. If None, default settings will be used.
+            dead_reckoning: Track velocities so clients can extrapolate positions.
+            ignore_list: Optional ignore list. If None, ignore_list.json is used.
         """
         self.settings = settings or Settings()
-        self.data_manager = DataManager()
+        self.ignore_list = ignore_list if ignore_list is not None else IgnoreList(IGNORE_LIST_FILE)
+        self.data_manager = DataManager(self.settings, dead_reckoning=dead_reckoning,
+                                        ignore_list=self.ignore_list)
         
         # Core components
         self.packet_capture = PacketCapture()
@@ -334,45 +340,13 @@ class AlbionRadar:
     
     def get_objects_in_range(self, center_x: float, center_y: float, radius: float) -> Dict[ObjectType, List]:
         """Get all objects within a specific radius"""
-        objects = {
-            ObjectType.PLAYER: [],
-            ObjectType.RESOURCE: [],
-            ObjectType.MOB: [],
-            ObjectType.CHEST: [],
-            ObjectType.DUNGEON: []
+        return {
+            ObjectType.PLAYER: self.players_handler.get_in_range(center_x, center_y, radius),
+            ObjectType.RESOURCE: self.harvestables_handler.get_in_range(center_x, center_y, radius),
+            ObjectType.MOB: self.mobs_handler.get_in_range(center_x, center_y, radius),
+            ObjectType.CHEST: self.chests_handler.get_in_range(center_x, center_y, radius),
+            ObjectType.DUNGEON: self.dungeons_handler.get_in_range(center_x, center_y, radius)
         }
-        
-        # Check players
-        for player in self.get_players():
-            distance = ((player.pos_x - center_x) ** 2 + (player.pos_y - center_y) ** 2) ** 0.5
-            if distance <= radius:
-                objects[ObjectType.PLAYER].append(player)
-        
-        # Check resources
-        for resource in self.get_resources():
-            distance = ((resource.pos_x - center_x) ** 2 + (resource.pos_y - center_y) ** 2) ** 0.5
-            if distance <= radius:
-                objects[ObjectType.RESOURCE].append(resource)
-        
-        # Check mobs
-        for mob in self.get_mobs():
-            distance = ((mob.pos_x - center_x) ** 2 + (mob.pos_y - center_y) ** 2) ** 0.5
-            if distance <= radius:
-                objects[ObjectType.MOB].append(mob)
-        
-        # Check chests
-        for chest in self.get_chests():
-            distance = ((chest.pos_x - center_x) ** 2 + (chest.pos_y - center_y) ** 2) ** 0.5
-            if distance <= radius:
-                objects[ObjectType.CHEST].append(chest)
-        
-        # Check dungeons
-        for dungeon in self.get_dungeons():
-            distance = ((dungeon.pos_x - center_x) ** 2 + (dungeon.pos_y - center_y) ** 2) ** 0.5
-            if distance <= radius:
-                objects[ObjectType.DUNGEON].append(dungeon)
-        
-        return objects
     
     def is_running(self) -> bool:
         """Check if radar is running"""
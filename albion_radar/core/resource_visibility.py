@@ -0,0 +1,134 @@
+"""
+Resource Visibility for Albion Radar
+
+Compiles the harvesting settings into flat lookup tables so that deciding
+whether a resource is shown is a single index instead of a settings walk.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from .harvestable_columns import TYPE_COUNT, TIER_COUNT, ENCHANT_COUNT, TABLE_SIZE, table_index
+
+
+# Resource category of every harvestable type id (0-27)
+RESOURCE_TYPE_NAMES: Tuple[str, ...] = (
+    ('Log',) * 6 +      # 0-5
+    ('Rock',) * 5 +     # 6-10
+    ('Fiber',) * 5 +    # 11-15
+    ('Hide',) * 7 +     # 16-22
+    ('Ore',) * 5        # 23-27
+)
+
+# Settings holding the {'e0'..'e4': [tier 1-8 flags]} matrix per category
+STATIC_SETTINGS: Dict[str, str] = {
+    'Fiber': 'harvesting_static_fiber',
+    'Hide': 'harvesting_static_hide',
+    'Log': 'harvesting_static_wood',
+    'Ore': 'harvesting_static_ore',
+    'Rock': 'harvesting_static_rock'
+}
+
+LIVING_SETTINGS: Dict[str, str] = {
+    'Fiber': 'harvesting_living_fiber',
+    'Hide': 'harvesting_living_hide',
+    'Log': 'harvesting_living_wood',
+    'Ore': 'harvesting_living_ore',
+    'Rock': 'harvesting_living_rock'
+}
+
+# First type id of each category, used for lookups by category name;
+# drawing code calls logs 'wood' like the settings do
+_CATEGORY_TYPE: Dict[str, int] = {}
+for _type_id, _name in enumerate(RESOURCE_TYPE_NAMES):
+    _CATEGORY_TYPE.setdefault(_name.lower(), _type_id)
+_CATEGORY_TYPE['wood'] = _CATEGORY_TYPE['log']
+
+
+def resource_type_name(type_number: int) -> str:
+    """Get the category name of a harvestable type id ('' if unknown)"""
+    if 0 <= type_number < TYPE_COUNT:
+        return RESOURCE_TYPE_NAMES[type_number]
+    return ''
+
+
+class ResourceVisibility:
+    """
+    Static and living resource visibility tables built from settings.
+
+    Each table is a bytearray indexed with table_index(type, tier, enchant).
+    Tables are built once and then only by refresh(), which owners call when
+    they are told the settings changed. `settings` may be a Settings object
+    or a plain dict of the same names. Categories without a setting, and
+    types, tiers and enchants outside the tables, use `default`.
+    """
+
+    def __init__(self, settings: Any, default: bool = True):
+        self.settings = settings
+        self.default = default
+        self.static = bytearray(TABLE_SIZE)
+        self.living = bytearray(TABLE_SIZE)
+        self.version = 0
+        self._source: Optional[Tuple] = None
+        self.refresh()
+
+    def refresh(self) -> bool:
+        """Rebuild the tables after a settings change, returning whether they differ"""
+        source = (self._read(STATIC_SETTINGS), self._read(LIVING_SETTINGS))
+        if source == self._source:
+            return False
+
+        self._source = source
+        self.static = self._build(source[0])
+        self.living = self._build(source[1])
+        self.version += 1
+        return True
+
+    def is_visible(self, resource_type: int, tier: int, enchant: int, living: bool = False) -> bool:
+        """Whether a resource with this type, tier and enchantment is shown"""
+        if not (0 <= resource_type < TYPE_COUNT and 1 <= tier <= TIER_COUNT
+                and 0 <= enchant < ENCHANT_COUNT):
+            return self.default
+        table = self.living if living else self.static
+        return table[table_index(resource_type, tier, enchant)] != 0
+
+    def is_category_visible(self, category: str, tier: int, enchant: int, living: bool = True) -> bool:
+        """Whether a resource category ('Fiber', 'wood', ...) is shown at this tier and enchantment"""
+        type_id = _CATEGORY_TYPE.get(category.lower())
+        if type_id is None:
+            return self.default
+        return self.is_visible(type_id, tier, enchant, living)
+
+    def _read(self, setting_names: Dict[str, str]) -> Tuple:
+        """Copy the settings matrices into a hashable, comparable form"""
+        matrices = []
+        for category in sorted(setting_names):
+            name = setting_names[category]
+            if isinstance(self.settings, dict):
+                matrix = self.settings.get(name)
+            else:
+                matrix = getattr(self.settings, name, None)
+            if matrix is None:
+                matrices.append((category, None))
+                continue
+            matrices.append((category, tuple(
+                tuple(bool(flag) for flag in matrix.get(f'e{enchant}', ()))
+                for enchant in range(ENCHANT_COUNT)
+            )))
+        return tuple(matrices)
+
+    def _build(self, matrices: Tuple) -> bytearray:
+        """Expand per-category matrices into a per-type table"""
+        by_category = dict(matrices)
+        table = bytearray(TABLE_SIZE)
+        for resource_type, category in enumerate(RESOURCE_TYPE_NAMES):
+            matrix = by_category.get(category)
+            for tier in range(1, TIER_COUNT + 1):
+                for enchant in range(ENCHANT_COUNT):
+                    if matrix is None:
+                        shown = self.default
+                    else:
+                        flags = matrix[enchant]
+                        shown = tier <= len(flags) and flags[tier - 1]
+                    if shown:
+                        table[table_index(resource_type, tier, enchant)] = 1
+        return table
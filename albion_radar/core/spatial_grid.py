@@ -0,0 +1,202 @@
+"""
+Spatial Grid for Albion Radar
+
+Uniform hash grid used by the handlers for range queries around the local
+player without scanning every tracked entity.
+"""
+
+import math
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Set, Tuple
+
+
+# Default radar range used by the handlers' range queries
+DEFAULT_RADAR_RANGE = 80.0
+
+# Half the radar range: a range query touches at most a 5x5 block of cells,
+# and the corner cells that cannot reach the circle are skipped
+DEFAULT_CELL_SIZE = DEFAULT_RADAR_RANGE / 2
+
+Cell = Tuple[int, int]
+
+
+class SpatialGrid:
+    """
+    Uniform spatial hash grid.
+
+    Entities are bucketed by the cell containing their position and kept up
+    to date incrementally on insert, move and remove. Range queries only visit
+    the cells overlapping the query circle and compare squared distances.
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, Set[Hashable]] = {}
+        # key -> (x, y, cell, item)
+        self._entries: Dict[Hashable, Tuple[float, float, Cell, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def insert(self, key: Hashable, x: float, y: float, item: Any = None) -> None:
+        """Add an entity (or move it if already present)"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._relocate(key, entry, x, y, item if item is not None else entry[3])
+            return
+
+        cell = self._cell_of(x, y)
+        self._entries[key] = (x, y, cell, key if item is None else item)
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            self._cells[cell] = {key}
+        else:
+            bucket.add(key)
+
+    def move(self, key: Hashable, x: float, y: float) -> None:
+        """Update an entity's position"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._relocate(key, entry, x, y, entry[3])
+
+    def remove(self, key: Hashable) -> Any:
+        """Remove an entity, returning its item"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self._discard_from_cell(key, entry[2])
+        return entry[3]
+
+    def get(self, key: Hashable) -> Any:
+        """Get the item stored for a key"""
+        entry = self._entries.get(key)
+        return entry[3] if entry is not None else None
+
+    def position(self, key: Hashable) -> Optional[Tuple[float, float]]:
+        """Get the indexed position of an entity"""
+        entry = self._entries.get(key)
+        return (entry[0], entry[1]) if entry is not None else None
+
+    def clear(self) -> None:
+        """Remove all entities"""
+        self._cells.clear()
+        self._entries.clear()
+
+    def detach(self) -> List[dict]:
+        """Swap in empty storage and return the old containers for deferred release"""
+        retired = [self._entries, self._cells]
+        self._entries = {}
+        self._cells = {}
+        return retired
+
+    def query(self, center_x: float, center_y: float, radius: float) -> List[Any]:
+        """Get the items within `radius` of the center"""
+        return [item for item, _ in self.query_with_distance(center_x, center_y, radius)]
+
+    def query_with_distance(self, center_x: float, center_y: float,
+                            radius: float) -> List[Tuple[Any, float]]:
+        """Get (item, squared distance) for every entity within `radius`"""
+        radius_sq = radius * radius
+        entries = self._entries
+        found = []
+        for bucket, _ in self._cells_overlapping(center_x, center_y, radius):
+            for key in bucket:
+                x, y, _, item = entries[key]
+                dx = x - center_x
+                dy = y - center_y
+                distance_sq = dx * dx + dy * dy
+                if distance_sq <= radius_sq:
+                    found.append((item, distance_sq))
+        return found
+
+    def query_outside(self, center_x: float, center_y: float, radius: float) -> List[Hashable]:
+        """
+        Get the keys of entities further than `radius` from the center.
+
+        Whole cells outside the circle are taken without distance checks and
+        cells entirely inside it are skipped; only cells crossing the boundary
+        are tested per entity.
+        """
+        radius_sq = radius * radius
+        entries = self._entries
+        outside: List[Hashable] = []
+        for cell, bucket in self._cells.items():
+            near_sq, far_sq = self._cell_distance_bounds(cell, center_x, center_y)
+            if near_sq > radius_sq:
+                outside.extend(bucket)
+            elif far_sq > radius_sq:
+                for key in bucket:
+                    x, y, _, _ = entries[key]
+                    dx = x - center_x
+                    dy = y - center_y
+                    if dx * dx + dy * dy > radius_sq:
+                        outside.append(key)
+        return outside
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """Iterate over (key, item) pairs"""
+        for key, entry in self._entries.items():
+            yield key, entry[3]
+
+    def _cell_of(self, x: float, y: float) -> Cell:
+        """Get the cell containing a point"""
+        size = self.cell_size
+        return (math.floor(x / size), math.floor(y / size))
+
+    def _relocate(self, key: Hashable, entry: Tuple, x: float, y: float, item: Any) -> None:
+        """Store a new position, changing buckets only when the cell changes"""
+        old_cell = entry[2]
+        cell = self._cell_of(x, y)
+        self._entries[key] = (x, y, cell, item)
+        if cell != old_cell:
+            self._discard_from_cell(key, old_cell)
+            bucket = self._cells.get(cell)
+            if bucket is None:
+                self._cells[cell] = {key}
+            else:
+                bucket.add(key)
+
+    def _discard_from_cell(self, key: Hashable, cell: Cell) -> None:
+        """Remove a key from a bucket, dropping the bucket when empty"""
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del self._cells[cell]
+
+    def _cells_overlapping(self, center_x: float, center_y: float,
+                           radius: float) -> Iterator[Tuple[Set[Hashable], Cell]]:
+        """Yield the non-empty buckets whose cell intersects the query circle"""
+        size = self.cell_size
+        radius_sq = radius * radius
+        min_cx = math.floor((center_x - radius) / size)
+        max_cx = math.floor((center_x + radius) / size)
+        min_cy = math.floor((center_y - radius) / size)
+        max_cy = math.floor((center_y + radius) / size)
+        cells = self._cells
+
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                near_sq, _ = self._cell_distance_bounds((cx, cy), center_x, center_y)
+                if near_sq <= radius_sq:
+                    yield bucket, (cx, cy)
+
+    def _cell_distance_bounds(self, cell: Cell, x: float, y: float) -> Tuple[float, float]:
+        """Squared distance from a point to the nearest and farthest point of a cell"""
+        size = self.cell_size
+        left = cell[0] * size
+        bottom = cell[1] * size
+        right = left + size
+        top = bottom + size
+
+        near_dx = left - x if x < left else (x - right if x > right else 0.0)
+        near_dy = bottom - y if y < bottom else (y - top if y > top else 0.0)
+        far_dx = max(x - left, right - x)
+        far_dy = max(y - bottom, top - y)
+        return (near_dx * near_dx + near_dy * near_dy,
+                far_dx * far_dx + far_dy * far_dy)
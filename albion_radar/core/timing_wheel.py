@@ -0,0 +1,133 @@
+"""
+Timing Wheel for Albion Radar
+
+Hierarchical timing wheel used to expire entities whose Leave event was missed.
+"""
+
+import math
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel.
+
+    Deadlines are bucketed into slots of `resolution` seconds on the first
+    level; each higher level covers `slots` times the span of the level below
+    and cascades its entries down as time reaches them. Scheduling and
+    cancelling are O(1), and advancing only touches the slots that elapsed
+    plus the entries that actually fire.
+    """
+
+    def __init__(self, resolution: float = 0.5, slots: int = 64, levels: int = 4):
+        self.resolution = resolution
+        self.slots = slots
+        self.levels = levels
+        self._current: Optional[int] = None
+        self._wheels: List[List[Dict[Hashable, int]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        # key -> (target tick, level, slot)
+        self._entries: Dict[Hashable, Tuple[int, int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def started(self) -> bool:
+        """Whether the wheel has been anchored to a point in time"""
+        return self._current is not None
+
+    def start(self, now: float) -> None:
+        """Anchor the wheel at `now`; does nothing if already started"""
+        if self._current is None:
+            self._current = math.floor(now / self.resolution)
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """Schedule (or reschedule) a key to fire at the given deadline"""
+        if self._current is None:
+            raise RuntimeError("TimingWheel.start() must be called before scheduling")
+        self.cancel(key)
+        target = math.ceil(deadline / self.resolution)
+        self._place(key, max(target, self._current + 1))
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancel a scheduled key"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        _, level, slot = entry
+        del self._wheels[level][slot][key]
+        return True
+
+    def advance(self, now: float) -> List[Hashable]:
+        """Advance the wheel to `now` and return the keys that expired"""
+        if self._current is None:
+            self.start(now)
+            return []
+
+        target = math.floor(now / self.resolution)
+        expired: List[Hashable] = []
+
+        while self._current < target and self._entries:
+            self._current += 1
+            self._cascade()
+            bucket = self._wheels[0][self._current % self.slots]
+            if bucket:
+                for key in bucket:
+                    del self._entries[key]
+                expired.extend(bucket)
+                bucket.clear()
+
+        # Nothing left to fire, jump straight to the target tick
+        if self._current < target:
+            self._current = target
+        return expired
+
+    def clear(self) -> None:
+        """Remove all scheduled keys"""
+        for wheel in self._wheels:
+            for bucket in wheel:
+                bucket.clear()
+        self._entries.clear()
+
+    def _place(self, key: Hashable, target: int) -> None:
+        """Put a key in the slot matching its distance from the current tick"""
+        delta = target - self._current
+        span = self.slots
+        for level in range(self.levels):
+            if delta < span or level == self.levels - 1:
+                if delta >= span:
+                    # Beyond the wheel horizon, park in the furthest slot and
+                    # re-place when it cascades
+                    slot_tick = self._current + span - 1
+                else:
+                    slot_tick = max(target, self._current)
+                slot = (slot_tick // (span // self.slots)) % self.slots
+                self._wheels[level][slot][key] = target
+                self._entries[key] = (target, level, slot)
+                return
+            span *= self.slots
+
+    def _cascade(self) -> None:
+        """Move entries from higher levels down when their slot comes due"""
+        tick = self._current
+        due_levels = 0
+        span = self.slots
+        while due_levels < self.levels - 1 and tick % span == 0:
+            due_levels += 1
+            span *= self.slots
+
+        for level in range(due_levels, 0, -1):
+            span = self.slots ** level
+            bucket = self._wheels[level][(tick // span) % self.slots]
+            if not bucket:
+                continue
+            entries = list(bucket.items())
+            bucket.clear()
+            for key, target in entries:
+                del self._entries[key]
+                self._place(key, target)
@@ -0,0 +1,161 @@
+"""
+World Snapshot for Albion Radar
+
+Publishes immutable views of the radar world so that readers on other
+threads (web interface, drawing) never iterate handler state while the
+capture thread is mutating it.
+"""
+
+import copy
+from dataclasses import dataclass, is_dataclass
+from enum import Enum
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from ..models.compact import field_names
+from .frame_clock import FRAME_CLOCK
+
+
+def freeze_entities(entities: Iterable[Any]) -> Tuple:
+    """Copy entities into a tuple detached from the handler's live objects"""
+    return tuple(copy.copy(entity) for entity in entities)
+
+
+def serialize_entity(entity: Any) -> Dict:
+    """Convert an entity to a JSON friendly dictionary"""
+    if hasattr(entity, 'to_dict'):
+        return entity.to_dict()
+
+    data = {}
+    if is_dataclass(entity):
+        for name in field_names(type(entity)):
+            value = getattr(entity, name)
+            data[name] = value.name if isinstance(value, Enum) else value
+    return data
+
+
+@dataclass(frozen=True)
+class WorldSnapshot:
+    """Immutable view of every tracked entity at the end of a tick"""
+    sequence: int = 0
+    timestamp: float = 0.0
+    generation: int = 0
+    local_player: Tuple[float, float] = (0.0, 0.0)
+    players: Tuple = ()
+    resources: Tuple = ()
+    mobs: Tuple = ()
+    mists: Tuple = ()
+    chests: Tuple = ()
+    dungeons: Tuple = ()
+    fishes: Tuple = ()
+    cages: Tuple = ()
+    # Mobs added or changed / removed since the previous snapshot, which had
+    # sequence base_sequence in zone generation base_generation
+    changed_mobs: Tuple = ()
+    removed_mob_ids: Tuple = ()
+    base_sequence: int = 0
+    base_generation: int = 0
+    # MotionFrames for dead reckoning (DataManager(dead_reckoning=True) only);
+    # the local player is in player_motion under LOCAL_PLAYER_KEY
+    player_motion: Optional[Any] = None
+    mob_motion: Optional[Any] = None
+
+    def to_dict(self) -> Dict:
+        """Convert snapshot to dictionary, built once per snapshot and shared (do not mutate it)"""
+        data = self.__dict__.get('_serialized')
+        if data is None:
+            data = self._serialize()
+            # Frozen dataclass; the cache is not a field
+            object.__setattr__(self, '_serialized', data)
+        return data
+
+    def _serialize(self) -> Dict:
+        """Build the dictionary returned by to_dict()"""
+        return {
+            'sequence': self.sequence,
+            'timestamp': self.timestamp,
+            'generation': self.generation,
+            'local_player': {'pos_x': self.local_player[0], 'pos_y': self.local_player[1]},
+            'players': [serialize_entity(p) for p in self.players],
+            'resources': [serialize_entity(r) for r in self.resources],
+            'mobs': [serialize_entity(m) for m in self.mobs],
+            'mists': [serialize_entity(m) for m in self.mists],
+            'chests': [serialize_entity(c) for c in self.chests],
+            'dungeons': [serialize_entity(d) for d in self.dungeons],
+            'fishes': [serialize_entity(f) for f in self.fishes],
+            'cages': [serialize_entity(c) for c in self.cages]
+        }
+
+    def motion_dict(self) -> Dict:
+        """Convert the motion frames to (id, x, y, vx, vy, timestamp) rows for client-side extrapolation"""
+        return {
+            'players': _wall_states(self.player_motion),
+            'mobs': _wall_states(self.mob_motion)
+        }
+
+    def mob_delta(self) -> Dict:
+        """
+        Convert only the mob changes since the previous snapshot to a dictionary.
+
+        Only valid for a client holding snapshot `base_sequence` of zone
+        generation `base_generation` (see mob_delta_applies()); anyone else
+        needs the full mob list.
+        """
+        return {
+            'base_sequence': self.base_sequence,
+            'base_generation': self.base_generation,
+            'sequence': self.sequence,
+            'generation': self.generation,
+            'changed': [serialize_entity(m) for m in self.changed_mobs],
+            'removed': list(self.removed_mob_ids)
+        }
+
+    def mob_delta_applies(self, sequence: int, generation: int) -> bool:
+        """Whether mob_delta() brings a client holding this sequence and generation up to date"""
+        return (sequence == self.base_sequence and generation == self.base_generation
+                and generation == self.generation)
+
+
+def _wall_states(frame: Optional[Any]) -> list:
+    """Motion rows of a frame with their frame times converted to Unix time"""
+    if frame is None:
+        return []
+    wall = FRAME_CLOCK.wall
+    return [(entity_id, x, y, vx, vy, wall(updated)) for entity_id, x, y, vx, vy, updated in frame.states()]
+
+
+class SnapshotBuffer:
+    """
+    Double-buffered holder for the current world snapshot.
+
+    The writer builds the next snapshot privately (back buffer) and publishes
+    it with a single reference assignment, which is atomic in CPython. Readers
+    always see a complete snapshot without taking a lock, and the writer never
+    waits for readers to finish.
+    """
+
+    def __init__(self):
+        self._front = WorldSnapshot(timestamp=FRAME_CLOCK.wall())
+        self._sequence = 0
+
+    def publish(self, **entities: Any) -> WorldSnapshot:
+        """Build a new snapshot and swap it in as the front buffer"""
+        front = self._front
+        self._sequence += 1
+        back = WorldSnapshot(
+            sequence=self._sequence,
+            timestamp=FRAME_CLOCK.wall(),
+            base_sequence=front.sequence,
+            base_generation=front.generation,
+            **entities
+        )
+        self._front = back
+        return back
+
+    def read(self) -> WorldSnapshot:
+        """Get the most recently published snapshot"""
+        return self._front
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the last published snapshot"""
+        return self._sequence
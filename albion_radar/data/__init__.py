@@ -0,0 +1,5 @@
+"""
+Data for Albion Radar
+
+Compiled lookup tables generated by the albion_radar.tools scripts.
+"""
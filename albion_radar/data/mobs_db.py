@@ -0,0 +1,129 @@
+"""
+Mob Database for Albion Radar
+
+Generated from MobsInfo.js by
+    python -m albion_radar.tools.compile_mobs_info
+Do not edit by hand.
+"""
+
+# EnemyType of MobsInfo.js, indexed by category byte
+CATEGORY_NAMES = (
+    'LivingHarvestable',
+    'LivingSkinnable',
+    'Enemy',
+    'MediumEnemy',
+    'EnchantedEnemy',
+    'MiniBoss',
+    'Boss',
+    'Drone',
+    'MistBoss',
+    'Events',
+)
+
+# Category byte of type ids that are not listed
+UNKNOWN = 255
+
+MOB_COUNT = 275
+
+# Every table below is indexed by mob type id, 0 <= type id < TABLE_SIZE
+TABLE_SIZE = 846
+
+# Tier (0 if not listed)
+TIERS = bytes.fromhex(
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000005060708040506070800000000000000010203040506'
+    '070804050607080405060708040506070804050607080102020304050606070708080405060708010203040506070804'
+    '050601020304050607070808040506070800000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000305070305070303'
+    '050507030305050703030505070405060708040506070804050607080405060708040506070804050607080405060708'
+    '040506000804050607080405060708040506070804050607080405060708040506070804050607080304050607080304'
+    '050607080304050607080304050607080304050607080304050607080304050607080304050607080304050607080304'
+    '050607080304050607080304050607080000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000002030405'
+    '060708000000000000000000000203040506000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000005060708050607080506070805060708'
+)
+
+# Category byte, see CATEGORY_NAMES
+CATEGORIES = bytes.fromhex(
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffff080808080808080808ffffffffffffff010101010101'
+    '010101010101010808080808080808080808080808080101010101010101010101010101010101010101010101010101'
+    '0101010101010101010101010101010101ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff0000000101010000'
+    '000000000000000000000000000101010101010101010101010101010000000000000000000000000000000000000000'
+    '000000ff0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '00000000000000000000000000000000ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff09090909'
+    '090909ffffffffffffffffffff0909090909ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffff07070707070707070707070707070707'
+)
+
+# Little endian 16 bit index into NAMES, two bytes per type id
+NAME_INDEX = bytes.fromhex(
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '0000000002000200020002000200020002000200020000000000000000000000000000000a000a000a000a000a000a00'
+    '0a000a000a000a000a000a000a000800080008000800080005000500050005000500060006000600060006000a000a00'
+    '0a000a000a000a000a000a000a000a000a000a000a000a000a000a000a000a000a000a000a000a000a000a000a000a00'
+    '0a000a000a000a000a000a000a000a000a000a000a000a000a000a000a000a000a000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '00000000000000000000000000000000000000000000000000000000000000000900090009000a000a000a000b000b00'
+    '0b000b000b00070007000700070007000c000c000c000c000c000a000a000a000a000a000a000a000a000a000a000a00'
+    '0a000a000a000a000700070007000700070007000700070007000700070007000700070007000c000c000c000c000c00'
+    '0c000c000c0000000c000c000c000c000c000c000b000b000b000b000b000b000b000b000b000b000b000b000b000b00'
+    '0b000900090009000900090009000900090009000900090009000900090009000700070007000700070007000c000c00'
+    '0c000c000c000c000b000b000b000b000b000b000900090009000900090009000700070007000700070007000c000c00'
+    '0c000c000c000c000b000b000b000b000b000b000900090009000900090009000700070007000700070007000c000c00'
+    '0c000c000c000c000b000b000b000b000b000b0009000900090009000900090000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000400040004000400'
+    '040004000400000000000000000000000000000000000000000003000300030003000300000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'
+    '000000000000000000000000000000000000000000000000000000000100010001000100010001000100010001000100'
+    '010001000100010001000100'
+)
+
+NAMES = (
+    '',
+    'AVALONMINIONCHEST',
+    'CRYSTALSPIDER',
+    'EVENTEASTERCHEST1',
+    'EVENTEASTERCHEST2',
+    'FAIRYDRAGON',
+    'GRIFFIN',
+    'Logs',
+    'VEILWEAVER',
+    'fiber',
+    'hide',
+    'ore',
+    'rock',
+)
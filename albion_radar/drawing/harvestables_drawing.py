@@ -7,6 +7,7 @@ based on the original HarvestablesDrawing.js.
 
 from typing import Dict, Any, List, Optional
 from .base_drawing import BaseDrawing
+from ..core.resource_visibility import ResourceVisibility
 import math
 
 
@@ -33,6 +34,14 @@ class HarvestablesDrawing(BaseDrawing):
             'rock': '🪨',
             'fish': '🐟',
         }
+        
+        # Settings compiled into lookup tables; unset categories are hidden
+        self.visibility = ResourceVisibility(self.settings, default=False)
+    
+    def update_settings(self, settings: Dict[str, Any]) -> None:
+        """Update drawing settings and recompile resource visibility."""
+        super().update_settings(settings)
+        self.visibility.refresh()
     
     def draw(self, ctx: Any) -> None:
         """Draw all harvestable resources on the radar."""
@@ -87,27 +96,12 @@ class HarvestablesDrawing(BaseDrawing):
     
     def _should_show_resource(self, resource: Dict[str, Any]) -> bool:
         """Check if resource should be shown based on settings."""
-        resource_type = resource.get('type', '').lower()
-        tier = resource.get('tier', 1)
-        enchant = resource.get('enchant', 0)
-        is_living = resource.get('is_living', False)
-        
-        # Get settings for this resource type
-        if is_living:
-            settings_key = f"harvesting_living_{resource_type}"
-        else:
-            settings_key = f"harvesting_static_{resource_type}"
-        
-        resource_settings = self.settings.get(settings_key, {})
-        
-        # Check if this tier/enchant combination is enabled
-        enchant_key = f"e{enchant}"
-        if enchant_key in resource_settings:
-            tier_index = tier - 1  # Convert tier to 0-based index
-            if 0 <= tier_index < len(resource_settings[enchant_key]):
-                return resource_settings[enchant_key][tier_index]
-        
-        return False
+        return self.visibility.is_category_visible(
+            resource.get('type', ''),
+            resource.get('tier', 1),
+            resource.get('enchant', 0),
+            resource.get('is_living', False)
+        )
     
     def _draw_resource_marker(self, ctx: Any, x: int, y: int, color: str, 
                             symbol: str, tier: int, enchant: int) -> None:
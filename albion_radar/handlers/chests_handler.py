@@ -5,12 +5,17 @@ Handles chest detection and management.
 """
 
 import time
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from dataclasses import dataclass, field
+from ..models.compact import compact
 from ..models.chest import Chest
+from ..core.world_snapshot import freeze_entities
+from ..core.spatial_grid import SpatialGrid
+from ..core.entity_store import EntityStore
 from ..config.settings import Settings
 
 
+@compact
 @dataclass
 class ChestData:
     """Represents a chest"""
@@ -31,19 +36,21 @@ class ChestsHandler:
     
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.chests_list: List[ChestData] = []
+        self.chests_list: EntityStore[ChestData] = EntityStore()
+        self.grid = SpatialGrid()
     
     def add_chest(self, chest_id: int, pos_x: float, pos_y: float, name: str) -> None:
         """Add a new chest"""
         chest = ChestData(id=chest_id, pos_x=pos_x, pos_y=pos_y, chest_name=name)
         
         # Check if chest already exists
-        if not any(c.id == chest_id for c in self.chests_list):
-            self.chests_list.append(chest)
+        if self.chests_list.add(chest_id, chest):
+            self.grid.insert(chest_id, pos_x, pos_y, chest)
     
     def remove_chest(self, chest_id: int) -> None:
         """Remove a chest"""
-        self.chests_list = [c for c in self.chests_list if c.id != chest_id]
+        self.chests_list.remove(chest_id)
+        self.grid.remove(chest_id)
     
     def handle_chest_event(self, parameters: Dict) -> None:
         """Handle chest event"""
@@ -68,8 +75,21 @@ class ChestsHandler:
     
     def get_chests_list(self) -> List[ChestData]:
         """Get all chests"""
-        return self.chests_list.copy()
+        return self.chests_list.to_list()
+    
+    def get_in_range(self, center_x: float, center_y: float, radius: float) -> List[ChestData]:
+        """Get all chests within radius of a point"""
+        return self.grid.query(center_x, center_y, radius)
+    
+    def snapshot(self) -> Tuple:
+        """Get an immutable copy of all chests"""
+        return freeze_entities(self.chests_list.values())
     
     def clear(self) -> None:
         """Clear all chests"""
-        self.chests_list.clear() 
\ No newline at end of file
+        self.chests_list.clear()
+        self.grid.clear()
+    
+    def detach(self) -> List:
+        """Swap in empty storage and return the old containers for deferred release"""
+        return [self.chests_list.detach()] + self.grid.detach()
\ No newline at end of file
@@ -5,10 +5,15 @@ Handles dungeon detection and management.
 """
 
 import time
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from dataclasses import dataclass, field
+from ..models.compact import compact
 from enum import Enum
 from ..models.dungeon import Dungeon
+from ..core.world_snapshot import freeze_entities
+from ..core.spatial_grid import SpatialGrid
+from ..core.entity_store import EntityStore
+from ..core.name_cache import NAME_CACHE
 from ..config.settings import Settings
 
 
@@ -20,6 +25,7 @@ class DungeonType(Enum):
     HELLGATE = 3
 
 
+@compact
 @dataclass
 class DungeonData:
     """Represents a dungeon"""
@@ -35,14 +41,35 @@ class DungeonData:
     
     def __post_init__(self):
         """Set draw name based on type"""
-        if self.type == DungeonType.SOLO:
-            self.draw_name = f"dungeon_{self.enchant}"
-        elif self.type == DungeonType.GROUP:
-            self.draw_name = f"group_{self.enchant}"
-        elif self.type == DungeonType.CORRUPTED:
-            self.draw_name = "corrupt"
-        elif self.type == DungeonType.HELLGATE:
-            self.draw_name = "hellgate"
+        if not self.draw_name:
+            self.draw_name = dungeon_draw_name(self.type, self.enchant)
+
+
+def dungeon_draw_name(dungeon_type: DungeonType, enchant: int) -> str:
+    """Get the image key a dungeon is drawn with"""
+    if dungeon_type == DungeonType.SOLO:
+        return f"dungeon_{enchant}"
+    elif dungeon_type == DungeonType.GROUP:
+        return f"group_{enchant}"
+    elif dungeon_type == DungeonType.CORRUPTED:
+        return "corrupt"
+    return "hellgate"
+
+
+def classify_dungeon(name: str, enchant: int) -> Tuple[DungeonType, str]:
+    """Get the dungeon type and draw name for a dungeon name"""
+    name_lower = name.lower()
+    
+    # Check corrupted first (has "solo" in name)
+    if "corrupted" in name_lower:
+        dungeon_type = DungeonType.CORRUPTED
+    elif "solo" in name_lower:
+        dungeon_type = DungeonType.SOLO
+    elif "hellgate" in name_lower:
+        dungeon_type = DungeonType.HELLGATE
+    else:
+        dungeon_type = DungeonType.GROUP
+    return dungeon_type, dungeon_draw_name(dungeon_type, enchant)
 
 
 class DungeonsHandler:
@@ -54,35 +81,37 @@ class DungeonsHandler:
     
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.dungeon_list: List[DungeonData] = []
+        self.dungeon_list: EntityStore[DungeonData] = EntityStore()
+        self.grid = SpatialGrid()
     
     def add_dungeon(self, dungeon_id: int, pos_x: float, pos_y: float, 
                     name: str, enchant: int) -> None:
         """Add a new dungeon"""
         
-        # Determine dungeon type from name
-        dungeon_type = self._get_dungeon_type(name, enchant)
-        if dungeon_type is None:
-            return
-        
         # Check if dungeon already exists
-        if any(d.id == dungeon_id for d in self.dungeon_list):
+        if dungeon_id in self.dungeon_list:
             return
         
+        # Determine dungeon type from name
+        dungeon_type, draw_name = self._classify(name, enchant)
+        
         dungeon = DungeonData(
             id=dungeon_id,
             pos_x=pos_x,
             pos_y=pos_y,
             name=name,
             enchant=enchant,
-            type=dungeon_type
+            type=dungeon_type,
+            draw_name=draw_name
         )
         
-        self.dungeon_list.append(dungeon)
+        self.dungeon_list.add(dungeon_id, dungeon)
+        self.grid.insert(dungeon_id, pos_x, pos_y, dungeon)
     
     def remove_dungeon(self, dungeon_id: int) -> None:
         """Remove a dungeon"""
-        self.dungeon_list = [d for d in self.dungeon_list if d.id != dungeon_id]
+        self.dungeon_list.remove(dungeon_id)
+        self.grid.remove(dungeon_id)
     
     def handle_dungeon_event(self, parameters: Dict) -> None:
         """Handle dungeon event"""
@@ -104,36 +133,32 @@ class DungeonsHandler:
     
     def get_dungeon_list(self) -> List[DungeonData]:
         """Get all dungeons"""
-        return self.dungeon_list.copy()
+        return self.dungeon_list.to_list()
+    
+    def get_in_range(self, center_x: float, center_y: float, radius: float) -> List[DungeonData]:
+        """Get all dungeons within radius of a point"""
+        return self.grid.query(center_x, center_y, radius)
+    
+    def snapshot(self) -> Tuple:
+        """Get an immutable copy of all dungeons"""
+        return freeze_entities(self.dungeon_list.values())
     
     def clear(self) -> None:
         """Clear all dungeons"""
         self.dungeon_list.clear()
+        self.grid.clear()
+    
+    def detach(self) -> List:
+        """Swap in empty storage and return the old containers for deferred release"""
+        return [self.dungeon_list.detach()] + self.grid.detach()
     
     def _get_dungeon_type(self, name: str, enchant: int) -> DungeonType:
         """Get dungeon type from name and settings"""
-        name_lower = name.lower()
-        
-        # Check corrupted first (has "solo" in name)
-        if "corrupted" in name_lower:
-            if not self.settings.show_dungeons:
-                return DungeonType.SOLO  # Default return
-            return DungeonType.CORRUPTED
-        
-        # Check solo dungeons
-        elif "solo" in name_lower:
-            if not self.settings.show_dungeons:
-                return DungeonType.SOLO  # Default return
-            return DungeonType.SOLO
-        
-        # Check hellgate
-        elif "hellgate" in name_lower:
-            if not self.settings.show_dungeons:
-                return DungeonType.SOLO  # Default return
-            return DungeonType.HELLGATE
-        
-        # Default to group
-        else:
-            if not self.settings.show_dungeons:
-                return DungeonType.SOLO  # Default return
-            return DungeonType.GROUP 
\ No newline at end of file
+        return self._classify(name, enchant)[0]
+    
+    def _classify(self, name: str, enchant: int) -> Tuple[DungeonType, str]:
+        """Get dungeon type and draw name, memoized per name and enchant"""
+        if not self.settings.show_dungeons:
+            # Hidden dungeons are all reported as solo (default type)
+            return DungeonType.SOLO, dungeon_draw_name(DungeonType.SOLO, enchant)
+        return NAME_CACHE.get('dungeon', name, enchant, classify_dungeon)
\ No newline at end of file
@@ -5,11 +5,16 @@ Handles fishing spot detection and management.
 """
 
 import time
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from dataclasses import dataclass, field
+from ..models.compact import compact
+from ..core.world_snapshot import freeze_entities
+from ..core.spatial_grid import SpatialGrid
+from ..core.entity_store import EntityStore
 from ..config.settings import Settings
 
 
+@compact
 @dataclass
 class Fish:
     """Represents a fishing spot"""
@@ -37,7 +42,8 @@ class FishingHandler:
     
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.fishes: List[Fish] = []
+        self.fishes: EntityStore[Fish] = EntityStore()
+        self.grid = SpatialGrid()
     
     def add_fish(self, fish_id: int, pos_x: float, pos_y: float, 
                  fish_type: str, size_spawned: int = 0, size_left_to_spawn: int = 0) -> None:
@@ -52,15 +58,13 @@ class FishingHandler:
         )
         
         # Update existing fish or add new one
-        existing_index = next((i for i, f in enumerate(self.fishes) if f.id == fish_id), -1)
-        if existing_index != -1:
-            self.fishes[existing_index] = fish
-        else:
-            self.fishes.append(fish)
+        self.fishes.put(fish_id, fish)
+        self.grid.insert(fish_id, pos_x, pos_y, fish)
     
     def remove_fish(self, fish_id: int) -> None:
         """Remove a fishing spot"""
-        self.fishes = [f for f in self.fishes if f.id != fish_id]
+        self.fishes.remove(fish_id)
+        self.grid.remove(fish_id)
     
     def handle_new_fish_event(self, parameters: Dict) -> None:
         """Handle new fish event"""
@@ -91,15 +95,28 @@ class FishingHandler:
             
         try:
             fish_id = parameters.get(0)
-            if fish_id and any(f.id == fish_id for f in self.fishes):
+            if fish_id and fish_id in self.fishes:
                 self.remove_fish(fish_id)
         except Exception as e:
             print(f"Error handling fishing end event: {e}")
     
     def get_fishes_list(self) -> List[Fish]:
         """Get all fishing spots"""
-        return self.fishes.copy()
+        return self.fishes.to_list()
+    
+    def get_in_range(self, center_x: float, center_y: float, radius: float) -> List[Fish]:
+        """Get all fishing spots within radius of a point"""
+        return self.grid.query(center_x, center_y, radius)
+    
+    def snapshot(self) -> Tuple:
+        """Get an immutable copy of all fishing spots"""
+        return freeze_entities(self.fishes.values())
     
     def clear(self) -> None:
         """Clear all fishing spots"""
-        self.fishes.clear() 
\ No newline at end of file
+        self.fishes.clear()
+        self.grid.clear()
+    
+    def detach(self) -> List:
+        """Swap in empty storage and return the old containers for deferred release"""
+        return [self.fishes.detach()] + self.grid.detach()
\ No newline at end of file
@@ -4,14 +4,33 @@ Harvestables Handler for Albion Radar
 Handles resource detection, tracking, and management.
 """
 
-import time
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
+from ..models.compact import compact
 from enum import Enum
 from ..models.resource import Resource, ResourceType, ResourceEnchant
+from ..core.world_snapshot import freeze_entities
+from ..core.spatial_grid import SpatialGrid, DEFAULT_RADAR_RANGE
+from ..core.harvestable_columns import HarvestableColumns, fits_columns
+from ..core.resource_visibility import ResourceVisibility, resource_type_name
+from ..core.frame_clock import FRAME_CLOCK
+from ..core.object_pool import ObjectPool, DEFAULT_POOL_SIZE
 from ..config.settings import Settings
 
 
+# Local player movement (in world units) before range culling is re-evaluated
+CULL_MOVE_THRESHOLD = 2.0
+
+# Resources are parked once past range + margin and restored within range
+CULL_MARGIN = 10.0
+
+# Most resources kept in the cold store; the oldest parked are dropped first
+COLD_STORE_LIMIT = 20000
+
+# Mob type id of NewHarvestableObject events for static (non-living) resources
+STATIC_MOBILE_TYPE = 65535
+
+
 class HarvestableType(Enum):
     """Harvestable resource types"""
     FIBER = 'Fiber'
@@ -21,6 +40,7 @@ class HarvestableType(Enum):
     ROCK = 'Rock'
 
 
+@compact
 @dataclass
 class Harvestable:
     """Represents a harvestable resource"""
@@ -33,6 +53,7 @@ class Harvestable:
     size: int = 0
     h_x: float = 0.0
     h_y: float = 0.0
+    living: bool = False
     
     def set_charges(self, charges: int) -> None:
         """Update resource charges"""
@@ -44,78 +65,224 @@ class HarvestablesHandler:
     Handles harvestable resource detection and management.
     
     Based on the original JavaScript HarvestablesHandler.js
+    
+    With `columnar=True` (experimental, off by default) resources are stored
+    in parallel typed arrays (HarvestableColumns) instead of one Harvestable
+    instance each. The handler works on live row views internally; every
+    public getter returns standalone Harvestable copies, since a row view
+    breaks or shows another resource once its id is removed or reused.
     """
     
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, columnar: bool = False):
         self.settings = settings
-        self.harvestable_list: List[Harvestable] = []
-        self._last_update = time.time()
+        self.columnar = columnar
+        self.visibility = ResourceVisibility(settings)
+        # Keyed by resource id; dicts keep insertion order for rendering
+        self._harvestables: Dict[int, Harvestable] = self._new_store()
+        self.grid = SpatialGrid()
+        # Out of range resources, kept so they come back for free on re-entry
+        self._cold: Dict[int, Harvestable] = self._new_store()
+        self.cold_grid = SpatialGrid()
+        self._cull_center: Optional[Tuple[float, float]] = None
+        self._cull_range = DEFAULT_RADAR_RANGE
+        # Resources added without a known size; dropped by the next cull
+        self._unsized: Set[int] = set()
+        # Called with the id of every resource updated in place (DataManager expiry)
+        self.on_activity: Optional[Callable[[int], None]] = None
+        # Free list of removed resources (enable_pooling)
+        self.pool: Optional[ObjectPool[Harvestable]] = None
+        # Resources the column store could not hold (type, tier or charges past 255)
+        self.rejected = 0
+        self._last_update = FRAME_CLOCK.now
+    
+    @property
+    def harvestables(self) -> Iterable[Harvestable]:
+        """Insertion-ordered view of all harvestable resources (copies when columnar)"""
+        if self.columnar:
+            return self._entities(self._harvestables)
+        return self._harvestables.values()
+    
+    @property
+    def harvestable_list(self) -> List[Harvestable]:
+        """All harvestable resources as a list"""
+        return self.get_harvestable_list()
     
     def add_harvestable(self, resource_id: int, resource_type: int, tier: int,
-                        pos_x: float, pos_y: float, charges: int = 0, size: int = 0) -> None:
+                        pos_x: float, pos_y: float, charges: int = 0, size: int = 0,
+                        living: bool = False) -> None:
         """Add a new harvestable resource"""
         
         # Check if this resource type should be shown based on settings
-        if not self._should_show_resource(resource_type, charges, tier):
+        if not self._should_show_resource(resource_type, charges, tier, living):
+            return
+        if self.columnar and not fits_columns(resource_type, tier, charges):
+            self.rejected += 1
             return
         
         # Check if resource already exists
-        existing = self._find_harvestable(resource_id)
+        existing = self._lookup(resource_id)
         if existing:
             existing.set_charges(charges)
+            self._mark_active(resource_id)
             return
         
+        if size is None:
+            self._unsized.add(resource_id)
+            if self.columnar:
+                # The size column cannot hold None
+                size = 0
+        
         # Create new harvestable
-        harvestable = Harvestable(
+        new_harvestable = Harvestable if self.pool is None else self.pool.acquire
+        harvestable = new_harvestable(
             id=resource_id,
             type=resource_type,
             tier=tier,
             pos_x=pos_x,
             pos_y=pos_y,
             charges=charges,
-            size=size
+            size=size,
+            living=living
         )
         
-        self.harvestable_list.append(harvestable)
+        if self._is_culled(pos_x, pos_y):
+            self._park(harvestable)
+        else:
+            self._harvestables[resource_id] = harvestable
+            self.grid.insert(resource_id, pos_x, pos_y)
     
     def update_harvestable(self, resource_id: int, resource_type: int, tier: int,
-                          pos_x: float, pos_y: float, charges: int = 0, size: int = 0) -> None:
+                          pos_x: float, pos_y: float, charges: int = 0, size: int = 0,
+                          living: bool = False) -> None:
         """Update an existing harvestable resource"""
         
         # Check if this resource type should be shown based on settings
-        if not self._should_show_resource(resource_type, charges, tier):
+        if not self._should_show_resource(resource_type, charges, tier, living):
+            return
+        if self.columnar and not fits_columns(resource_type, tier, charges):
+            self.rejected += 1
+            return
+        
+        # Resources without a known size are dropped, as range culling did
+        if size is None:
+            self.remove_harvestable(resource_id)
             return
         
-        existing = self._find_harvestable(resource_id)
+        existing = self._lookup(resource_id)
         if existing:
             existing.charges = charges
             existing.size = size
+            self._unsized.discard(resource_id)
+            self._mark_active(resource_id)
         else:
-            self.add_harvestable(resource_id, resource_type, tier, pos_x, pos_y, charges, size)
+            self.add_harvestable(resource_id, resource_type, tier, pos_x, pos_y, charges, size, living)
     
     def remove_harvestable(self, resource_id: int) -> None:
         """Remove a harvestable resource"""
-        self.harvestable_list = [h for h in self.harvestable_list if h.id != resource_id]
+        self._unsized.discard(resource_id)
+        harvestable = self._harvestables.pop(resource_id, None)
+        if harvestable is not None:
+            self.grid.remove(resource_id)
+        else:
+            harvestable = self._cold.pop(resource_id, None)
+            if harvestable is None:
+                return
+            self.cold_grid.remove(resource_id)
+        if self.pool is not None:
+            self.pool.release(harvestable)
+    
+    def remove_not_in_range(self, local_pos_x: float, local_pos_y: float,
+                            max_distance: float = DEFAULT_RADAR_RANGE) -> None:
+        """
+        Park resources that are too far from local player.
+        
+        Only re-evaluated once the local player has moved more than
+        CULL_MOVE_THRESHOLD. Resources past range + CULL_MARGIN move to the
+        cold store and come back once within range again; only grid cells
+        crossing either boundary are tested per resource. Resources added
+        without a known size are dropped on every call.
+        """
+        for resource_id in list(self._unsized):
+            self.remove_harvestable(resource_id)
+        
+        if self._cull_center is not None and max_distance == self._cull_range:
+            dx = local_pos_x - self._cull_center[0]
+            dy = local_pos_y - self._cull_center[1]
+            if dx * dx + dy * dy <= CULL_MOVE_THRESHOLD * CULL_MOVE_THRESHOLD:
+                return
+        
+        self._cull_center = (local_pos_x, local_pos_y)
+        self._cull_range = max_distance
+        
+        for resource_id in self.grid.query_outside(local_pos_x, local_pos_y,
+                                                   max_distance + CULL_MARGIN):
+            self._park(self._harvestables.pop(resource_id))
+            self.grid.remove(resource_id)
+        
+        for resource_id in self.cold_grid.query(local_pos_x, local_pos_y, max_distance):
+            self._restore(resource_id)
+    
+    def refresh_visibility(self) -> bool:
+        """Rebuild the visibility tables after a settings change and drop newly hidden resources"""
+        if not self.visibility.refresh():
+            return False
+        self.apply_visibility()
+        return True
     
-    def remove_not_in_range(self, local_pos_x: float, local_pos_y: float, max_distance: float = 80.0) -> None:
-        """Remove resources that are too far from local player"""
-        self.harvestable_list = [
-            h for h in self.harvestable_list 
-            if self._calculate_distance(local_pos_x, local_pos_y, h.pos_x, h.pos_y) <= max_distance
-            and h.size is not None
-        ]
+    def apply_visibility(self) -> int:
+        """Drop resources hidden by the current settings, returning how many"""
+        if self.columnar:
+            static, living = self.visibility.static, self.visibility.living
+            outside = self.visibility.default
+            hidden = (self._harvestables.hidden_ids(static, outside, living)
+                      + self._cold.hidden_ids(static, outside, living))
+        else:
+            hidden = [
+                harvestable.id
+                for store in (self._harvestables, self._cold)
+                for harvestable in store.values()
+                if not self._should_show_resource(harvestable.type, harvestable.charges,
+                                                  harvestable.tier, harvestable.living)
+            ]
+        
+        for resource_id in hidden:
+            self.remove_harvestable(resource_id)
+        return len(hidden)
+    
+    def enable_pooling(self, max_size: int = DEFAULT_POOL_SIZE) -> Optional[ObjectPool]:
+        """
+        Recycle removed Harvestable instances (callers must not hold them across removals).
+        
+        Not available with the columnar store, which keeps no instances.
+        """
+        if self.columnar:
+            return None
+        if self.pool is None:
+            self.pool = ObjectPool(Harvestable, max_size)
+        return self.pool
+    
+    def get_in_range(self, center_x: float, center_y: float, radius: float) -> List[Harvestable]:
+        """Get all harvestable resources within radius of a point"""
+        return self._entities(self.grid.query(center_x, center_y, radius))
     
     def update_harvestable_size(self, resource_id: int, new_size: int) -> None:
         """Update resource size after harvesting"""
-        harvestable = self._find_harvestable(resource_id)
+        if new_size is None:
+            self.remove_harvestable(resource_id)
+            return
+        
+        harvestable = self._lookup(resource_id)
         if harvestable:
             harvestable.size = new_size
+            self._unsized.discard(resource_id)
+            self._mark_active(resource_id)
     
     def harvest_finished(self, resource_id: int, count: int) -> None:
         """Handle harvest completion"""
-        harvestable = self._find_harvestable(resource_id)
+        harvestable = self._lookup(resource_id)
         if harvestable:
             harvestable.size = max(0, harvestable.size - count)
+            self._mark_active(resource_id)
     
     def handle_new_harvestable_object(self, resource_id: int, parameters: Dict) -> None:
         """Handle new harvestable object event"""
@@ -125,6 +292,8 @@ class HarvestablesHandler:
             location = parameters.get(8, [0, 0])
             enchant = parameters.get(11, 0)
             size = parameters.get(10, 0)
+            # Living resources (skinnable and harvestable creatures) carry their mob type
+            living = parameters.get(6, STATIC_MOBILE_TYPE) != STATIC_MOBILE_TYPE
             
             if not location:
                 return
@@ -133,7 +302,7 @@ class HarvestablesHandler:
             
             if resource_type is not None and tier is not None:
                 self.update_harvestable(
-                    resource_id, resource_type, tier, pos_x, pos_y, enchant, size
+                    resource_id, resource_type, tier, pos_x, pos_y, enchant, size, living
                 )
             
         except Exception as e:
@@ -166,41 +335,100 @@ class HarvestablesHandler:
     
     def get_harvestable_list(self) -> List[Harvestable]:
         """Get all harvestable resources"""
-        return self.harvestable_list.copy()
+        if self.columnar:
+            return self._entities(self._harvestables)
+        return list(self._harvestables.values())
+    
+    def snapshot(self) -> Tuple:
+        """Get an immutable copy of all harvestable resources"""
+        return freeze_entities(self._harvestables.values())
     
     def clear(self) -> None:
         """Clear all harvestable resources"""
-        self.harvestable_list.clear()
+        if self.pool is not None:
+            for store in (self._harvestables, self._cold):
+                for harvestable in store.values():
+                    self.pool.release(harvestable)
+        self._harvestables.clear()
+        self.grid.clear()
+        self._cold.clear()
+        self.cold_grid.clear()
+        self._unsized.clear()
+        self._cull_center = None
+    
+    def detach(self) -> List:
+        """Swap in empty storage and return the old containers for deferred release"""
+        # Column stores hold no entity objects, so they are simply dropped
+        stores = [] if self.columnar else [self._harvestables, self._cold]
+        retired = stores + self.grid.detach() + self.cold_grid.detach()
+        self._harvestables = self._new_store()
+        self._cold = self._new_store()
+        self._unsized = set()
+        self._cull_center = None
+        return retired
     
     def _find_harvestable(self, resource_id: int) -> Optional[Harvestable]:
         """Find a harvestable by ID"""
-        for harvestable in self.harvestable_list:
-            if harvestable.id == resource_id:
-                return harvestable
-        return None
+        return self._harvestables.get(resource_id)
+    
+    def _new_store(self) -> Dict[int, Harvestable]:
+        """Create empty resource storage for the configured layout"""
+        return HarvestableColumns(Harvestable) if self.columnar else {}
+    
+    def _lookup(self, resource_id: int) -> Optional[Harvestable]:
+        """Find a harvestable by ID, in range or parked"""
+        harvestable = self._harvestables.get(resource_id)
+        if harvestable is None:
+            harvestable = self._cold.get(resource_id)
+        return harvestable
+    
+    def _entities(self, resource_ids: Iterable[int]) -> List[Harvestable]:
+        """Resources by id as returned to callers; column rows never leave the handler"""
+        harvestables = self._harvestables
+        if self.columnar:
+            return [harvestables.materialize(resource_id) for resource_id in resource_ids]
+        return [harvestables[resource_id] for resource_id in resource_ids]
+    
+    def _mark_active(self, resource_id: int) -> None:
+        """Report an in-place update so the resource's expiry is pushed back"""
+        if self.on_activity is not None:
+            self.on_activity(resource_id)
+    
+    def _is_culled(self, pos_x: float, pos_y: float) -> bool:
+        """Whether a position is past the eviction boundary of the last cull"""
+        if self._cull_center is None:
+            return False
+        dx = pos_x - self._cull_center[0]
+        dy = pos_y - self._cull_center[1]
+        limit = self._cull_range + CULL_MARGIN
+        return dx * dx + dy * dy > limit * limit
     
-    def _should_show_resource(self, resource_type: int, charges: int, tier: int) -> bool:
+    def _park(self, harvestable: Harvestable) -> None:
+        """Move a harvestable to the cold store"""
+        if len(self._cold) >= COLD_STORE_LIMIT:
+            oldest_id = next(iter(self._cold))
+            oldest = self._cold.pop(oldest_id)
+            self.cold_grid.remove(oldest_id)
+            if self.pool is not None:
+                self.pool.release(oldest)
+        self._cold[harvestable.id] = harvestable
+        self.cold_grid.insert(harvestable.id, harvestable.pos_x, harvestable.pos_y)
+    
+    def _restore(self, resource_id: int) -> None:
+        """Move a harvestable from the cold store back into range"""
+        harvestable = self._cold.pop(resource_id)
+        self.cold_grid.remove(resource_id)
+        self._harvestables[resource_id] = harvestable
+        self.grid.insert(resource_id, harvestable.pos_x, harvestable.pos_y)
+    
+    def _should_show_resource(self, resource_type: int, charges: int, tier: int,
+                              living: bool = False) -> bool:
         """Check if resource should be shown based on settings"""
-        resource_type_str = self._get_string_type(resource_type)
-        
-        # TODO: Implement proper settings checking
-        # For now, show all resources
-        return True
+        return self.visibility.is_visible(resource_type, tier, charges, living)
     
     def _get_string_type(self, type_number: int) -> str:
         """Convert type number to string type"""
-        if 0 <= type_number <= 5:
-            return HarvestableType.LOG.value
-        elif 6 <= type_number <= 10:
-            return HarvestableType.ROCK.value
-        elif 11 <= type_number <= 15:
-            return HarvestableType.FIBER.value
-        elif 16 <= type_number <= 22:
-            return HarvestableType.HIDE.value
-        elif 23 <= type_number <= 27:
-            return HarvestableType.ORE.value
-        else:
-            return ''
+        return resource_type_name(type_number)
     
     def _calculate_distance(self, x1: float, y1: float, x2: float, y2: float) -> float:
         """Calculate distance between two points"""
@@ -4,47 +4,196 @@ Items Info Handler for Albion Radar
 Handles item information and lookup.
 """
 
-import json
+import mmap
 import os
-from typing import Dict, Optional
-from ..config.settings import Settings
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from ..tools.compile_items import (
+    DEFAULT_SOURCE, ENTRY, HEADER, MAGIC, build_table, compile_items, default_output, parse_items
+)
+
+
+# "T6_2H_BOW@2" -> tier 6, enchant 2
+_TIER_PREFIX = re.compile(r'^T(\d+)_')
+_ENCHANT_SUFFIX = re.compile(r'@(\d+)$')
+
+# Nominal item power of T4.0 gear; each tier and enchant level adds 100.
+# Quality and mastery bonuses are not in the events, so they are not included
+BASE_ITEM_POWER = 700
+ITEM_POWER_STEP = 100
 
 
 class ItemsInfo:
     """
     Handles item information and lookup.
     
-    Based on the original JavaScript ItemsInfo.js
+    Based on the original JavaScript ItemsInfo.js. Items come from the binary
+    table built by `python -m albion_radar.tools.compile_items`, which is
+    memory-mapped and decoded one id at a time on demand. The table is
+    (re)built from items.txt in the user cache directory when it is missing
+    or older than the text; if that directory is not writable the table is
+    built in memory for the session instead.
     """
     
-    def __init__(self):
-        self.items: Dict[str, str] = {}
+    def __init__(self, table_path: Optional[str] = None, source_path: str = DEFAULT_SOURCE):
+        self.table_path = table_path or default_output()
+        self.source_path = source_path
+        self.items: Dict[int, str] = {}
+        self._data = b''
+        self._size = 0
+        self._blob_offset = 0
+        self._resolved: Dict[int, Optional[Tuple[str, str]]] = {}
         self._load_items()
     
-    def add_item(self, item_id: str, name: str, value: str) -> None:
+    def add_item(self, item_id: int, name: str, value: int = 0) -> None:
         """Add item information"""
-        self.items[item_id] = name
+        if value == 0:
+            self.items[item_id] = name
+            return
+        
+        # Enchanted variants follow the base id as NAME@1 .. NAME@4
+        for enchant in range(5):
+            self.items[item_id + enchant] = name if enchant == 0 else f"{name}@{enchant}"
+    
+    def get(self, item_id: int) -> Optional[str]:
+        """Get the unique name (e.g. T4_BAG) of an item id"""
+        name = self.items.get(item_id)
+        if name is not None:
+            return name
+        entry = self._entry(item_id)
+        return entry[0] if entry else None
     
-    def get_item_name(self, item_id: str) -> Optional[str]:
-        """Get item name by ID"""
+    def get_item_name(self, item_id: int) -> Optional[str]:
+        """Get the display name (e.g. Adept's Bag) of an item id"""
+        entry = self._entry(item_id)
+        if entry and entry[1]:
+            return entry[1]
         return self.items.get(item_id)
     
+    def resolve_items(self, item_ids: Iterable[int]) -> List[Optional[str]]:
+        """Resolve equipment ids (as in Player.items) to unique names"""
+        return [self.get(item_id) if isinstance(item_id, int) and item_id > 0 else None
+                for item_id in item_ids]
+    
+    def describe_item(self, item_id: int) -> Optional[Dict]:
+        """Resolve an equipment id to its names, tier, enchant and nominal item power"""
+        if not isinstance(item_id, int) or item_id <= 0:
+            return None
+        name = self.get(item_id)
+        if name is None:
+            return {'id': item_id, 'name': None, 'display_name': None,
+                    'tier': 0, 'enchant': 0, 'item_power': None}
+        
+        tier_match = _TIER_PREFIX.match(name)
+        enchant_match = _ENCHANT_SUFFIX.search(name)
+        tier = int(tier_match.group(1)) if tier_match else 0
+        enchant = int(enchant_match.group(1)) if enchant_match else 0
+        item_power = None
+        if tier >= 4:
+            item_power = BASE_ITEM_POWER + ITEM_POWER_STEP * (tier - 4 + enchant)
+        return {
+            'id': item_id,
+            'name': name,
+            'display_name': self.get_item_name(item_id),
+            'tier': tier,
+            'enchant': enchant,
+            'item_power': item_power
+        }
+    
+    def describe_equipment(self, item_ids: Iterable[int]) -> List[Optional[Dict]]:
+        """Resolve equipment (as in Player.items) slot by slot, None for empty slots"""
+        return [self.describe_item(item_id) for item_id in item_ids]
+    
+    def iter_items(self) -> Iterator[Tuple[int, str, str]]:
+        """Iterate over (item id, unique name, display name) without caching entries"""
+        for item_id in range(self._size):
+            if item_id in self.items:
+                continue
+            entry = self._decode(item_id)
+            if entry:
+                yield item_id, entry[0], entry[1]
+        for item_id, name in sorted(self.items.items()):
+            entry = self._decode(item_id) if 0 <= item_id < self._size else None
+            yield item_id, name, entry[1] if entry else ''
+    
+    def get_all_items(self) -> Dict[int, str]:
+        """Get all items"""
+        items = {}
+        for item_id in range(self._size):
+            entry = self._entry(item_id)
+            if entry:
+                items[item_id] = entry[0]
+        items.update(self.items)
+        return items
+    
+    def close(self) -> None:
+        """Release the mapped item table"""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = b''
+        self._size = 0
+        self._resolved.clear()
+    
     def _load_items(self) -> None:
-        """Load items from file"""
+        """Map the compiled item table, building it first if needed"""
         try:
-            # TODO: Load from actual items.txt file
-            # For now, create some sample items
-            sample_items = {
-                "T4_BAG": "Adept's Bag",
-                "T5_BAG": "Expert's Bag",
-                "T6_BAG": "Master's Bag",
-                "T7_BAG": "Grandmaster's Bag",
-                "T8_BAG": "Elder's Bag"
-            }
-            self.items.update(sample_items)
+            if self._table_is_stale():
+                try:
+                    compile_items(self.source_path, self.table_path)
+                except OSError:
+                    # Cache directory not writable: keep a table in memory for this run
+                    with open(self.source_path, 'r', encoding='utf-8-sig') as source_file:
+                        self._attach(build_table(parse_items(source_file.read())))
+                    return
+            
+            if not os.path.exists(self.table_path):
+                return
+            
+            with open(self.table_path, 'rb') as table_file:
+                self._attach(mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ))
         except Exception as e:
             print(f"Error loading items: {e}")
     
-    def get_all_items(self) -> Dict[str, str]:
-        """Get all items"""
-        return self.items.copy() 
\ No newline at end of file
+    def _table_is_stale(self) -> bool:
+        """Whether items.txt is newer than the compiled table"""
+        if not os.path.exists(self.source_path):
+            return False
+        if not os.path.exists(self.table_path):
+            return True
+        return os.path.getmtime(self.source_path) > os.path.getmtime(self.table_path)
+    
+    def _attach(self, data) -> None:
+        """Use a compiled table held in memory or mapped from disk"""
+        magic, size, blob_offset = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.table_path} is not an item table")
+        self._data = data
+        self._size = size
+        self._blob_offset = blob_offset
+        self._resolved.clear()
+    
+    def _entry(self, item_id: int) -> Optional[Tuple[str, str]]:
+        """Get (unique name, display name) of an item id, decoding it once"""
+        if item_id in self._resolved:
+            return self._resolved[item_id]
+        if not 0 <= item_id < self._size:
+            return None
+        
+        entry = self._decode(item_id)
+        self._resolved[item_id] = entry
+        return entry
+    
+    def _decode(self, item_id: int) -> Optional[Tuple[str, str]]:
+        """Decode (unique name, display name) of an item id from the table"""
+        offset, unique_length, display_length = ENTRY.unpack_from(
+            self._data, HEADER.size + item_id * ENTRY.size
+        )
+        entry = None
+        if unique_length:
+            start = self._blob_offset + offset
+            middle = start + unique_length
+            entry = (
+                self._data[start:middle].decode('utf-8'),
+                self._data[middle:middle + display_length].decode('utf-8')
+            )
+        return entry
\ No newline at end of file
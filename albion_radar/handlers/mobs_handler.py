@@ -4,11 +4,19 @@ Mobs Handler for Albion Radar
 Handles mob detection, tracking, and management.
 """
 
-import time
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
+from ..models.compact import compact
 from enum import Enum
 from ..models.mob import Mob
+from .mobs_info import mob_category, mob_name, mob_tier
+from ..core.world_snapshot import freeze_entities
+from ..core.entity_store import EntityStore
+from ..core.spatial_grid import SpatialGrid
+from ..core.proximity_engine import ProximityEngine, NUMPY_AVAILABLE
+from ..core.motion_tracker import MotionTracker
+from ..core.frame_clock import FRAME_CLOCK
+from ..core.object_pool import ObjectPool, DEFAULT_POOL_SIZE
 from ..config.settings import Settings
 
 
@@ -23,6 +31,22 @@ class EnemyType(Enum):
     EVENTS = 6
 
 
+# EnemyType for each MobsInfo.js category byte (see data/mobs_db.py)
+ENEMY_TYPE_BY_CATEGORY = (
+    EnemyType.LIVING_HARVESTABLE,   # LivingHarvestable
+    EnemyType.LIVING_SKINNABLE,     # LivingSkinnable
+    EnemyType.ENEMY,                # Enemy
+    EnemyType.ENEMY,                # MediumEnemy
+    EnemyType.ENEMY,                # EnchantedEnemy
+    EnemyType.BOSS,                 # MiniBoss
+    EnemyType.BOSS,                 # Boss
+    EnemyType.DRONE,                # Drone
+    EnemyType.MIST_BOSS,            # MistBoss
+    EnemyType.EVENTS                # Events
+)
+
+
+@compact
 @dataclass
 class Mist:
     """Represents a mist portal"""
@@ -32,10 +56,16 @@ class Mist:
     name: str
     enchant: int
     type: int = 0
+    draw_name: str = ""
     h_x: float = 0.0
     h_y: float = 0.0
 
 
+def classify_mist(enchant: int) -> str:
+    """Get the image key a mist portal is drawn with (it only depends on the enchantment)"""
+    return f"mist_{enchant}"
+
+
 class MobsHandler:
     """
     Handles mob detection and management.
@@ -45,36 +75,66 @@ class MobsHandler:
     
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.mob_list: List[Mob] = []
-        self.mist_list: List[Mist] = []
+        self.mob_list: EntityStore[Mob] = EntityStore()
+        self.mist_list: EntityStore[Mist] = EntityStore()
+        self.grid = SpatialGrid()
+        self.mist_grid = SpatialGrid()
+        self.proximity: Optional[ProximityEngine] = None
+        self.motion: Optional[MotionTracker] = None
+        # Called with the id of every mob updated in place (DataManager expiry)
+        self.on_activity: Optional[Callable[[int], None]] = None
+        # Free list of removed mobs (enable_pooling)
+        self.pool: Optional[ObjectPool[Mob]] = None
+        # Latest queued position and health per known mob, applied once per
+        # tick, so queries return mobs up to one tick behind the packets
+        self._pending_positions: Dict[int, Tuple[float, float]] = {}
+        self._pending_health: Dict[int, int] = {}
+        # Mobs added or changed / removed since the last take_mob_changes()
+        self.changed_mob_ids: Set[int] = set()
+        self.removed_mob_ids: Set[int] = set()
+        # Set whenever a mist is added, changed or removed
+        self.mists_dirty = False
+        self._mist_snapshot: Tuple = ()
         self.mob_info: Dict = {}
-        self._last_update = time.time()
+        self._last_update = FRAME_CLOCK.now
     
     def add_mob(self, mob_id: int, type_id: int, pos_x: float, pos_y: float,
                 health: int = 0, enchantment_level: int = 0, rarity: str = "common") -> None:
         """Add a new mob"""
         
         # Check if mob already exists
-        if self._find_mob(mob_id):
+        if mob_id in self.mob_list:
             return
         
-        mob = Mob(
+        new_mob = Mob if self.pool is None else self.pool.acquire
+        mob = new_mob(
             id=mob_id,
             name=self._get_mob_name(type_id),
             level=enchantment_level,
+            type_id=type_id,
+            tier=mob_tier(type_id),
+            enemy_type=self._classify_mob(type_id).value,
             pos_x=pos_x,
             pos_y=pos_y,
             health=health,
             max_health=health
         )
         
-        self.mob_list.append(mob)
+        self.mob_list.add(mob_id, mob)
+        self.grid.insert(mob_id, pos_x, pos_y, mob)
+        if self.proximity is not None:
+            self.proximity.insert(mob_id, pos_x, pos_y)
+        if self.motion is not None:
+            self.motion.observe(mob_id, pos_x, pos_y, mob.last_update)
+        self.changed_mob_ids.add(mob_id)
+        self.removed_mob_ids.discard(mob_id)
     
-    def add_mist(self, mist_id: int, pos_x: float, pos_y: float, name: str, enchant: int) -> None:
+    def add_mist(self, mist_id: int, pos_x: float, pos_y: float, name: str, enchant: int,
+                 mist_type: int = 0) -> None:
         """Add a new mist portal"""
         
         # Check if mist already exists
-        if self._find_mist(mist_id):
+        if mist_id in self.mist_list:
             return
         
         mist = Mist(
@@ -82,46 +142,117 @@ class MobsHandler:
             pos_x=pos_x,
             pos_y=pos_y,
             name=name,
-            enchant=enchant
+            enchant=enchant,
+            type=mist_type,
+            draw_name=classify_mist(enchant)
         )
         
-        self.mist_list.append(mist)
+        self.mist_list.add(mist_id, mist)
+        self.mist_grid.insert(mist_id, pos_x, pos_y, mist)
+        self.mists_dirty = True
     
     def remove_mob(self, mob_id: int) -> None:
         """Remove a mob"""
-        self.mob_list = [m for m in self.mob_list if m.id != mob_id]
+        self._pending_positions.pop(mob_id, None)
+        self._pending_health.pop(mob_id, None)
+        mob = self.mob_list.remove(mob_id)
+        if mob is None:
+            return
+        
+        self.grid.remove(mob_id)
+        if self.proximity is not None:
+            self.proximity.remove(mob_id)
+        if self.motion is not None:
+            self.motion.remove(mob_id)
+        self.changed_mob_ids.discard(mob_id)
+        self.removed_mob_ids.add(mob_id)
+        if self.pool is not None:
+            self.pool.release(mob)
     
     def remove_mist(self, mist_id: int) -> None:
         """Remove a mist portal"""
-        self.mist_list = [m for m in self.mist_list if m.id != mist_id]
+        if self.mist_list.remove(mist_id) is not None:
+            self.mist_grid.remove(mist_id)
+            self.mists_dirty = True
     
     def update_mob_position(self, mob_id: int, pos_x: float, pos_y: float) -> None:
-        """Update mob position"""
-        mob = self._find_mob(mob_id)
-        if mob:
-            mob.pos_x = pos_x
-            mob.pos_y = pos_y
-            mob.last_update = time.time()
+        """Queue a mob position update; only the latest one per tick is applied"""
+        if mob_id in self.mob_list:
+            self._pending_positions[mob_id] = (pos_x, pos_y)
     
     def update_mist_position(self, mist_id: int, pos_x: float, pos_y: float) -> None:
         """Update mist position"""
-        mist = self._find_mist(mist_id)
-        if mist:
+        mist = self.mist_list.get(mist_id)
+        if mist and (mist.pos_x != pos_x or mist.pos_y != pos_y):
             mist.pos_x = pos_x
             mist.pos_y = pos_y
+            self.mist_grid.move(mist_id, pos_x, pos_y)
+            self.mists_dirty = True
     
     def update_mob_health(self, mob_id: int, health: int) -> None:
-        """Update mob health"""
-        mob = self._find_mob(mob_id)
-        if mob:
+        """Queue a mob health update; only the latest one per tick is applied"""
+        if mob_id in self.mob_list:
+            self._pending_health[mob_id] = health
+    
+    def apply_pending_updates(self, now: Optional[float] = None) -> int:
+        """Apply the queued position and health updates, returning how many mobs changed"""
+        if not self._pending_positions and not self._pending_health:
+            return 0
+        
+        now = FRAME_CLOCK.now if now is None else now
+        changed = set()
+        on_activity = self.on_activity
+        
+        for mob_id, (pos_x, pos_y) in self._pending_positions.items():
+            mob = self.mob_list.get(mob_id)
+            if mob is None:
+                continue
+            if on_activity is not None:
+                on_activity(mob_id)
+            if mob.pos_x == pos_x and mob.pos_y == pos_y:
+                continue
+            mob.pos_x = pos_x
+            mob.pos_y = pos_y
+            mob.last_update = now
+            self.grid.move(mob_id, pos_x, pos_y)
+            if self.proximity is not None:
+                self.proximity.move(mob_id, pos_x, pos_y)
+            if self.motion is not None:
+                self.motion.observe(mob_id, pos_x, pos_y, now)
+            changed.add(mob_id)
+        
+        for mob_id, health in self._pending_health.items():
+            mob = self.mob_list.get(mob_id)
+            if mob is None:
+                continue
+            if on_activity is not None:
+                on_activity(mob_id)
+            if mob.health == health:
+                continue
             mob.health = health
-            mob.last_update = time.time()
+            mob.last_update = now
+            changed.add(mob_id)
+        
+        self._pending_positions.clear()
+        self._pending_health.clear()
+        self.changed_mob_ids |= changed
+        return len(changed)
+    
+    def take_mob_changes(self) -> Tuple[List[Mob], List[int]]:
+        """Get the mobs added or changed and the ids removed since the last call"""
+        changed = [self.mob_list.get(mob_id) for mob_id in self.changed_mob_ids]
+        removed = list(self.removed_mob_ids)
+        self.changed_mob_ids = set()
+        self.removed_mob_ids = set()
+        return [mob for mob in changed if mob is not None], removed
     
     def update_mist_enchantment(self, mist_id: int, enchant: int) -> None:
         """Update mist enchantment level"""
-        mist = self._find_mist(mist_id)
-        if mist:
+        mist = self.mist_list.get(mist_id)
+        if mist and mist.enchant != enchant:
             mist.enchant = enchant
+            mist.draw_name = classify_mist(enchant)
+            self.mists_dirty = True
     
     def handle_new_mob_event(self, parameters: Dict) -> None:
         """Handle new mob event"""
@@ -157,54 +288,137 @@ class MobsHandler:
                 
             pos_x, pos_y = position[0], position[1]
             
-            mist = Mist(
-                id=mist_id,
-                pos_x=pos_x,
-                pos_y=pos_y,
-                name=name,
-                enchant=enchant,
-                type=mist_type
-            )
+            mist = self.mist_list.get(mist_id)
+            if mist is None:
+                self.add_mist(mist_id, pos_x, pos_y, name, enchant, mist_type)
+                return
             
-            # Remove existing mist with same ID
-            self.remove_mist(mist_id)
-            self.mist_list.append(mist)
+            # Repeat event for a known portal: apply only what changed
+            if mist.name != name or mist.type != mist_type:
+                mist.name = name
+                mist.type = mist_type
+                self.mists_dirty = True
+            self.update_mist_enchantment(mist_id, enchant)
+            self.update_mist_position(mist_id, pos_x, pos_y)
             
         except Exception as e:
             print(f"Error handling mist event: {e}")
     
     def get_mob_list(self) -> List[Mob]:
-        """Get all mobs"""
-        return self.mob_list.copy()
+        """Get all mobs (positions and health as of the last apply_pending_updates())"""
+        return self.mob_list.to_list()
     
     def get_mist_list(self) -> List[Mist]:
         """Get all mist portals"""
-        return self.mist_list.copy()
+        return self.mist_list.to_list()
+    
+    def get_in_range(self, center_x: float, center_y: float, radius: float) -> List[Mob]:
+        """Get all mobs within radius of a point, as of the last apply_pending_updates()"""
+        return self.grid.query(center_x, center_y, radius)
+    
+    def enable_proximity_engine(self) -> bool:
+        """Track mob positions in a vectorized ProximityEngine (needs numpy)"""
+        if not NUMPY_AVAILABLE:
+            return False
+        if self.proximity is None:
+            self.proximity = ProximityEngine()
+            for mob in self.mob_list:
+                self.proximity.insert(mob.id, mob.pos_x, mob.pos_y)
+        return True
+    
+    def enable_motion_tracking(self) -> MotionTracker:
+        """Track mob velocities for dead reckoning"""
+        if self.motion is None:
+            self.motion = MotionTracker()
+            for mob in self.mob_list:
+                self.motion.observe(mob.id, mob.pos_x, mob.pos_y, mob.last_update)
+        return self.motion
+    
+    def enable_pooling(self, max_size: int = DEFAULT_POOL_SIZE) -> ObjectPool:
+        """Recycle removed Mob instances (callers must not hold mobs across removals)"""
+        if self.pool is None:
+            self.pool = ObjectPool(Mob, max_size)
+        return self.pool
+    
+    def get_mobs_by_distance(self, center_x: float, center_y: float,
+                             radius: float) -> List[Tuple[Mob, float]]:
+        """Get (mob, distance) for every mob within radius of a point, nearest first"""
+        if self.proximity is not None:
+            if not self.proximity.is_current(center_x, center_y, radius):
+                self.proximity.compute(center_x, center_y, radius)
+            found = []
+            for mob_id in self.proximity.sorted_in_range_ids():
+                mob = self.grid.get(mob_id)
+                if mob is not None:
+                    found.append((mob, self.proximity.distance_of(mob_id)))
+            return found
+        
+        found = [(mob, distance_sq ** 0.5)
+                 for mob, distance_sq in self.grid.query_with_distance(center_x, center_y, radius)]
+        found.sort(key=lambda pair: pair[1])
+        return found
+    
+    def get_mists_in_range(self, center_x: float, center_y: float, radius: float) -> List[Mist]:
+        """Get all mist portals within radius of a point"""
+        return self.mist_grid.query(center_x, center_y, radius)
     
     def update_mob_info(self, new_data: Dict) -> None:
         """Update mob information database"""
         self.mob_info.update(new_data)
     
+    def snapshot(self) -> Tuple:
+        """Get an immutable copy of all mobs"""
+        return freeze_entities(self.mob_list.values())
+    
+    def snapshot_mists(self) -> Tuple:
+        """Get an immutable copy of all mist portals, reused until a mist changes"""
+        if self.mists_dirty:
+            self._mist_snapshot = freeze_entities(self.mist_list.values())
+            self.mists_dirty = False
+        return self._mist_snapshot
+    
     def clear(self) -> None:
         """Clear all mobs and mists"""
+        if self.pool is not None:
+            for mob in self.mob_list:
+                self.pool.release(mob)
         self.mob_list.clear()
+        self._reset_mob_changes()
         self.mist_list.clear()
+        self.grid.clear()
+        self.mist_grid.clear()
+        self.mists_dirty = True
+        if self.proximity is not None:
+            self.proximity.clear()
+        if self.motion is not None:
+            self.motion.clear()
     
-    def _find_mob(self, mob_id: int) -> Optional[Mob]:
-        """Find a mob by ID"""
-        for mob in self.mob_list:
-            if mob.id == mob_id:
-                return mob
-        return None
+    def detach(self) -> List:
+        """Swap in empty storage and return the old containers for deferred release"""
+        retired = ([self.mob_list.detach(), self.mist_list.detach()]
+                   + self.grid.detach() + self.mist_grid.detach())
+        self._reset_mob_changes()
+        self.mists_dirty = True
+        if self.proximity is not None:
+            self.proximity.clear()
+        if self.motion is not None:
+            self.motion.clear()
+        return retired
     
-    def _find_mist(self, mist_id: int) -> Optional[Mist]:
-        """Find a mist by ID"""
-        for mist in self.mist_list:
-            if mist.id == mist_id:
-                return mist
-        return None
+    def _reset_mob_changes(self) -> None:
+        """Drop queued updates and change tracking along with the mobs"""
+        self._pending_positions.clear()
+        self._pending_health.clear()
+        self.changed_mob_ids = set()
+        self.removed_mob_ids = set()
     
     def _get_mob_name(self, type_id: int) -> str:
         """Get mob name from type ID"""
-        # TODO: Implement proper mob name lookup
-        return f"Mob_{type_id}" 
\ No newline at end of file
+        return mob_name(type_id) or f"Mob_{type_id}"
+    
+    def _classify_mob(self, type_id: int) -> EnemyType:
+        """Get the enemy type of a mob type ID"""
+        category = mob_category(type_id)
+        if category < len(ENEMY_TYPE_BY_CATEGORY):
+            return ENEMY_TYPE_BY_CATEGORY[category]
+        return EnemyType.ENEMY 
\ No newline at end of file
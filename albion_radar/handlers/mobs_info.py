@@ -4,24 +4,45 @@ Mobs Info Handler for Albion Radar
 Handles mob information and lookup.
 """
 
-import json
-import os
 from typing import Dict, Optional
-from ..config.settings import Settings
+from ..data import mobs_db
+
+
+def mob_tier(type_id: int) -> int:
+    """Get the tier of a mob type (0 if unknown)"""
+    if 0 <= type_id < mobs_db.TABLE_SIZE:
+        return mobs_db.TIERS[type_id]
+    return 0
+
+
+def mob_category(type_id: int) -> int:
+    """Get the MobsInfo.js EnemyType of a mob type (mobs_db.UNKNOWN if unknown)"""
+    if 0 <= type_id < mobs_db.TABLE_SIZE:
+        return mobs_db.CATEGORIES[type_id]
+    return mobs_db.UNKNOWN
+
+
+def mob_name(type_id: int) -> str:
+    """Get the name of a mob type ('' if unknown)"""
+    if 0 <= type_id < mobs_db.TABLE_SIZE:
+        offset = type_id * 2
+        return mobs_db.NAMES[mobs_db.NAME_INDEX[offset] | (mobs_db.NAME_INDEX[offset + 1] << 8)]
+    return ''
 
 
 class MobsInfo:
     """
     Handles mob information and lookup.
     
-    Based on the original JavaScript MobsInfo.js
+    Based on the original JavaScript MobsInfo.js. The table is compiled into
+    data/mobs_db.py by `python -m albion_radar.tools.compile_mobs_info`;
+    mobs added at runtime take precedence over it.
     """
     
     def __init__(self):
-        self.mobs: Dict[str, Dict] = {}
-        self._load_mobs()
+        self.mobs: Dict[int, Dict] = {}
     
-    def add_mob(self, mob_id: str, tier: int, mob_type: str, location: str) -> None:
+    def add_mob(self, mob_id: int, tier: int, mob_type: str, location: str) -> None:
         """Add mob information"""
         self.mobs[mob_id] = {
             'tier': tier,
@@ -29,24 +50,26 @@ class MobsInfo:
             'location': location
         }
     
-    def get_mob_info(self, mob_id: str) -> Optional[Dict]:
-        """Get mob information by ID"""
-        return self.mobs.get(mob_id)
+    def get_mob_info(self, mob_id: int) -> Optional[Dict]:
+        """Get mob information by type ID"""
+        info = self.mobs.get(mob_id)
+        if info is not None:
+            return info
     
-    def _load_mobs(self) -> None:
-        """Load mobs from file"""
-        try:
-            # TODO: Load from actual mobs data file
-            # For now, create some sample mobs
-            sample_mobs = {
-                "Mob_1": {'tier': 1, 'type': 'Enemy', 'location': 'Forest'},
-                "Mob_2": {'tier': 2, 'type': 'Boss', 'location': 'Dungeon'},
-                "Mob_3": {'tier': 3, 'type': 'Living', 'location': 'Mountain'}
-            }
-            self.mobs.update(sample_mobs)
-        except Exception as e:
-            print(f"Error loading mobs: {e}")
+        category = mob_category(mob_id)
+        if category == mobs_db.UNKNOWN:
+            return None
+        return {
+            'tier': mob_tier(mob_id),
+            'type': mobs_db.CATEGORY_NAMES[category],
+            'location': mob_name(mob_id)
+        }
     
-    def get_all_mobs(self) -> Dict[str, Dict]:
+    def get_all_mobs(self) -> Dict[int, Dict]:
         """Get all mobs"""
-        return self.mobs.copy() 
\ No newline at end of file
+        mobs = {}
+        for type_id in range(mobs_db.TABLE_SIZE):
+            if mobs_db.CATEGORIES[type_id] != mobs_db.UNKNOWN:
+                mobs[type_id] = self.get_mob_info(type_id)
+        mobs.update(self.mobs)
+        return mobs
\ No newline at end of file
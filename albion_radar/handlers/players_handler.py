@@ -4,10 +4,15 @@ Players Handler for Albion Radar
 Handles player detection, tracking, and management.
 """
 
-import time
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
-from ..models.player import Player, PlayerFlag
+from ..models.player import Player, PlayerFlag, equipment_array
+from ..core.world_snapshot import freeze_entities
+from ..core.spatial_grid import SpatialGrid, DEFAULT_RADAR_RANGE
+from ..core.proximity_engine import ProximityEngine, NUMPY_AVAILABLE
+from ..core.ignore_list import IgnoreList
+from ..core.motion_tracker import MotionTracker, LOCAL_PLAYER_KEY
+from ..core.frame_clock import FRAME_CLOCK
 from ..config.settings import Settings
 
 
@@ -27,11 +32,18 @@ class PlayersHandler:
     Based on the original JavaScript PlayersHandler.js
     """
     
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, ignore_list: Optional[IgnoreList] = None):
         self.settings = settings
+        self.ignore_list = ignore_list
+        self._ignore_version = ignore_list.version if ignore_list is not None else 0
         self.players: Dict[int, Player] = {}
+        self.grid = SpatialGrid()
+        self.proximity: Optional[ProximityEngine] = None
+        self.motion: Optional[MotionTracker] = None
+        # Called with the id of every player updated in place (DataManager expiry)
+        self.on_activity: Optional[Callable[[int], None]] = None
         self.local_player = LocalPlayer()
-        self._last_update = time.time()
+        self._last_update = FRAME_CLOCK.now
     
     def add_player(self, pos_x: float, pos_y: float, player_id: int, 
                    nickname: str, guild_name: str = "", current_health: int = 0,
@@ -41,6 +53,9 @@ class PlayersHandler:
         
         if player_id in self.players:
             return  # Player already exists
+        
+        if self.ignore_list is not None and self.ignore_list.is_ignored(nickname, guild_name):
+            return
             
         player = Player(
             id=player_id,
@@ -50,11 +65,16 @@ class PlayersHandler:
             pos_y=pos_y,
             current_health=current_health,
             initial_health=initial_health,
-            items=items or [],
+            items=equipment_array(items),
             flag_id=flag_id
         )
         
         self.players[player_id] = player
+        self.grid.insert(player_id, pos_x, pos_y, player)
+        if self.proximity is not None:
+            self.proximity.insert(player_id, pos_x, pos_y)
+        if self.motion is not None:
+            self.motion.observe(player_id, pos_x, pos_y, FRAME_CLOCK.now)
         
         if sound and self.settings.player_sound:
             # TODO: Implement sound notification
@@ -64,6 +84,11 @@ class PlayersHandler:
         """Remove a player from tracking"""
         if player_id in self.players:
             del self.players[player_id]
+            self.grid.remove(player_id)
+            if self.proximity is not None:
+                self.proximity.remove(player_id)
+            if self.motion is not None:
+                self.motion.remove(player_id)
     
     def update_player_position(self, player_id: int, pos_x: float, pos_y: float) -> None:
         """Update player position"""
@@ -73,7 +98,13 @@ class PlayersHandler:
             player.old_pos_y = player.pos_y
             player.pos_x = pos_x
             player.pos_y = pos_y
-            player.last_update = time.time()
+            player.last_update = FRAME_CLOCK.now
+            self.grid.move(player_id, pos_x, pos_y)
+            if self.proximity is not None:
+                self.proximity.move(player_id, pos_x, pos_y)
+            if self.motion is not None:
+                self.motion.observe(player_id, pos_x, pos_y, player.last_update)
+            self._mark_active(player_id)
     
     def update_player_health(self, player_id: int, current_health: int, initial_health: int) -> None:
         """Update player health"""
@@ -81,44 +112,79 @@ class PlayersHandler:
             player = self.players[player_id]
             player.current_health = current_health
             player.initial_health = initial_health
+            player.last_update = FRAME_CLOCK.now
+            self._mark_active(player_id)
     
-    def update_player_items(self, player_id: int, items: List) -> None:
-        """Update player items"""
+    def update_player_items(self, player_id: int, items: List) -> List[int]:
+        """Update player items, returning the equipment slots that changed"""
         if player_id in self.players:
-            player = self.players[player_id]
-            player.items = items
+            self._mark_active(player_id)
+            return self.players[player_id].update_items(items)
+        return []
     
     def update_player_mounted(self, player_id: int, mounted: bool) -> None:
         """Update player mounted status"""
         if player_id in self.players:
-            player = self.players[player_id]
-            player.mounted = mounted
+            self.players[player_id].set_mounted(mounted)
+            self._mark_active(player_id)
     
     def update_local_player_position(self, pos_x: float, pos_y: float) -> None:
         """Update local player position"""
         self.local_player.pos_x = pos_x
         self.local_player.pos_y = pos_y
+        if self.motion is not None:
+            self.motion.observe(LOCAL_PLAYER_KEY, pos_x, pos_y, FRAME_CLOCK.now)
     
     def update_local_player_next_position(self, pos_x: float, pos_y: float) -> None:
         """Update local player next position for interpolation"""
         self.local_player.next_pos_x = pos_x
         self.local_player.next_pos_y = pos_y
     
-    def get_players_in_range(self, max_distance: float = 80.0) -> List[Player]:
+    def enable_proximity_engine(self) -> bool:
+        """Track player positions in a vectorized ProximityEngine (needs numpy)"""
+        if not NUMPY_AVAILABLE:
+            return False
+        if self.proximity is None:
+            self.proximity = ProximityEngine()
+            for player in self.players.values():
+                self.proximity.insert(player.id, player.pos_x, player.pos_y)
+        return True
+    
+    def enable_motion_tracking(self) -> MotionTracker:
+        """Track player velocities for dead reckoning (local player under LOCAL_PLAYER_KEY)"""
+        if self.motion is None:
+            self.motion = MotionTracker()
+            for player in self.players.values():
+                self.motion.observe(player.id, player.pos_x, player.pos_y, player.last_update)
+        return self.motion
+    
+    def get_players_in_range(self, max_distance: float = DEFAULT_RADAR_RANGE) -> List[Player]:
         """Get all players within range of local player"""
         players_in_range = []
         
-        for player in self.players.values():
-            distance = self._calculate_distance(
-                self.local_player.pos_x, self.local_player.pos_y,
-                player.pos_x, player.pos_y
-            )
-            if distance <= max_distance:
-                player.distance = int(distance)
-                players_in_range.append(player)
+        if self.proximity is not None:
+            center_x, center_y = self.local_player.pos_x, self.local_player.pos_y
+            if not self.proximity.is_current(center_x, center_y, max_distance):
+                self.proximity.compute(center_x, center_y, max_distance)
+            # Distances are only written back to the players actually returned
+            for player_id in self.proximity.sorted_in_range_ids():
+                player = self.players.get(player_id)
+                if player is not None:
+                    player.distance = int(self.proximity.distance_of(player_id))
+                    players_in_range.append(player)
+            return players_in_range
+        
+        for player, distance_sq in self.grid.query_with_distance(
+                self.local_player.pos_x, self.local_player.pos_y, max_distance):
+            player.distance = int(distance_sq ** 0.5)
+            players_in_range.append(player)
         
         return players_in_range
     
+    def get_in_range(self, center_x: float, center_y: float, radius: float) -> List[Player]:
+        """Get all players within radius of a point"""
+        return self.grid.query(center_x, center_y, radius)
+    
     def handle_new_player_event(self, parameters: Dict, is_bz: bool = False) -> None:
         """Handle new player event from packet data"""
         try:
@@ -160,9 +226,50 @@ class PlayersHandler:
         except Exception as e:
             print(f"Error handling mounted player event: {e}")
     
+    def handle_equipment_changed_event(self, parameters: Dict) -> List[int]:
+        """Handle character equipment changed event, returning the slots that changed"""
+        try:
+            return self.update_player_items(parameters.get(0), parameters.get(2, []))
+        except Exception as e:
+            print(f"Error handling equipment changed event: {e}")
+            return []
+    
+    def collect_ignored_players(self) -> List[int]:
+        """Get tracked players that became ignored since the last call"""
+        if self.ignore_list is None or self.ignore_list.version == self._ignore_version:
+            return []
+        
+        self._ignore_version = self.ignore_list.version
+        return [player_id for player_id, player in self.players.items()
+                if self.ignore_list.is_ignored(player.nickname, player.guild_name)]
+    
+    def snapshot(self) -> Tuple:
+        """Get an immutable copy of all players"""
+        return freeze_entities(self.players.values())
+    
     def clear(self) -> None:
         """Clear all players"""
         self.players.clear()
+        self.grid.clear()
+        if self.proximity is not None:
+            self.proximity.clear()
+        if self.motion is not None:
+            self.motion.clear()
+    
+    def detach(self) -> List:
+        """Swap in empty storage and return the old containers for deferred release"""
+        retired = [self.players] + self.grid.detach()
+        self.players = {}
+        if self.proximity is not None:
+            self.proximity.clear()
+        if self.motion is not None:
+            self.motion.clear()
+        return retired
+    
+    def _mark_active(self, player_id: int) -> None:
+        """Report an in-place update so the player's expiry is pushed back"""
+        if self.on_activity is not None:
+            self.on_activity(player_id)
     
     def _calculate_distance(self, x1: float, y1: float, x2: float, y2: float) -> float:
         """Calculate distance between two points"""
@@ -5,11 +5,16 @@ Handles wisp cage detection and management.
 """
 
 import time
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from dataclasses import dataclass, field
+from ..models.compact import compact
+from ..core.world_snapshot import freeze_entities
+from ..core.spatial_grid import SpatialGrid
+from ..core.entity_store import EntityStore
 from ..config.settings import Settings
 
 
+@compact
 @dataclass
 class Cage:
     """Represents a wisp cage"""
@@ -30,19 +35,21 @@ class WispCageHandler:
     
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.cages: List[Cage] = []
+        self.cages: EntityStore[Cage] = EntityStore()
+        self.grid = SpatialGrid()
     
     def add_cage(self, cage_id: int, pos_x: float, pos_y: float, name: str) -> None:
         """Add a new wisp cage"""
         cage = Cage(id=cage_id, pos_x=pos_x, pos_y=pos_y, name=name)
         
         # Check if cage already exists
-        if not any(c.id == cage_id for c in self.cages):
-            self.cages.append(cage)
+        if self.cages.add(cage_id, cage):
+            self.grid.insert(cage_id, pos_x, pos_y, cage)
     
     def remove_cage(self, cage_id: int) -> None:
         """Remove a wisp cage"""
-        self.cages = [c for c in self.cages if c.id != cage_id]
+        self.cages.remove(cage_id)
+        self.grid.remove(cage_id)
     
     def handle_new_cage_event(self, parameters: Dict) -> None:
         """Handle new cage event"""
@@ -72,8 +79,21 @@ class WispCageHandler:
     
     def get_cages_list(self) -> List[Cage]:
         """Get all wisp cages"""
-        return self.cages.copy()
+        return self.cages.to_list()
+    
+    def get_in_range(self, center_x: float, center_y: float, radius: float) -> List[Cage]:
+        """Get all wisp cages within radius of a point"""
+        return self.grid.query(center_x, center_y, radius)
+    
+    def snapshot(self) -> Tuple:
+        """Get an immutable copy of all wisp cages"""
+        return freeze_entities(self.cages.values())
     
     def clear(self) -> None:
         """Clear all wisp cages"""
-        self.cages.clear() 
\ No newline at end of file
+        self.cages.clear()
+        self.grid.clear()
+    
+    def detach(self) -> List:
+        """Swap in empty storage and return the old containers for deferred release"""
+        return [self.cages.detach()] + self.grid.detach()
\ No newline at end of file
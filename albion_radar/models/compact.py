@@ -0,0 +1,51 @@
+"""
+Compact dataclasses for Albion Radar
+
+`compact` turns a dataclass into an equivalent class with __slots__, so
+instances carry no per-instance __dict__. dataclass(slots=True) does the
+same but needs Python 3.10.
+"""
+
+from dataclasses import fields
+from typing import Tuple, Type, TypeVar
+
+
+T = TypeVar('T')
+
+
+def compact(cls: Type[T]) -> Type[T]:
+    """
+    Rebuild a dataclass with __slots__ for its fields.
+
+    The field names are also cached on the class as `__field_names__`, in
+    declaration order, for serializers that would otherwise call fields() on
+    every instance. Methods must not use zero-argument super(), which would
+    still refer to the original class. A class providing `_wrap_init` gets
+    its generated __init__ passed through it.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+
+    namespace = dict(cls.__dict__)
+    for name in field_names:
+        # Class attributes holding field defaults would clash with the slots;
+        # the generated __init__ keeps its own reference to them
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    namespace['__slots__'] = field_names
+    namespace['__field_names__'] = field_names
+    wrap_init = getattr(cls, '_wrap_init', None)
+    if wrap_init is not None and '__init__' in namespace:
+        namespace['__init__'] = wrap_init(namespace['__init__'])
+
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+def field_names(cls: type) -> Tuple[str, ...]:
+    """Get the field names of a dataclass in declaration order, cached on compact classes"""
+    names = cls.__dict__.get('__field_names__')
+    if names is None:
+        names = tuple(f.name for f in fields(cls))
+    return names
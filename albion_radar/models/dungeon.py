@@ -4,6 +4,7 @@ Dungeon model for Albion Radar
 
 from dataclasses import dataclass, field
 from typing import Dict
+from ..core.frame_clock import FRAME_CLOCK, frame_time
 
 @dataclass
 class Dungeon:
@@ -14,13 +15,13 @@ class Dungeon:
     dungeon_type: str
     pos_x: float = 0.0
     pos_y: float = 0.0
-    detected_at: float = field(default_factory=lambda: __import__('time').time())
-    last_update: float = field(default_factory=lambda: __import__('time').time())
+    detected_at: float = field(default_factory=frame_time)
+    last_update: float = field(default_factory=frame_time)
 
     def update_position(self, new_x: float, new_y: float):
         self.pos_x = new_x
         self.pos_y = new_y
-        self.last_update = __import__('time').time()
+        self.last_update = FRAME_CLOCK.now
 
     def to_dict(self) -> Dict:
         return {
@@ -28,8 +29,8 @@ class Dungeon:
             'dungeon_type': self.dungeon_type,
             'pos_x': self.pos_x,
             'pos_y': self.pos_y,
-            'detected_at': self.detected_at,
-            'last_update': self.last_update
+            'detected_at': FRAME_CLOCK.wall(self.detected_at),
+            'last_update': FRAME_CLOCK.wall(self.last_update)
         }
 
     def __str__(self) -> str:
@@ -4,21 +4,28 @@ Mob model for Albion Radar
 
 from dataclasses import dataclass, field
 from typing import Dict, Optional
+from .compact import compact
+from .versioned import Versioned
+from ..core.frame_clock import FRAME_CLOCK, frame_time
 
+@compact
 @dataclass
-class Mob:
+class Mob(Versioned):
     """
     Represents a mob detected by the radar.
     """
     id: int
     name: str
     level: int = 0
+    type_id: int = 0
+    tier: int = 0
+    enemy_type: int = 0
     pos_x: float = 0.0
     pos_y: float = 0.0
     health: Optional[int] = None
     max_health: Optional[int] = None
-    detected_at: float = field(default_factory=lambda: __import__('time').time())
-    last_update: float = field(default_factory=lambda: __import__('time').time())
+    detected_at: float = field(default_factory=frame_time)
+    last_update: float = field(default_factory=frame_time)
 
     @property
     def is_alive(self) -> bool:
@@ -35,29 +42,32 @@ class Mob:
     def update_position(self, new_x: float, new_y: float):
         self.pos_x = new_x
         self.pos_y = new_y
-        self.last_update = __import__('time').time()
+        self.last_update = FRAME_CLOCK.now
 
     def update_health(self, health: int, max_health: Optional[int] = None):
         self.health = health
         if max_health is not None:
             self.max_health = max_health
-        self.last_update = __import__('time').time()
+        self.last_update = FRAME_CLOCK.now
 
     def get_distance_to(self, x: float, y: float) -> float:
         return ((self.pos_x - x) ** 2 + (self.pos_y - y) ** 2) ** 0.5
 
-    def to_dict(self) -> Dict:
+    def _serialize(self) -> Dict:
         return {
             'id': self.id,
             'name': self.name,
             'level': self.level,
+            'type_id': self.type_id,
+            'tier': self.tier,
+            'enemy_type': self.enemy_type,
             'pos_x': self.pos_x,
             'pos_y': self.pos_y,
             'health': self.health,
             'max_health': self.max_health,
             'health_percentage': self.health_percentage,
-            'detected_at': self.detected_at,
-            'last_update': self.last_update
+            'detected_at': FRAME_CLOCK.wall(self.detected_at),
+            'last_update': FRAME_CLOCK.wall(self.last_update)
         }
 
     def __str__(self) -> str:
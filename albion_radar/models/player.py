@@ -2,9 +2,36 @@
 Player model for Albion Radar
 """
 
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional
 from enum import Enum
+from .compact import compact
+from .versioned import Versioned
+from ..core.frame_clock import FRAME_CLOCK, frame_time
+
+# Names of the leading equipment slots, in the order events list them. The
+# slot count itself comes from each event's item list; later slots are named
+# by slot_name()
+EQUIPMENT_SLOTS = ('main_hand', 'off_hand', 'head', 'armor', 'shoes', 'bag', 'cape',
+                   'mount', 'potion', 'food')
+
+# Item index of a slot with nothing equipped
+EMPTY_SLOT = 0
+
+def slot_name(slot: int) -> str:
+    """Get the name of an equipment slot index"""
+    return EQUIPMENT_SLOTS[slot] if slot < len(EQUIPMENT_SLOTS) else f"slot_{slot}"
+
+def equipment_array(items: Optional[Iterable] = None) -> array:
+    """Convert event equipment to one item index per listed slot (EMPTY_SLOT when unknown or empty)"""
+    if isinstance(items, dict):
+        # Serialized buffers arrive as {'type': 'Buffer', 'data': [...]}
+        items = items.get('data')
+    if not items:
+        return array('i')
+    return array('i', [item_id if isinstance(item_id, int) and item_id > 0 else EMPTY_SLOT
+                       for item_id in items])
 
 class PlayerFlag(Enum):
     """Player flag types"""
@@ -17,8 +44,9 @@ class PlayerFlag(Enum):
     FACTION_6 = 6
     DANGEROUS = 255
 
+@compact
 @dataclass
-class Player:
+class Player(Versioned):
     """
     Represents a player detected by the radar.
     
@@ -42,7 +70,7 @@ class Player:
     initial_health: int = 0
     
     # Equipment and status
-    items: List = field(default_factory=list)
+    items: array = field(default_factory=equipment_array)
     flag_id: int = 0
     mounted: bool = False
     
@@ -54,8 +82,13 @@ class Player:
     distance: int = 0
     
     # Timestamps
-    detected_at: float = field(default_factory=lambda: __import__('time').time())
-    last_update: float = field(default_factory=lambda: __import__('time').time())
+    detected_at: float = field(default_factory=frame_time)
+    last_update: float = field(default_factory=frame_time)
+    
+    # Bookkeeping written by movement and range queries, not part of to_dict()
+    __unversioned__ = frozenset({
+        'old_pos_x', 'old_pos_y', 'h_x', 'h_y', 'distance', 'last_update',
+    })
     
     def __post_init__(self):
         """Post-initialization setup"""
@@ -103,30 +136,39 @@ class Player:
         self.old_pos_y = self.pos_y
         self.pos_x = new_x
         self.pos_y = new_y
-        self.last_update = __import__('time').time()
+        self.last_update = FRAME_CLOCK.now
     
     def update_health(self, current: int, initial: Optional[int] = None):
         """Update player health"""
         self.current_health = current
         if initial is not None:
             self.initial_health = initial
-        self.last_update = __import__('time').time()
-    
-    def update_items(self, items: List):
-        """Update player items"""
-        self.items = items
-        self.last_update = __import__('time').time()
+        self.last_update = FRAME_CLOCK.now
+    
+    def update_items(self, items: Iterable) -> List[int]:
+        """Update player items, returning the slots that changed"""
+        equipment = equipment_array(items)
+        current = self.items
+        changed = [slot for slot in range(max(len(current), len(equipment)))
+                   if (current[slot] if slot < len(current) else EMPTY_SLOT)
+                   != (equipment[slot] if slot < len(equipment) else EMPTY_SLOT)]
+        if changed or len(equipment) != len(current):
+            # A new array rather than writes in place: snapshots share the old one
+            self.items = equipment
+        if changed:
+            self.last_update = FRAME_CLOCK.now
+        return changed
     
     def set_mounted(self, mounted: bool):
         """Set mounted status"""
         self.mounted = mounted
-        self.last_update = __import__('time').time()
+        self.last_update = FRAME_CLOCK.now
     
     def get_distance_to(self, x: float, y: float) -> float:
         """Calculate distance to a point"""
         return ((self.pos_x - x) ** 2 + (self.pos_y - y) ** 2) ** 0.5
     
-    def to_dict(self) -> Dict:
+    def _serialize(self) -> Dict:
         """Convert to dictionary"""
         return {
             'id': self.id,
@@ -141,9 +183,9 @@ class Player:
             'flag_id': self.flag_id,
             'flag_type': self.flag_type.name,
             'mounted': self.mounted,
-            'items': self.items,
-            'detected_at': self.detected_at,
-            'last_update': self.last_update
+            'items': self.items.tolist(),
+            'detected_at': FRAME_CLOCK.wall(self.detected_at),
+            'last_update': FRAME_CLOCK.wall(self.last_update)
         }
     
     def __str__(self) -> str:
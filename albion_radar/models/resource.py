@@ -5,6 +5,9 @@ Resource model for Albion Radar
 from dataclasses import dataclass, field
 from typing import Dict, Optional
 from enum import Enum
+from .compact import compact
+from .versioned import Versioned
+from ..core.frame_clock import FRAME_CLOCK, frame_time
 
 class ResourceType(Enum):
     """Resource types"""
@@ -24,8 +27,9 @@ class ResourceEnchant(Enum):
     EXCEPTIONAL = 3
     MASTERWORK = 4
 
+@compact
 @dataclass
-class Resource:
+class Resource(Versioned):
     """
     Represents a resource detected by the radar.
     
@@ -52,8 +56,8 @@ class Resource:
     max_health: Optional[int] = None
     
     # Timestamps
-    detected_at: float = field(default_factory=lambda: __import__('time').time())
-    last_update: float = field(default_factory=lambda: __import__('time').time())
+    detected_at: float = field(default_factory=frame_time)
+    last_update: float = field(default_factory=frame_time)
     
     @property
     def is_alive(self) -> bool:
@@ -85,25 +89,25 @@ class Resource:
         """Update resource position"""
         self.pos_x = new_x
         self.pos_y = new_y
-        self.last_update = __import__('time').time()
+        self.last_update = FRAME_CLOCK.now
     
     def update_health(self, health: int, max_health: Optional[int] = None):
         """Update resource health (for living resources)"""
         self.health = health
         if max_health is not None:
             self.max_health = max_health
-        self.last_update = __import__('time').time()
+        self.last_update = FRAME_CLOCK.now
     
     def mark_harvested(self):
         """Mark resource as harvested"""
         self.is_harvested = True
-        self.last_update = __import__('time').time()
+        self.last_update = FRAME_CLOCK.now
     
     def get_distance_to(self, x: float, y: float) -> float:
         """Calculate distance to a point"""
         return ((self.pos_x - x) ** 2 + (self.pos_y - y) ** 2) ** 0.5
     
-    def to_dict(self) -> Dict:
+    def _serialize(self) -> Dict:
         """Convert to dictionary"""
         return {
             'id': self.id,
@@ -121,8 +125,8 @@ class Resource:
             'health_percentage': self.health_percentage,
             'full_name': self.full_name,
             'display_name': self.display_name,
-            'detected_at': self.detected_at,
-            'last_update': self.last_update
+            'detected_at': FRAME_CLOCK.wall(self.detected_at),
+            'last_update': FRAME_CLOCK.wall(self.last_update)
         }
     
     def __str__(self) -> str:
@@ -0,0 +1,98 @@
+"""
+Versioned entities for Albion Radar
+
+`Versioned` stamps every field assignment that changes a serialized value
+with a new version and caches the entity's serialized form against it, so
+to_dict() only rebuilds the dictionary after something changed. The cache
+is shared with copies made by copy.copy(), which is how snapshots freeze
+entities every tick.
+"""
+
+import functools
+import itertools
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+
+_set_attribute = object.__setattr__
+
+# Versions come from one process-wide counter, so two entities sharing a
+# cache (a copy and its original, or a pooled instance reused for another
+# entity) can never change into different contents with the same version
+_next_version = itertools.count(1).__next__
+
+_MISSING = object()
+
+# Version held while __init__ assigns the fields; real versions start at 1
+_INITIALIZING = 0
+
+
+class Versioned(ABC):
+    """
+    Mixin for compact dataclasses with a change version and a cached to_dict().
+
+    Subclasses implement _serialize(). In-place changes that bypass attribute
+    assignment (e.g. writing into a mutable field) must call touch(). Fields
+    named in __unversioned__ never bump the version: they are either left out
+    of _serialize() or, like last_update, only worth re-serializing together
+    with a change to a versioned field.
+
+    Subclasses must be decorated with @compact, which wraps the generated
+    __init__ so a construction takes one version rather than one per field.
+    """
+
+    __slots__ = ('version', '_serialized')
+
+    __unversioned__ = frozenset({'last_update'})
+
+    @staticmethod
+    def _wrap_init(init):
+        """Wrap a dataclass __init__ to version the instance once, after every field is set"""
+        @functools.wraps(init)
+        def __init__(self, *args, **kwargs):
+            _set_attribute(self, 'version', _INITIALIZING)
+            init(self, *args, **kwargs)
+            _set_attribute(self, 'version', _next_version())
+            # A pooled instance reinitialized for another entity leaves the
+            # old cache to the snapshots still holding copies of it
+            _set_attribute(self, '_serialized', [None])
+        return __init__
+
+    def __setattr__(self, name: str, value) -> None:
+        if self.version == _INITIALIZING:
+            _set_attribute(self, name, value)
+            return
+        old = getattr(self, name, _MISSING)
+        _set_attribute(self, name, value)
+        if name in self.__unversioned__ or old is value or old == value:
+            return
+        _set_attribute(self, 'version', _next_version())
+
+    def __copy__(self):
+        cls = type(self)
+        clone = object.__new__(cls)
+        for name in cls.__field_names__:
+            _set_attribute(clone, name, getattr(self, name))
+        _set_attribute(clone, 'version', self.version)
+        # Shared, so a copy serialized once serves every copy of this version
+        _set_attribute(clone, '_serialized', self._serialized)
+        return clone
+
+    def touch(self) -> None:
+        """Record a change made without assigning a field"""
+        _set_attribute(self, 'version', _next_version())
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary, reusing the last one if nothing changed (do not mutate it)"""
+        box: List[Optional[tuple]] = self._serialized
+        cached = box[0]
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        data = self._serialize()
+        # One tuple assignment, so threads sharing the box never see a torn entry
+        box[0] = (self.version, data)
+        return data
+
+    @abstractmethod
+    def _serialize(self) -> Dict:
+        """Build the dictionary returned by to_dict()"""
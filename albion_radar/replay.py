@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Replay harness for Albion Radar
+
+Drives DataManager.process_packet_data from a recorded event journal (or a
+pcap capture) as fast as possible and reports throughput, per-handler time,
+peak entity counts, peak RSS and a hash of the final world state.
+
+Usage:
+    python -m albion_radar.replay session.arj
+    python -m albion_radar.replay capture.pcap --pcap
+    python -m albion_radar.replay session.arj --repeat 3 --json
+
+replay() points the shared FRAME_CLOCK at recorded time while it runs, so it
+must not run in a process that also hosts a live radar.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .core.data_manager import DataManager
+from .core.event_journal import journal_files, read_journal
+from .core.frame_clock import FRAME_CLOCK
+from .core.ignore_list import IgnoreList
+from .core.photon_parser import PhotonParser
+from .config.settings import Settings
+
+
+# Handler that DataManager routes each event code to
+HANDLER_BY_EVENT_CODE = {
+    1: 'players',
+    2: 'harvestables',
+    3: 'mobs',
+    4: 'chests',
+    5: 'dungeons',
+    6: 'fishing',
+    7: 'wisp_cage',
+    8: 'players'
+}
+
+# Fields that depend on when the replay ran rather than on the events
+VOLATILE_FIELDS = ('detected_at', 'last_update', 'timestamp', 'sequence')
+
+ALBION_PORT = 5056
+
+
+class ReplayClock:
+    """Clock driven by recorded event timestamps instead of the wall clock"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def iter_journal(path: str) -> Iterator[Tuple[float, Dict]]:
+    """Yield (timestamp, packet_data) from a journal and its rotated backups"""
+    files = journal_files(path) or [path]
+    for file_path in files:
+        yield from read_journal(file_path)
+
+
+def iter_pcap(path: str, port: int = ALBION_PORT) -> Iterator[Tuple[float, Dict]]:
+    """Yield (timestamp, packet_data) by parsing the Photon traffic in a pcap"""
+    try:
+        from scapy.all import PcapReader, UDP
+    except ImportError:
+        raise RuntimeError("scapy is required to replay pcap files (pip install scapy)")
+
+    parser = PhotonParser()
+    with PcapReader(path) as reader:
+        for packet in reader:
+            if UDP not in packet:
+                continue
+            udp = packet[UDP]
+            if port not in (udp.sport, udp.dport):
+                continue
+            packet_data = parser.parse_packet(bytes(udp.payload))
+            if packet_data:
+                yield float(packet.time), packet_data
+
+
+def peak_rss_bytes() -> int:
+    """Get the peak resident set size of this process"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS bytes
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except ImportError:
+        pass
+
+    try:
+        import psutil
+        memory = psutil.Process().memory_info()
+        return getattr(memory, 'peak_wset', memory.rss)
+    except ImportError:
+        return 0
+
+
+def world_state_hash(data_manager: DataManager) -> str:
+    """Hash the current world state, ignoring wall-clock dependent fields"""
+    # Serialized entities are cached and shared, so filter into new dicts
+    state = {}
+    for key, value in data_manager.get_snapshot().to_dict().items():
+        if key in VOLATILE_FIELDS:
+            continue
+        if isinstance(value, list):
+            value = sorted(({name: field_value for name, field_value in entity.items()
+                             if name not in VOLATILE_FIELDS} for entity in value),
+                           key=lambda entity: str(entity.get('id')))
+        state[key] = value
+
+    encoded = json.dumps(state, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def replay(events: List[Tuple[float, Dict]], settings: Optional[Settings] = None,
+           tick_interval: float = 0.05, ignore_list: Optional[IgnoreList] = None,
+           dead_reckoning: bool = False) -> Dict:
+    """
+    Replay recorded events through a fresh DataManager.
+
+    Events are grouped into ticks of `tick_interval` seconds of recorded time;
+    end_tick() runs at every tick boundary, as it would during capture.
+    Without an `ignore_list` nothing is ignored and no ignore_list.json is
+    read, so results do not depend on the working directory.
+    `dead_reckoning` turns on velocity tracking, to measure what it costs.
+
+    The shared FRAME_CLOCK follows the recorded time until the replay
+    returns; do not call this while a live radar runs in the same process.
+    """
+    if ignore_list is None:
+        ignore_list = IgnoreList(path=None)
+    # Entity timestamps and TTLs follow the recorded time
+    clock = ReplayClock(events[0][0] if events else 0.0)
+    FRAME_CLOCK.set_source(clock)
+    try:
+        data_manager = DataManager(settings or Settings(), ignore_list=ignore_list,
+                                   dead_reckoning=dead_reckoning)
+        return _replay(events, data_manager, clock, tick_interval)
+    finally:
+        FRAME_CLOCK.reset()
+
+
+def _replay(events: List[Tuple[float, Dict]], data_manager: DataManager,
+            clock: ReplayClock, tick_interval: float) -> Dict:
+    """Replay loop of replay(), run with the frame clock on recorded time"""
+    handler_time: Dict[str, float] = {}
+    handler_events: Dict[str, int] = {}
+    peak_counts: Dict[str, int] = {}
+    tick_time = 0.0
+    ticks = 0
+
+    perf_counter = time.perf_counter
+    tick_end = clock.now + tick_interval
+    started = perf_counter()
+
+    for timestamp, packet_data in events:
+        if timestamp >= tick_end:
+            tick_started = perf_counter()
+            snapshot = data_manager.end_tick()
+            tick_time += perf_counter() - tick_started
+            ticks += 1
+            _update_peaks(peak_counts, snapshot)
+            tick_end = timestamp + tick_interval
+
+        clock.now = timestamp
+        code = packet_data.get('code', 0) if packet_data.get('type') == 'event' else None
+        handler = HANDLER_BY_EVENT_CODE.get(code, 'other')
+
+        event_started = perf_counter()
+        data_manager.process_packet_data(packet_data)
+        elapsed = perf_counter() - event_started
+
+        handler_time[handler] = handler_time.get(handler, 0.0) + elapsed
+        handler_events[handler] = handler_events.get(handler, 0) + 1
+
+    tick_started = perf_counter()
+    snapshot = data_manager.end_tick()
+    tick_time += perf_counter() - tick_started
+    ticks += 1
+    _update_peaks(peak_counts, snapshot)
+
+    elapsed = perf_counter() - started
+    return {
+        'events': len(events),
+        'ticks': ticks,
+        'seconds': elapsed,
+        'events_per_second': len(events) / elapsed if elapsed > 0 else 0.0,
+        'recorded_seconds': (events[-1][0] - events[0][0]) if events else 0.0,
+        'handler_seconds': handler_time,
+        'handler_events': handler_events,
+        'tick_seconds': tick_time,
+        'peak_entities': peak_counts,
+        'peak_rss_bytes': peak_rss_bytes(),
+        'world_hash': world_state_hash(data_manager)
+    }
+
+
+def _update_peaks(peak_counts: Dict[str, int], snapshot) -> None:
+    """Track the largest entity count seen per kind"""
+    for kind in ('players', 'resources', 'mobs', 'mists', 'chests', 'dungeons', 'fishes', 'cages'):
+        count = len(getattr(snapshot, kind))
+        if count > peak_counts.get(kind, 0):
+            peak_counts[kind] = count
+
+
+def print_report(result: Dict, load_seconds: float) -> None:
+    """Print a human readable replay report"""
+    print(f"Events:          {result['events']} in {result['ticks']} ticks "
+          f"({result['recorded_seconds']:.1f}s recorded, loaded in {load_seconds:.2f}s)")
+    print(f"Replay time:     {result['seconds']:.3f}s")
+    print(f"Throughput:      {result['events_per_second']:,.0f} events/s")
+    print(f"Tick time:       {result['tick_seconds'] * 1000:.1f} ms total")
+    print("Handler time:")
+    for handler, seconds in sorted(result['handler_seconds'].items(), key=lambda item: -item[1]):
+        count = result['handler_events'][handler]
+        print(f"  {handler:<14} {seconds * 1000:9.1f} ms  {count:8} events  "
+              f"{seconds / count * 1e6:7.2f} us/event")
+    print("Peak entities:")
+    for kind, count in result['peak_entities'].items():
+        print(f"  {kind:<14} {count}")
+    print(f"Peak RSS:        {result['peak_rss_bytes'] / (1024 * 1024):.1f} MiB")
+    print(f"World hash:      {result['world_hash']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Replay a recorded radar session through the handlers")
+    parser.add_argument('path', help="event journal (or pcap with --pcap)")
+    parser.add_argument('--pcap', action='store_true', help="input is a pcap capture")
+    parser.add_argument('--port', type=int, default=ALBION_PORT, help="Photon UDP port in the pcap")
+    parser.add_argument('--tick', type=float, default=0.05, help="tick length in recorded seconds")
+    parser.add_argument('--repeat', type=int, default=1, help="number of runs (hashes must match)")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    parser.add_argument('--dead-reckoning', action='store_true', help="track velocities while replaying")
+    args = parser.parse_args(argv)
+
+    load_started = time.perf_counter()
+    source = iter_pcap(args.path, args.port) if args.pcap else iter_journal(args.path)
+    events = list(source)
+    load_seconds = time.perf_counter() - load_started
+
+    results = [replay(events, tick_interval=args.tick, dead_reckoning=args.dead_reckoning)
+               for _ in range(max(1, args.repeat))]
+    deterministic = len({result['world_hash'] for result in results}) == 1
+
+    if args.json:
+        print(json.dumps({
+            'load_seconds': load_seconds,
+            'deterministic': deterministic,
+            'runs': results
+        }, indent=2))
+    else:
+        for index, result in enumerate(results, 1):
+            if len(results) > 1:
+                print(f"--- Run {index} ---")
+            print_report(result, load_seconds)
+        if len(results) > 1:
+            print(f"Deterministic:   {'yes' if deterministic else 'NO'}")
+
+    return 0 if deterministic else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,8 @@
+"""
+Build tools for Albion Radar
+
+Compile steps that turn the data tables shipped with the JavaScript radar
+into compact files under albion_radar/data. Run them as modules, for example:
+
+    python -m albion_radar.tools.compile_mobs_info
+"""
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Items compiler
+
+Compiles scripts/Handlers/items.txt into items.bin, a binary item table
+that ItemsInfo memory-maps instead of parsing the text on every start. The
+table lives in the user cache directory (see user_cache_dir()), never in
+the installed package.
+
+File layout::
+
+    header : MAGIC (4 bytes) + table size (uint32) + blob offset (uint32)
+    index  : one entry per item id, 0 <= id < table size
+    entry  : blob offset (uint32) + unique name length (uint16)
+             + display name length (uint16)
+    blob   : UTF-8 unique name immediately followed by the display name
+
+Ids missing from items.txt have an all-zero entry. All integers are little
+endian.
+
+Usage:
+    python -m albion_radar.tools.compile_items
+    python -m albion_radar.tools.compile_items --source items.txt --output items.bin
+"""
+
+import argparse
+import os
+import re
+import struct
+import sys
+from typing import Dict, List, Optional, Tuple
+
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SOURCE = os.path.join(os.path.dirname(PACKAGE_DIR), 'scripts', 'Handlers', 'items.txt')
+
+
+def user_cache_dir() -> str:
+    """Per-user cache directory for generated data (%LOCALAPPDATA%, ~/Library/Caches or XDG)"""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+    elif sys.platform == 'darwin':
+        base = os.path.join(os.path.expanduser('~'), 'Library', 'Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'albion_radar')
+
+
+def default_output() -> str:
+    """Default items.bin path, read from the environment on every call"""
+    return os.path.join(user_cache_dir(), 'items.bin')
+
+MAGIC = b'ARI1'
+HEADER = struct.Struct('<4sII')
+ENTRY = struct.Struct('<IHH')
+
+# "  12: T4_BAG     : Adept's Bag"
+_ITEM_LINE = re.compile(r'^\s*(\d+):\s+(\S+)\s*(?::\s*(.*?))?\s*$')
+
+
+def parse_items(text: str) -> Dict[int, Tuple[str, str]]:
+    """Parse items.txt into {item id: (unique name, display name)}"""
+    items: Dict[int, Tuple[str, str]] = {}
+    for line in text.splitlines():
+        match = _ITEM_LINE.match(line)
+        if match:
+            items[int(match.group(1))] = (match.group(2), match.group(3) or '')
+    return items
+
+
+def build_table(items: Dict[int, Tuple[str, str]]) -> bytes:
+    """Encode parsed items into the binary table format"""
+    size = max(items) + 1 if items else 0
+    blob_offset = HEADER.size + size * ENTRY.size
+
+    index = bytearray(size * ENTRY.size)
+    blob = bytearray()
+    for item_id in sorted(items):
+        unique_name, display_name = (name.encode('utf-8') for name in items[item_id])
+        if len(unique_name) > 0xFFFF or len(display_name) > 0xFFFF:
+            raise ValueError(f"Item {item_id} name is too long")
+        ENTRY.pack_into(index, item_id * ENTRY.size, len(blob), len(unique_name), len(display_name))
+        blob += unique_name
+        blob += display_name
+
+    return HEADER.pack(MAGIC, size, blob_offset) + bytes(index) + bytes(blob)
+
+
+def compile_items(source_path: str = DEFAULT_SOURCE, output_path: Optional[str] = None) -> int:
+    """Compile items.txt to the binary item table (default_output()), returning the item count"""
+    output_path = output_path or default_output()
+    with open(source_path, 'r', encoding='utf-8-sig') as source_file:
+        items = parse_items(source_file.read())
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    temp_path = output_path + '.tmp'
+    with open(temp_path, 'wb') as output_file:
+        output_file.write(build_table(items))
+    os.replace(temp_path, output_path)
+    return len(items)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Compile items.txt into the binary item table")
+    parser.add_argument('--source', default=DEFAULT_SOURCE, help="path to items.txt")
+    parser.add_argument('--output', default=default_output(), help="binary table path")
+    args = parser.parse_args(argv)
+
+    count = compile_items(args.source, args.output)
+    print(f"Compiled {count} items into {args.output} ({os.path.getsize(args.output)} bytes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+MobsInfo compiler
+
+Compiles the addItem() table in scripts/Handlers/MobsInfo.js into
+albion_radar/data/mobs_db.py: byte strings indexed by numeric mob type id
+holding the tier, category and name of every listed mob. Entries inside
+comments are skipped and later entries for the same id win, as in the
+JavaScript.
+
+Usage:
+    python -m albion_radar.tools.compile_mobs_info
+    python -m albion_radar.tools.compile_mobs_info --source MobsInfo.js --output mobs_db.py
+"""
+
+import argparse
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SOURCE = os.path.join(os.path.dirname(PACKAGE_DIR), 'scripts', 'Handlers', 'MobsInfo.js')
+DEFAULT_OUTPUT = os.path.join(PACKAGE_DIR, 'data', 'mobs_db.py')
+
+# EnemyType in MobsHandler.js, in numeric order
+CATEGORY_NAMES = (
+    'LivingHarvestable',
+    'LivingSkinnable',
+    'Enemy',
+    'MediumEnemy',
+    'EnchantedEnemy',
+    'MiniBoss',
+    'Boss',
+    'Drone',
+    'MistBoss',
+    'Events'
+)
+
+# Category byte of type ids that are not listed
+UNKNOWN = 0xFF
+
+_TOKEN = re.compile(r'//[^\n]*|/\*.*?\*/|"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'', re.S)
+_ADD_ITEM = re.compile(
+    r'this\.addItem\(\s*(\d+)\s*,\s*(\d+)\s*,\s*EnemyType\.(\w+)\s*,\s*"([^"]*)"\s*\)'
+)
+
+_HEX_LINE = 96
+
+
+def strip_comments(source: str) -> str:
+    """Remove // and /* */ comments, leaving string literals intact"""
+    def replace(match: 're.Match') -> str:
+        token = match.group(0)
+        return token if token[0] in '"\'' else ''
+    return _TOKEN.sub(replace, source)
+
+
+def parse_mobs_info(source: str) -> Dict[int, Tuple[int, int, str]]:
+    """Parse MobsInfo.js into {type id: (tier, category, name)}"""
+    mobs: Dict[int, Tuple[int, int, str]] = {}
+    for type_id, tier, category, name in _ADD_ITEM.findall(strip_comments(source)):
+        if category not in CATEGORY_NAMES:
+            raise ValueError(f"Unknown EnemyType.{category} for mob {type_id}")
+        mobs[int(type_id)] = (int(tier), CATEGORY_NAMES.index(category), name)
+    return mobs
+
+
+def _hex_literal(data: bytes, indent: str = '    ') -> str:
+    """Format bytes as a wrapped bytes.fromhex() call"""
+    text = data.hex()
+    lines = [f"{indent}'{text[start:start + _HEX_LINE]}'" for start in range(0, len(text), _HEX_LINE)]
+    return 'bytes.fromhex(\n' + '\n'.join(lines or [f"{indent}''"]) + '\n)'
+
+
+def render_module(mobs: Dict[int, Tuple[int, int, str]], source_name: str) -> str:
+    """Render the generated mobs_db module"""
+    size = max(mobs) + 1 if mobs else 0
+    names: List[str] = [''] + sorted({name for _, _, name in mobs.values()} - {''})
+    name_index = {name: index for index, name in enumerate(names)}
+    if len(names) > 0xFFFF:
+        raise ValueError("Too many distinct mob names for a 16 bit index")
+
+    tiers = bytearray(size)
+    categories = bytearray([UNKNOWN]) * size
+    name_ids = bytearray(size * 2)
+    for type_id, (tier, category, name) in mobs.items():
+        tiers[type_id] = tier
+        categories[type_id] = category
+        name_ids[type_id * 2:type_id * 2 + 2] = name_index[name].to_bytes(2, 'little')
+
+    name_lines = '\n'.join(f"    {name!r}," for name in names)
+    category_lines = '\n'.join(f"    {name!r}," for name in CATEGORY_NAMES)
+    return f'''"""
+Mob Database for Albion Radar
+
+Generated from {source_name} by
+    python -m albion_radar.tools.compile_mobs_info
+Do not edit by hand.
+"""
+
+# EnemyType of MobsInfo.js, indexed by category byte
+CATEGORY_NAMES = (
+{category_lines}
+)
+
+# Category byte of type ids that are not listed
+UNKNOWN = {UNKNOWN}
+
+MOB_COUNT = {len(mobs)}
+
+# Every table below is indexed by mob type id, 0 <= type id < TABLE_SIZE
+TABLE_SIZE = {size}
+
+# Tier (0 if not listed)
+TIERS = {_hex_literal(bytes(tiers))}
+
+# Category byte, see CATEGORY_NAMES
+CATEGORIES = {_hex_literal(bytes(categories))}
+
+# Little endian 16 bit index into NAMES, two bytes per type id
+NAME_INDEX = {_hex_literal(bytes(name_ids))}
+
+NAMES = (
+{name_lines}
+)
+'''
+
+
+def compile_mobs_info(source_path: str = DEFAULT_SOURCE, output_path: str = DEFAULT_OUTPUT) -> int:
+    """Compile MobsInfo.js to the mobs_db module, returning the mob count"""
+    with open(source_path, 'r', encoding='utf-8-sig') as source_file:
+        mobs = parse_mobs_info(source_file.read())
+
+    module = render_module(mobs, os.path.basename(source_path))
+
+    temp_path = output_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8', newline='\n') as output_file:
+        output_file.write(module)
+    os.replace(temp_path, output_path)
+    return len(mobs)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Compile MobsInfo.js into albion_radar/data/mobs_db.py")
+    parser.add_argument('--source', default=DEFAULT_SOURCE, help="path to MobsInfo.js")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="generated module path")
+    args = parser.parse_args(argv)
+
+    count = compile_mobs_info(args.source, args.output)
+    print(f"Compiled {count} mobs into {args.output}")
+
+
+if __name__ == '__main__':
+    main()
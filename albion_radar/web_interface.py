@@ -16,6 +16,10 @@ import time
 from datetime import datetime
 
 from .core.network_adapter import NetworkAdapterSelector
+from .core.item_search import ItemSearchIndex, DEFAULT_PAGE_SIZE
+from .core.ignore_list import IgnoreList, IGNORE_LIST_FILE
+from .handlers.items_info import ItemsInfo
+from .models.player import slot_name
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -25,6 +29,61 @@ app = Flask(__name__)
 app.config['SECRET_KEY'] = 'albion_radar_secret_key_2024'
 socketio = SocketIO(app, cors_allowed_origins="*")
 
+# Data manager feeding live radar data (set by the capture side)
+data_manager = None
+
+def attach_data_manager(manager):
+    """Attach the DataManager whose snapshots are served to clients"""
+    global data_manager, ignore_list
+    data_manager = manager
+    # Share the manager's ignore list so edits apply to player ingestion
+    ignore_list = manager.ignore_list
+
+def build_radar_data():
+    """Build radar data from the latest published world snapshot"""
+    if data_manager is None:
+        return {
+            'players': [],
+            'mobs': [],
+            'resources': [],
+            'chests': [],
+            'dungeons': [],
+            'fishing_spots': [],
+            'wisp_cages': [],
+            'timestamp': datetime.now().isoformat()
+        }
+    
+    # Snapshots are immutable, so no lock is needed against the capture thread
+    world = data_manager.get_snapshot()
+    snapshot = world.to_dict()
+    radar_data = {
+        'players': snapshot['players'],
+        'mobs': snapshot['mobs'],
+        'resources': snapshot['resources'],
+        'chests': snapshot['chests'],
+        'dungeons': snapshot['dungeons'],
+        'fishing_spots': snapshot['fishes'],
+        'wisp_cages': snapshot['cages'],
+        'timestamp': datetime.fromtimestamp(snapshot['timestamp']).isoformat()
+    }
+    # Velocities for client-side extrapolation (AlbionRadar(dead_reckoning=True))
+    if data_manager.dead_reckoning:
+        radar_data['motion'] = world.motion_dict()
+    return radar_data
+
+# Item search index, built on first use (takes about half a second)
+item_search_index = None
+item_search_lock = threading.Lock()
+
+def get_item_search_index():
+    """Get the item search index, building it on first use"""
+    global item_search_index
+    with item_search_lock:
+        if item_search_index is None:
+            items_info = data_manager.items_info if data_manager is not None else ItemsInfo()
+            item_search_index = ItemSearchIndex.from_items_info(items_info)
+        return item_search_index
+
 # Settings file path
 SETTINGS_FILE = 'radar_settings.json'
 
@@ -47,27 +106,11 @@ def save_settings(settings):
     except:
         return False
 
-# Ignore list file path
-IGNORE_LIST_FILE = 'ignore_list.json'
+# Ignore list, read from disk once and only written on changes
+ignore_list = IgnoreList(IGNORE_LIST_FILE)
 
-def load_ignore_list():
-    """Load ignore list from JSON file"""
-    if os.path.exists(IGNORE_LIST_FILE):
-        try:
-            with open(IGNORE_LIST_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            pass
-    return {'players': [], 'guilds': []}
-
-def save_ignore_list(ignore_list):
-    """Save ignore list to JSON file"""
-    try:
-        with open(IGNORE_LIST_FILE, 'w') as f:
-            json.dump(ignore_list, f, indent=2)
-        return True
-    except:
-        return False
+# Request types of the ignore list API, by ignore list section
+IGNORE_LIST_KINDS = {'player': 'players', 'guild': 'guilds'}
 
 @app.route('/')
 def index():
@@ -124,28 +167,23 @@ def update_settings():
     """Update settings"""
     settings = request.json
     if save_settings(settings):
+        if data_manager is not None:
+            data_manager.settings_changed()
         return jsonify({'status': 'success'})
     return jsonify({'status': 'error'}), 500
 
 @app.route('/api/ignore-list', methods=['GET'])
 def get_ignore_list():
     """Get ignore list"""
-    return jsonify(load_ignore_list())
+    return jsonify(ignore_list.to_dict())
 
 @app.route('/api/ignore-list', methods=['POST'])
 def add_to_ignore_list():
     """Add item to ignore list"""
     data = request.json
-    ignore_list = load_ignore_list()
+    kind = IGNORE_LIST_KINDS.get(data['type'])
     
-    if data['type'] == 'player':
-        if data['name'] not in ignore_list['players']:
-            ignore_list['players'].append(data['name'])
-    elif data['type'] == 'guild':
-        if data['name'] not in ignore_list['guilds']:
-            ignore_list['guilds'].append(data['name'])
-    
-    if save_ignore_list(ignore_list):
+    if kind is None or ignore_list.add(kind, data['name']):
         return jsonify({'status': 'success'})
     return jsonify({'status': 'error'}), 500
 
@@ -153,35 +191,71 @@ def add_to_ignore_list():
 def remove_from_ignore_list():
     """Remove item from ignore list"""
     data = request.json
-    ignore_list = load_ignore_list()
-    
-    if data['type'] == 'player':
-        if data['index'] < len(ignore_list['players']):
-            ignore_list['players'].pop(data['index'])
-    elif data['type'] == 'guild':
-        if data['index'] < len(ignore_list['guilds']):
-            ignore_list['guilds'].pop(data['index'])
+    kind = IGNORE_LIST_KINDS.get(data['type'])
     
-    if save_ignore_list(ignore_list):
+    if kind is None or ignore_list.remove_at(kind, data['index']):
         return jsonify({'status': 'success'})
     return jsonify({'status': 'error'}), 500
 
 @app.route('/api/radar-data')
 def get_radar_data():
     """Get current radar data"""
-    # This would be connected to the actual radar data
-    # For now, return sample data
+    return jsonify(build_radar_data())
+
+@app.route('/api/mobs/delta')
+def get_mob_delta():
+    """Mob changes since the client's snapshot, e.g. /api/mobs/delta?sequence=41&generation=2"""
+    if data_manager is None:
+        return jsonify({'status': 'error', 'message': 'Radar not running'}), 503
+    snapshot = data_manager.get_snapshot()
+    try:
+        sequence = int(request.args.get('sequence', -1))
+        generation = int(request.args.get('generation', -1))
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    if sequence == snapshot.sequence and generation == snapshot.generation:
+        return jsonify({'sequence': sequence, 'generation': generation, 'changed': [], 'removed': []})
+    if snapshot.mob_delta_applies(sequence, generation):
+        return jsonify(snapshot.mob_delta())
+    # Missed a snapshot or changed zone: resynchronize with the full list
     return jsonify({
-        'players': [],
-        'mobs': [],
-        'resources': [],
-        'chests': [],
-        'dungeons': [],
-        'fishing_spots': [],
-        'wisp_cages': [],
-        'timestamp': datetime.now().isoformat()
+        'sequence': snapshot.sequence,
+        'generation': snapshot.generation,
+        'full': True,
+        'mobs': snapshot.to_dict()['mobs']
     })
 
+@app.route('/api/players/<int:player_id>/equipment')
+def get_player_equipment(player_id):
+    """Resolve a player's equipment for the gear panel (radar data only carries item ids)"""
+    if data_manager is not None:
+        for player in data_manager.get_snapshot().players:
+            if player.id == player_id:
+                items = data_manager.items_info.describe_equipment(player.items)
+                return jsonify({
+                    'player_id': player_id,
+                    'slots': [{'slot': slot_name(slot), 'item': item} for slot, item in enumerate(items)]
+                })
+    return jsonify({'status': 'error', 'message': 'Player not found'}), 404
+
+@app.route('/api/items/search')
+def search_items():
+    """Search items by name, e.g. /api/items/search?q=bag&mode=prefix&tier=4,5"""
+    try:
+        tier = request.args.get('tier', '')
+        tiers = [int(value) for value in tier.split(',') if value.strip()] or None
+        offset = int(request.args.get('offset', 0))
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+        return jsonify(get_item_search_index().search(
+            request.args.get('q', ''),
+            request.args.get('mode', 'substring'),
+            tiers,
+            offset,
+            limit
+        ))
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
 @socketio.on('connect')
 def handle_connect():
     """Handle client connection"""
@@ -196,17 +270,7 @@ def handle_disconnect():
 @socketio.on('request_data')
 def handle_data_request():
     """Handle data request from client"""
-    # This would send actual radar data
-    emit('radar_data', {
-        'players': [],
-        'mobs': [],
-        'resources': [],
-        'chests': [],
-        'dungeons': [],
-        'fishing_spots': [],
-        'wisp_cages': [],
-        'timestamp': datetime.now().isoformat()
-    })
+    emit('radar_data', build_radar_data())
 
 if __name__ == '__main__':
     print("🚀 Starting Albion Radar Web Interface...")
@@ -0,0 +1,38 @@
+"""
+Shared fixtures for the Albion Radar tests
+"""
+
+import pytest
+
+from albion_radar.core.frame_clock import FRAME_CLOCK
+from albion_radar.core.ignore_list import IgnoreList
+from albion_radar.replay import ReplayClock
+from albion_radar.config.settings import Settings
+
+
+@pytest.fixture(autouse=True, scope='session')
+def user_cache(tmp_path_factory):
+    """Keep generated data (items.bin) out of the real user cache directory"""
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv('XDG_CACHE_HOME', str(tmp_path_factory.mktemp('cache')))
+        yield
+
+
+@pytest.fixture
+def clock():
+    """Drive the shared frame clock by hand, starting at t=1000"""
+    replay_clock = ReplayClock(1000.0)
+    FRAME_CLOCK.set_source(replay_clock)
+    yield replay_clock
+    FRAME_CLOCK.reset()
+
+
+@pytest.fixture
+def settings():
+    return Settings()
+
+
+@pytest.fixture
+def ignore_list():
+    """Ignore list that never touches ignore_list.json"""
+    return IgnoreList(path=None)
@@ -0,0 +1,92 @@
+"""
+Tests for the shared entity store and the handlers built on it
+"""
+
+from albion_radar.core.entity_store import EntityStore
+from albion_radar.handlers.chests_handler import ChestsHandler
+from albion_radar.handlers.dungeons_handler import DungeonsHandler
+from albion_radar.handlers.fishing_handler import FishingHandler
+from albion_radar.handlers.wisp_cage_handler import WispCageHandler
+
+
+def test_values_are_cached_until_a_mutation():
+    store = EntityStore()
+    store.add(1, 'a')
+    store.add(2, 'b')
+    values = store.values()
+    assert store.values() is values
+
+    assert not store.add(1, 'c')
+    assert store.values() is values
+
+    store.put(1, 'c')
+    assert store.values() == ('c', 'b')
+    values = store.values()
+
+    assert store.remove(3) is None
+    assert store.values() is values
+    assert store.remove(2) == 'b'
+    assert store.values() == ('c',)
+
+    # Tuples handed out earlier do not change under the caller
+    assert values == ('c', 'b')
+
+
+def test_clear_and_detach_empty_the_store():
+    store = EntityStore()
+    store.add(1, 'a')
+    store.clear()
+    assert store.values() == () and len(store) == 0
+
+    store.add(2, 'b')
+    retired = store.detach()
+    assert retired == {2: 'b'}
+    assert store.values() == () and 2 not in store
+    store.add(3, 'c')
+    assert retired == {2: 'b'}
+
+
+def test_chest_list_follows_removals(settings):
+    handler = ChestsHandler(settings)
+    handler.handle_chest_event({0: 1, 1: [1.0, 1.0], 3: 'CHEST_GREEN'})
+    handler.handle_chest_event({0: 2, 1: [2.0, 2.0], 3: 'CHEST_BLUE'})
+    assert [chest.id for chest in handler.get_chests_list()] == [1, 2]
+
+    handler.remove_chest(1)
+    assert [chest.id for chest in handler.get_chests_list()] == [2]
+    assert [chest.id for chest in handler.get_in_range(0.0, 0.0, 10.0)] == [2]
+
+
+def test_cage_list_follows_opened_cages(settings):
+    handler = WispCageHandler(settings)
+    handler.handle_new_cage_event({0: 1, 1: [1.0, 1.0], 2: 'CAGE'})
+    handler.handle_new_cage_event({0: 2, 1: [2.0, 2.0], 2: 'CAGE'})
+    before = handler.get_cages_list()
+
+    handler.handle_cage_opened_event({0: 2})
+    assert [cage.id for cage in handler.get_cages_list()] == [1]
+    assert [cage.id for cage in before] == [1, 2]
+
+
+def test_fish_list_follows_updates_and_removals(settings):
+    handler = FishingHandler(settings)
+    handler.handle_new_fish_event({0: 1, 1: [1.0, 1.0], 2: 3, 3: 5, 4: 'FISH'})
+    handler.handle_new_fish_event({0: 2, 1: [2.0, 2.0], 2: 1, 3: 1, 4: 'FISH'})
+    handler.handle_new_fish_event({0: 1, 1: [1.0, 1.0], 2: 4, 3: 4, 4: 'FISH'})
+    assert [(fish.id, fish.size_spawned) for fish in handler.get_fishes_list()] == [(1, 4), (2, 1)]
+    assert len(handler.get_in_range(0.0, 0.0, 10.0)) == 2
+
+    handler.handle_fishing_end_event({0: 1})
+    assert [fish.id for fish in handler.get_fishes_list()] == [2]
+    assert [fish.id for fish in handler.get_in_range(0.0, 0.0, 10.0)] == [2]
+
+
+def test_dungeon_list_follows_removals(settings):
+    handler = DungeonsHandler(settings)
+    handler.handle_dungeon_event({0: 1, 1: [1.0, 1.0], 3: 'SOLO_DUNGEON', 6: 0})
+    handler.handle_dungeon_event({0: 2, 1: [2.0, 2.0], 3: 'GROUP_DUNGEON', 6: 1})
+    assert len(handler.snapshot()) == 2
+
+    handler.remove_dungeon(2)
+    assert [dungeon.id for dungeon in handler.get_dungeon_list()] == [1]
+    assert [dungeon.id for dungeon in handler.snapshot()] == [1]
@@ -0,0 +1,81 @@
+"""
+Tests for the event journal format, reopening and rotation
+"""
+
+import os
+
+import pytest
+
+from albion_radar.core.event_journal import (
+    EventJournalWriter, encode_varint, journal_files, read_journal
+)
+
+
+PACKETS = [
+    {'type': 'event', 'code': 1, 'parameters': {0: 42, 1: 'Player', 2: [1.5, -2.25], 3: None}},
+    {'type': 'request', 'code': 21, 'parameters': {0: -7, 1: b'\x00\xff', 2: True, 3: {'a': False}}},
+    {'type': 'response', 'code': 300, 'parameters': {}},
+]
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / 'session.arj')
+    with EventJournalWriter(path) as writer:
+        for index, packet in enumerate(PACKETS):
+            writer.append(packet, 100.0 + index * 0.25)
+
+    records = list(read_journal(path))
+    assert [packet for _, packet in records] == PACKETS
+    assert [timestamp for timestamp, _ in records] == pytest.approx([100.0, 100.25, 100.5])
+
+
+def test_negative_codes_are_zigzag_encoded(tmp_path):
+    path = str(tmp_path / 'session.arj')
+    with EventJournalWriter(path) as writer:
+        writer.append({'type': 'event', 'code': -3, 'parameters': {}}, 1.0)
+
+    assert [packet['code'] for _, packet in read_journal(path)] == [-3]
+    with pytest.raises(ValueError):
+        encode_varint(-1, bytearray())
+
+
+def test_reopen_appends_a_new_segment(tmp_path):
+    path = str(tmp_path / 'session.arj')
+    with EventJournalWriter(path) as writer:
+        writer.append(PACKETS[0], 100.0)
+    with EventJournalWriter(path) as writer:
+        writer.append(PACKETS[1], 500.0)
+        writer.append(PACKETS[2], 500.5)
+
+    records = list(read_journal(path))
+    assert [packet for _, packet in records] == PACKETS
+    assert [timestamp for timestamp, _ in records] == pytest.approx([100.0, 500.0, 500.5])
+
+
+def test_reopen_drops_a_truncated_trailing_record(tmp_path):
+    path = str(tmp_path / 'session.arj')
+    with EventJournalWriter(path) as writer:
+        writer.append(PACKETS[0], 100.0)
+        writer.append(PACKETS[1], 101.0)
+    # Interrupted write: cut the last record in half
+    os.truncate(path, os.path.getsize(path) - 3)
+    assert [packet for _, packet in read_journal(path)] == PACKETS[:1]
+
+    with EventJournalWriter(path) as writer:
+        writer.append(PACKETS[2], 102.0)
+
+    records = list(read_journal(path))
+    assert [packet for _, packet in records] == [PACKETS[0], PACKETS[2]]
+    assert records[-1][0] == pytest.approx(102.0)
+
+
+def test_rotation_keeps_every_record(tmp_path):
+    path = str(tmp_path / 'session.arj')
+    with EventJournalWriter(path, max_bytes=64, backups=10) as writer:
+        for index in range(20):
+            writer.append(PACKETS[0], float(index))
+
+    files = journal_files(path)
+    assert len(files) > 1
+    timestamps = [timestamp for name in files for timestamp, _ in read_journal(name)]
+    assert timestamps == pytest.approx([float(index) for index in range(20)])
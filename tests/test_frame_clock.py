@@ -0,0 +1,41 @@
+"""
+Tests for the shared frame clock
+"""
+
+from albion_radar.core.frame_clock import FRAME_CLOCK, FrameClock, frame_time
+from albion_radar.handlers.mobs_handler import MobsHandler
+from albion_radar.replay import ReplayClock
+
+
+def test_frame_time_is_fixed_within_a_frame():
+    source = ReplayClock(10.0)
+    clock = FrameClock(source)
+
+    assert clock.tick() == 10.0
+    source.now = 11.0
+    assert clock.now == 10.0
+    assert clock.sample() == 11.0
+
+    clock.end_frame()
+    assert clock.now == 11.0
+
+
+def test_wall_offset_converts_frame_times():
+    clock = FrameClock(ReplayClock(10.0), ReplayClock(1000.0))
+    clock.tick()
+
+    assert clock.wall() == 1000.0
+    assert clock.wall(12.5) == 1002.5
+
+
+def test_frame_time_follows_the_source_without_a_data_manager(settings, clock):
+    handler = MobsHandler(settings)
+    handler.add_mob(1, 412, 0.0, 0.0, health=100)
+    first = handler.mob_list.get(1)
+    assert first.detected_at == 1000.0
+
+    clock.now = 1005.0
+    assert frame_time() == 1005.0
+    handler.add_mob(2, 412, 0.0, 0.0, health=100)
+    assert handler.mob_list.get(2).detected_at == 1005.0
+    assert FRAME_CLOCK.sample() == 1005.0
@@ -0,0 +1,43 @@
+"""
+Tests for zone generations and deferred reclaim
+"""
+
+import pytest
+
+from albion_radar.core.data_manager import DataManager
+from albion_radar.core.generation import GenerationReclaimer
+
+
+def test_reclaim_respects_the_budget():
+    reclaimer = GenerationReclaimer(budget=3)
+    mapping = {index: index for index in range(5)}
+    sequence = list(range(4))
+    reclaimer.retire([mapping, sequence, {}])
+
+    assert len(reclaimer) == 2
+    assert reclaimer.reclaim() == 3
+    assert len(mapping) == 2
+    assert reclaimer.reclaim() == 3
+    assert (mapping, len(sequence)) == ({}, 3)
+    assert reclaimer.reclaim(10) == 3
+    assert len(reclaimer) == 0 and sequence == []
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_zone_change_starts_empty_and_reclaims_the_old_zone(settings, ignore_list, clock, columnar):
+    data_manager = DataManager(settings, ignore_list=ignore_list, columnar_harvestables=columnar)
+    for index in range(50):
+        data_manager.harvestables_handler.add_harvestable(index + 1, 0, 4, float(index), 0.0, size=1)
+        data_manager.mobs_handler.add_mob(index + 1, 412, float(index), 0.0, health=100)
+    data_manager.end_tick()
+
+    generation = data_manager.change_zone()
+    snapshot = data_manager.end_tick()
+
+    assert snapshot.generation == generation
+    assert snapshot.resources == () and snapshot.mobs == ()
+    ticks = 0
+    while len(data_manager._reclaimer):
+        data_manager.end_tick()
+        ticks += 1
+    assert ticks < 10
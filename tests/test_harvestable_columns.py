@@ -0,0 +1,49 @@
+"""
+Tests for the columnar harvestable store
+"""
+
+from albion_radar.core.harvestable_columns import HarvestableColumns
+from albion_radar.handlers.harvestables_handler import Harvestable, HarvestablesHandler
+
+
+def test_columns_round_trip_and_stay_dense():
+    store = HarvestableColumns(Harvestable)
+    for resource_id in range(1, 6):
+        store[resource_id] = Harvestable(id=resource_id, type=resource_id, tier=4,
+                                         pos_x=float(resource_id), pos_y=0.0, size=resource_id)
+    removed = store.pop(2)
+    del store[4]
+
+    assert removed.id == 2 and removed.size == 2
+    assert list(store) == [1, 3, 5]
+    assert [store.materialize(resource_id).pos_x for resource_id in store] == [1.0, 3.0, 5.0]
+    assert store.nbytes() > 0
+
+
+def test_getters_return_copies_that_survive_removal_and_reuse(settings):
+    handler = HarvestablesHandler(settings, columnar=True)
+    handler.add_harvestable(1, 0, 4, 5.0, 5.0, size=3)
+    handler.add_harvestable(2, 0, 5, 6.0, 6.0, size=2)
+
+    listed = handler.get_harvestable_list()
+    in_range = handler.get_in_range(0.0, 0.0, 20.0)
+    assert all(isinstance(harvestable, Harvestable) for harvestable in listed + in_range)
+
+    handler.remove_harvestable(1)
+    handler.add_harvestable(1, 0, 6, 9.0, 9.0, size=1)
+
+    first = next(harvestable for harvestable in in_range if harvestable.id == 1)
+    assert (listed[0].tier, listed[0].size) == (4, 3)
+    assert (first.tier, first.pos_x) == (4, 5.0)
+
+
+def test_values_past_a_byte_are_rejected_not_raised(settings):
+    handler = HarvestablesHandler(settings, columnar=True)
+    handler.add_harvestable(1, 0, 300, 5.0, 5.0, size=3)
+    handler.update_harvestable(2, 0, 4, 6.0, 6.0, charges=-1, size=2)
+    handler.add_harvestable(3, 0, 4, 7.0, 7.0, size=1)
+    handler.update_harvestable(3, 0, 4, 7.0, 7.0, charges=256, size=1)
+
+    assert [harvestable.id for harvestable in handler.get_harvestable_list()] == [3]
+    assert handler.get_harvestable_list()[0].charges == 0
+    assert handler.rejected == 3
@@ -0,0 +1,32 @@
+"""
+Tests for harvestable range culling
+"""
+
+import pytest
+
+from albion_radar.handlers.harvestables_handler import HarvestablesHandler
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_cull_drops_resources_without_a_size(settings, columnar):
+    handler = HarvestablesHandler(settings, columnar=columnar)
+    handler.add_harvestable(1, 0, 4, 5.0, 5.0, size=None)
+    handler.add_harvestable(2, 0, 4, 6.0, 6.0, size=3)
+    handler.add_harvestable(3, 0, 4, 500.0, 500.0, size=3)
+
+    handler.remove_not_in_range(0.0, 0.0)
+    assert [harvestable.id for harvestable in handler.harvestables] == [2]
+
+    # Also on a call the move threshold would otherwise skip
+    handler.add_harvestable(4, 0, 4, 7.0, 7.0, size=None)
+    handler.remove_not_in_range(0.5, 0.5)
+    assert [harvestable.id for harvestable in handler.harvestables] == [2]
+
+
+def test_size_update_keeps_a_resource(settings):
+    handler = HarvestablesHandler(settings)
+    handler.add_harvestable(1, 0, 4, 5.0, 5.0, size=None)
+    handler.update_harvestable_size(1, 2)
+
+    handler.remove_not_in_range(0.0, 0.0)
+    assert [harvestable.id for harvestable in handler.harvestables] == [1]
@@ -0,0 +1,61 @@
+"""
+Tests for the in-memory ignore list
+"""
+
+import json
+
+from albion_radar.core.data_manager import DataManager
+from albion_radar.core.ignore_list import IgnoreList
+
+
+def test_lookups_match_names_like_they_are_stored(ignore_list):
+    ignore_list.add('players', '  Ganker ')
+    ignore_list.add('guilds', 'Reds')
+
+    assert ignore_list.is_ignored('Ganker')
+    assert ignore_list.is_ignored(' Ganker  ')
+    assert ignore_list.is_ignored('Someone', ' Reds ')
+    # Case matters, as it does for the drawing code's ignore list
+    assert not ignore_list.is_ignored('GANKER')
+    assert not ignore_list.is_ignored('Someone', 'Blues')
+    assert not ignore_list.is_ignored('', '')
+
+
+def test_add_remove_and_duplicates(ignore_list):
+    assert ignore_list.add('players', 'Ganker')
+    assert ignore_list.add('players', ' Ganker')
+    assert ignore_list.to_dict()['players'] == ['Ganker']
+
+    version = ignore_list.version
+    assert ignore_list.remove('players', 'Ganker')
+    assert ignore_list.to_dict()['players'] == []
+    assert ignore_list.version == version + 1
+
+
+def test_changes_are_saved_and_reloaded(tmp_path):
+    path = str(tmp_path / 'ignore_list.json')
+    ignore_list = IgnoreList(path)
+    ignore_list.add('guilds', 'Reds')
+
+    with open(path) as f:
+        assert json.load(f) == {'players': [], 'guilds': ['Reds']}
+    assert IgnoreList(path).is_ignored('x', 'Reds')
+
+
+def test_failed_save_keeps_the_previous_state(tmp_path):
+    ignore_list = IgnoreList(str(tmp_path / 'missing' / 'ignore_list.json'))
+    state = ignore_list.state
+
+    assert not ignore_list.add('players', 'Ganker')
+    assert ignore_list.state is state
+    assert not ignore_list.is_ignored('Ganker')
+
+
+def test_data_manager_leaves_the_working_directory_alone(settings, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'ignore_list.json').write_text(json.dumps({'players': ['Ganker'], 'guilds': []}))
+
+    data_manager = DataManager(settings)
+    assert not data_manager.ignore_list.is_ignored('Ganker')
+    data_manager.ignore_list.add('players', 'Someone')
+    assert json.loads((tmp_path / 'ignore_list.json').read_text())['players'] == ['Ganker']
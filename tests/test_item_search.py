@@ -0,0 +1,81 @@
+"""
+Tests for the item name search index and its API route
+"""
+
+import pytest
+
+from albion_radar.core.item_search import MAX_GRAM, ItemSearchIndex
+
+ITEMS = [
+    (1, 'T4_BAG', "Adept's Bag"),
+    (2, 'T5_BAG', "Expert's Bag"),
+    (3, 'T4_2H_BOW', "Adept's Bow"),
+    (4, 'T6_MAIN_SWORD@1', "Master's Broadsword"),
+    (5, 'T4_CAPE', 'T4 Cape'),
+    (6, 'T4_OFF_SHIELD', "Adept's Shield")
+]
+
+
+@pytest.fixture
+def index():
+    return ItemSearchIndex(ITEMS)
+
+
+def ids(result):
+    return [item['id'] for item in result['items']]
+
+
+def test_prefix_and_substring(index):
+    assert ids(index.search('t4_', 'prefix')) == [3, 1, 5, 6]
+    assert ids(index.search('bag', 'prefix')) == []
+    assert ids(index.search('bag', 'substring')) == [1, 2]
+    assert ids(index.search('_b', 'substring')) == [1, 2, 3]
+
+
+def test_queries_longer_than_the_grams_are_verified(index):
+    assert ids(index.search('broadsword', 'substring')) == [4]
+    # Every 3-gram of this query occurs somewhere, the query itself nowhere
+    query = 't5_bo'
+    assert len(query) > MAX_GRAM
+    assert ids(index.search(query, 'substring')) == []
+
+
+def test_display_names_match(index):
+    assert ids(index.search("adept's", 'prefix')) == [1, 3, 6]
+    assert ids(index.search('master', 'substring')) == [4]
+    assert index.search('master', 'substring')['items'][0]['enchant'] == 1
+
+
+def test_tier_filter_counts_every_match_across_pages(index):
+    first = index.search('', 'substring', tiers=[4], offset=0, limit=2)
+    second = index.search('', 'substring', tiers=[4], offset=2, limit=2)
+    assert first['total'] == second['total'] == 4
+    assert ids(first) + ids(second) == [1, 3, 5, 6]
+    assert index.search('bag', 'prefix', tiers=[5])['total'] == 0
+
+
+def test_prefix_matches_on_both_names_are_listed_once(index):
+    result = index.search('t4', 'prefix')
+    assert result['total'] == 4
+    assert sorted(ids(result)) == [1, 3, 5, 6]
+
+
+@pytest.mark.parametrize('query', ['bag', ''])
+def test_unknown_mode_is_rejected(index, query):
+    with pytest.raises(ValueError):
+        index.search(query, 'fuzzy')
+
+
+def test_route_answers_bad_requests_with_400(index, monkeypatch):
+    pytest.importorskip('flask_socketio')
+    from albion_radar import web_interface
+
+    monkeypatch.setattr(web_interface, 'item_search_index', index)
+    client = web_interface.app.test_client()
+
+    response = client.get('/api/items/search?q=bag&mode=substring&tier=4,5&limit=1')
+    assert response.status_code == 200
+    assert response.get_json()['total'] == 2
+    assert ids(response.get_json()) == [1]
+    assert client.get('/api/items/search?q=bag&mode=fuzzy').status_code == 400
+    assert client.get('/api/items/search?q=bag&tier=x').status_code == 400
@@ -0,0 +1,44 @@
+"""
+Tests for the compiled item table
+"""
+
+import os
+
+from albion_radar.handlers.items_info import ItemsInfo
+
+ITEMS_TEXT = """\
+   1: T4_BAG                                            : Adept's Bag
+   2: T6_2H_BOW@2                                       : Expert's Bow
+   5: UNIQUE_HIDEOUT
+"""
+
+
+def write_source(directory) -> str:
+    source = directory / 'items.txt'
+    source.write_text(ITEMS_TEXT, encoding='utf-8')
+    return str(source)
+
+
+def test_table_is_built_in_the_user_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    items = ItemsInfo(source_path=write_source(tmp_path))
+
+    assert items.table_path == str(tmp_path / 'cache' / 'albion_radar' / 'items.bin')
+    assert os.path.exists(items.table_path)
+    assert items.get(1) == 'T4_BAG'
+    assert items.get_item_name(2) == "Expert's Bow"
+    assert items.describe_item(2)['item_power'] == 1100
+    assert items.get(3) is None
+    items.close()
+
+
+def test_unwritable_cache_falls_back_to_memory(tmp_path, monkeypatch):
+    # A file where the cache directory should be makes it impossible to create
+    blocker = tmp_path / 'blocker'
+    blocker.write_text('')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(blocker))
+    items = ItemsInfo(source_path=write_source(tmp_path))
+
+    assert not os.path.exists(items.table_path)
+    assert items.get(5) == 'UNIQUE_HIDEOUT'
+    assert items.get_item_name(1) == "Adept's Bag"
@@ -0,0 +1,68 @@
+"""
+Tests for the MobsInfo.js compiler and the lookups over its output
+"""
+
+import importlib.util
+
+import pytest
+
+from albion_radar.handlers import mobs_info
+from albion_radar.handlers.mobs_handler import EnemyType, MobsHandler
+from albion_radar.tools.compile_mobs_info import UNKNOWN, compile_mobs_info
+
+MOBS_INFO_JS = """\
+class MobsInfo {
+    initMobs() {
+        this.addItem(3, 4, EnemyType.LivingSkinnable, "hide");
+        // this.addItem(4, 5, EnemyType.Boss, "commented out");
+        /* this.addItem(5, 6, EnemyType.Boss, "block comment"); */
+        this.addItem(7, 6, EnemyType.Boss, "GRIFFIN");
+        this.addItem(9, 5, EnemyType.LivingHarvestable, "fiber");
+        this.addItem(9, 7, EnemyType.LivingHarvestable, "Logs");
+    }
+}
+"""
+
+
+@pytest.fixture
+def mobs_db(tmp_path, monkeypatch):
+    """Compile the fixture and make the lookups read it"""
+    source = tmp_path / 'MobsInfo.js'
+    source.write_text(MOBS_INFO_JS, encoding='utf-8')
+    output = tmp_path / 'mobs_db.py'
+    assert compile_mobs_info(str(source), str(output)) == 3
+
+    spec = importlib.util.spec_from_file_location('fixture_mobs_db', str(output))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(mobs_info, 'mobs_db', module)
+    return module
+
+
+def test_compiled_tables(mobs_db):
+    assert mobs_db.TABLE_SIZE == 10
+    assert [mobs_info.mob_tier(type_id) for type_id in (3, 7, 9)] == [4, 6, 7]
+    assert mobs_info.mob_name(7) == 'GRIFFIN'
+    # Later entries for the same id win
+    assert mobs_info.mob_name(9) == 'Logs'
+    assert mobs_db.CATEGORY_NAMES[mobs_info.mob_category(3)] == 'LivingSkinnable'
+
+
+@pytest.mark.parametrize('type_id', [4, 5, 8, 10, 5000, -1])
+def test_unknown_type_ids(mobs_db, type_id):
+    assert mobs_info.mob_tier(type_id) == 0
+    assert mobs_info.mob_category(type_id) == UNKNOWN
+    assert mobs_info.mob_name(type_id) == ''
+    assert mobs_info.MobsInfo().get_mob_info(type_id) is None
+
+
+def test_handler_classifies_from_the_table(mobs_db, settings, clock):
+    handler = MobsHandler(settings)
+    handler.add_mob(1, 7, 0.0, 0.0, health=100)
+    handler.add_mob(2, 9, 0.0, 0.0, health=100)
+    handler.add_mob(3, 8, 0.0, 0.0, health=100)
+
+    boss, logs, unknown = (handler.mob_list.get(mob_id) for mob_id in (1, 2, 3))
+    assert (boss.name, boss.tier, boss.enemy_type) == ('GRIFFIN', 6, EnemyType.BOSS.value)
+    assert (logs.tier, logs.enemy_type) == (7, EnemyType.LIVING_HARVESTABLE.value)
+    assert (unknown.name, unknown.tier, unknown.enemy_type) == ('Mob_8', 0, EnemyType.ENEMY.value)
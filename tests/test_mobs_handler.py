@@ -0,0 +1,38 @@
+"""
+Tests for mob and mist tracking
+"""
+
+from albion_radar.handlers.mobs_handler import MobsHandler
+
+
+def test_mist_image_follows_the_enchantment(settings):
+    handler = MobsHandler(settings)
+    handler.handle_mist_event({0: 1, 1: [5.0, 5.0], 2: 'MIST_SOLO', 3: 2})
+    mist = handler.mist_list.get(1)
+    assert mist.draw_name == 'mist_2'
+
+    handler.handle_mist_event({0: 1, 1: [5.0, 5.0], 2: 'MIST_GROUP', 3: 4})
+    assert (mist.name, mist.draw_name) == ('MIST_GROUP', 'mist_4')
+
+
+def test_updates_before_the_spawn_do_not_override_it(settings, clock):
+    handler = MobsHandler(settings)
+    handler.update_mob_position(1, 50.0, 50.0)
+    handler.update_mob_health(1, 10)
+    handler.add_mob(1, 0, 5.0, 5.0, health=100)
+    handler.apply_pending_updates()
+
+    mob = handler.mob_list.get(1)
+    assert (mob.pos_x, mob.pos_y, mob.health) == (5.0, 5.0, 100)
+
+
+def test_updates_before_a_respawn_do_not_override_it(settings, clock):
+    handler = MobsHandler(settings)
+    handler.add_mob(1, 0, 5.0, 5.0, health=100)
+    handler.update_mob_position(1, 50.0, 50.0)
+    handler.remove_mob(1)
+    handler.add_mob(1, 0, 7.0, 7.0, health=80)
+    handler.apply_pending_updates()
+
+    mob = handler.mob_list.get(1)
+    assert (mob.pos_x, mob.pos_y, mob.health) == (7.0, 7.0, 80)
@@ -0,0 +1,85 @@
+"""
+Tests for dead reckoning
+"""
+
+import pytest
+
+from albion_radar.core.data_manager import DataManager
+from albion_radar.core.motion_tracker import (
+    MAX_EXTRAPOLATION, MAX_SPEED, MIN_UPDATE_INTERVAL, STALE_INTERVAL, MotionTracker
+)
+
+
+def test_velocity_comes_from_consecutive_updates():
+    tracker = MotionTracker()
+    tracker.observe(1, 0.0, 0.0, 10.0)
+    tracker.observe(1, 2.0, -1.0, 10.5)
+
+    assert tracker.velocity_of(1) == (4.0, -2.0)
+    assert tracker.position_of(1, 10.75) == (3.0, -1.5)
+
+
+def test_extrapolation_is_clamped():
+    tracker = MotionTracker()
+    tracker.observe(1, 0.0, 0.0, 10.0)
+    tracker.observe(1, 1.0, 0.0, 10.5)
+
+    ahead = 2.0 * MAX_EXTRAPOLATION
+    expected = 1.0 + 2.0 * MAX_EXTRAPOLATION
+    assert tracker.position_of(1, 10.5 + ahead) == (expected, 0.0)
+    assert tracker.position_of(1, 9.0) == (1.0, 0.0)
+    ids, xs, ys = tracker.extrapolate(10.5 + ahead)
+    assert (ids, xs, ys) == ([1], [expected], [0.0])
+
+
+def test_stale_updates_and_teleports_reset_the_velocity():
+    tracker = MotionTracker()
+    tracker.observe(1, 0.0, 0.0, 10.0)
+    tracker.observe(1, 1.0, 0.0, 10.5)
+    tracker.observe(1, 2.0, 0.0, 10.5 + STALE_INTERVAL + 1.0)
+    assert tracker.velocity_of(1) == (0.0, 0.0)
+
+    tracker.observe(1, 3.0, 0.0, 14.0)
+    assert tracker.velocity_of(1) != (0.0, 0.0)
+    tracker.observe(1, 3.0 + MAX_SPEED, 0.0, 14.5)
+    assert tracker.velocity_of(1) == (0.0, 0.0)
+
+
+def test_close_updates_move_the_extrapolation_origin():
+    tracker = MotionTracker()
+    tracker.observe(1, 0.0, 0.0, 10.0)
+    tracker.observe(1, 1.0, 0.0, 10.5)
+    tracker.observe(1, 1.001, 0.0, 10.5 + MIN_UPDATE_INTERVAL / 2)
+
+    # The velocity is kept, but extrapolates from the newest position and time
+    assert tracker.velocity_of(1) == (2.0, 0.0)
+    x, y = tracker.position_of(1, 10.5 + MIN_UPDATE_INTERVAL / 2)
+    assert x == pytest.approx(1.001)
+
+
+def test_remove_keeps_rows_dense():
+    tracker = MotionTracker()
+    for entity_id in (1, 2, 3):
+        tracker.observe(entity_id, float(entity_id), 0.0, 10.0)
+    tracker.observe(3, 4.0, 0.0, 11.0)
+
+    tracker.remove(1)
+    tracker.remove(7)
+    assert len(tracker) == 2 and 1 not in tracker
+    assert tracker.velocity_of(3) == (1.0, 0.0)
+    assert sorted(tracker.extrapolate(11.0)[0]) == [2, 3]
+
+    tracker.remove(3)
+    assert tracker.extrapolate(11.0) == ([2], [2.0], [0.0])
+
+
+def test_snapshots_carry_motion_when_enabled(settings, ignore_list, clock):
+    data_manager = DataManager(settings, ignore_list=ignore_list, dead_reckoning=True)
+    data_manager.mobs_handler.add_mob(5, 0, 1.0, 1.0, health=10)
+    clock.now += 0.5
+    data_manager.mobs_handler.update_mob_position(5, 2.0, 1.0)
+    data_manager.end_tick()
+
+    motion = data_manager.get_snapshot().motion_dict()
+    [(mob_id, x, y, vx, vy, _)] = motion['mobs']
+    assert (mob_id, x, y, vx, vy) == (5, 2.0, 1.0, 2.0, 0.0)
@@ -0,0 +1,32 @@
+"""
+Tests for the entity free list
+"""
+
+from albion_radar.core.object_pool import ObjectPool
+from albion_radar.handlers.harvestables_handler import Harvestable, HarvestablesHandler
+
+
+def test_released_instances_are_reinitialized():
+    pool = ObjectPool(Harvestable, max_size=1)
+    first = pool.acquire(id=1, type=0, tier=4, pos_x=1.0, pos_y=1.0, size=3, h_x=5.0)
+    second = pool.acquire(id=2, type=0, tier=4, pos_x=2.0, pos_y=2.0)
+    pool.release(first)
+    pool.release(second)
+
+    reused = pool.acquire(id=3, type=1, tier=5, pos_x=3.0, pos_y=3.0)
+    assert reused is first
+    # Fields left out fall back to their defaults
+    assert (reused.id, reused.size, reused.h_x) == (3, 0, 0.0)
+    assert pool.stats() == {'free': 0, 'created': 2, 'reused': 1, 'dropped': 1}
+
+
+def test_handler_recycles_removed_resources(settings):
+    handler = HarvestablesHandler(settings)
+    pool = handler.enable_pooling(16)
+    handler.add_harvestable(1, 0, 4, 0.0, 0.0, size=1)
+    handler.remove_harvestable(1)
+    handler.add_harvestable(2, 0, 4, 1.0, 1.0, size=2)
+
+    assert (pool.created, pool.reused) == (1, 1)
+    assert [(harvestable.id, harvestable.size) for harvestable in handler.harvestables] == [(2, 2)]
+    assert HarvestablesHandler(settings, columnar=True).enable_pooling() is None
@@ -0,0 +1,35 @@
+"""
+Tests for player equipment tracking
+"""
+
+from albion_radar.core.data_manager import DataManager
+from albion_radar.models.player import EQUIPMENT_SLOTS, equipment_array, slot_name
+
+NEW_PLAYER = {'type': 'event', 'code': 1,
+              'parameters': {0: 7, 1: [10.0, 20.0], 2: 'Ganker', 5: 900, 6: 1000, 7: [101, 0, 205]}}
+
+
+def test_equipment_keeps_every_listed_slot():
+    items = list(range(1, len(EQUIPMENT_SLOTS) + 4))
+    assert equipment_array(items).tolist() == items
+    assert equipment_array({'type': 'Buffer', 'data': [3, -1, None]}).tolist() == [3, 0, 0]
+    assert slot_name(0) == 'main_hand'
+    assert slot_name(len(EQUIPMENT_SLOTS) + 1) == f'slot_{len(EQUIPMENT_SLOTS) + 1}'
+
+
+def test_equipment_changed_event_is_routed(settings, ignore_list, clock):
+    data_manager = DataManager(settings, ignore_list=ignore_list)
+    changes = []
+    data_manager.add_callback('player_equipment_changed', changes.append)
+    data_manager.process_packet_data(NEW_PLAYER)
+
+    items = [101, 0, 300] + [0] * (len(EQUIPMENT_SLOTS) - 3) + [42]
+    data_manager.process_packet_data({'type': 'event', 'code': 8, 'parameters': {0: 7, 2: items}})
+
+    player = data_manager.end_tick().players[0]
+    assert player.items.tolist() == items
+    assert changes == [{'id': 7, 'slots': [2, len(EQUIPMENT_SLOTS)]}]
+
+    # Repeating the same equipment changes nothing
+    data_manager.process_packet_data({'type': 'event', 'code': 8, 'parameters': {0: 7, 2: items}})
+    assert len(changes) == 1
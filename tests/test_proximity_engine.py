@@ -0,0 +1,78 @@
+"""
+Tests for the numpy proximity engine, checked against the spatial grid
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from albion_radar.core.proximity_engine import ProximityEngine
+from albion_radar.core.spatial_grid import SpatialGrid
+
+RADIUS = 50.0
+
+
+def random_position(rng):
+    # Whole numbers keep float32 rounding away from the range boundary
+    return float(rng.randint(-150, 150)), float(rng.randint(-150, 150))
+
+
+def assert_matches_grid(engine, grid, center_x, center_y):
+    expected = {key: distance_sq ** 0.5
+                for key, distance_sq in grid.query_with_distance(center_x, center_y, RADIUS)}
+    engine.compute(center_x, center_y, RADIUS)
+    ids = engine.sorted_in_range_ids()
+
+    assert sorted(ids) == sorted(expected)
+    distances = [engine.distance_of(entity_id) for entity_id in ids]
+    assert distances == sorted(distances)
+    for entity_id in ids:
+        assert engine.distance_of(entity_id) == pytest.approx(expected[entity_id], abs=1e-3)
+        assert engine.in_range(entity_id)
+
+
+def test_insert_move_remove_and_query_match_the_grid():
+    rng = random.Random(33)
+    engine = ProximityEngine(capacity=4)
+    grid = SpatialGrid()
+
+    for entity_id in range(1, 301):
+        x, y = random_position(rng)
+        engine.insert(entity_id, x, y)
+        grid.insert(entity_id, x, y, entity_id)
+    assert len(engine) == 300
+    assert_matches_grid(engine, grid, 0.0, 0.0)
+
+    for entity_id in rng.sample(range(1, 301), 100):
+        x, y = random_position(rng)
+        engine.move(entity_id, x, y)
+        grid.move(entity_id, x, y)
+    assert_matches_grid(engine, grid, 10.0, -20.0)
+
+    for entity_id in rng.sample(range(1, 301), 120):
+        engine.remove(entity_id)
+        grid.remove(entity_id)
+    assert len(engine) == 180
+    assert_matches_grid(engine, grid, -30.0, 40.0)
+
+
+def test_results_go_stale_on_changes():
+    engine = ProximityEngine()
+    engine.insert(1, 3.0, 4.0)
+    engine.compute(0.0, 0.0, RADIUS)
+    assert engine.is_current(0.0, 0.0, RADIUS)
+    assert not engine.is_current(1.0, 0.0, RADIUS)
+    assert engine.distance_of(1) == 5.0
+
+    engine.move(1, 0.0, 60.0)
+    assert not engine.is_current(0.0, 0.0, RADIUS)
+    engine.compute(0.0, 0.0, RADIUS)
+    assert not engine.in_range(1)
+    assert engine.sorted_in_range_ids() == []
+
+    engine.remove(1)
+    engine.move(1, 0.0, 0.0)
+    assert 1 not in engine
+    assert engine.distance_of(2) is None
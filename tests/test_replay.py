@@ -0,0 +1,32 @@
+"""
+Tests for the replay harness
+"""
+
+import json
+
+from albion_radar.core.frame_clock import FRAME_CLOCK
+from albion_radar.replay import replay
+
+
+EVENTS = [
+    (100.0, {'type': 'event', 'code': 1,
+             'parameters': {0: 7, 1: [10.0, 20.0], 2: 'Ganker', 3: 'Reds', 5: 900, 6: 1000}}),
+    (100.5, {'type': 'event', 'code': 3, 'parameters': {0: 8, 1: 412, 2: [5.0, 5.0], 3: 500}}),
+]
+
+
+def test_replay_is_deterministic_and_restores_the_clock():
+    first = replay(EVENTS)
+    second = replay(EVENTS)
+
+    assert first['world_hash'] == second['world_hash']
+    assert first['peak_entities']['players'] == 1
+    # The shared clock is back on the monotonic system clock
+    assert FRAME_CLOCK.sample() != EVENTS[-1][0]
+
+
+def test_replay_ignores_the_working_directory_ignore_list(tmp_path, monkeypatch):
+    (tmp_path / 'ignore_list.json').write_text(json.dumps({'players': ['Ganker'], 'guilds': []}))
+    monkeypatch.chdir(tmp_path)
+
+    assert replay(EVENTS)['peak_entities']['players'] == 1
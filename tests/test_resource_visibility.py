@@ -0,0 +1,71 @@
+"""
+Tests for the compiled resource visibility tables
+"""
+
+import pytest
+
+from albion_radar.core.data_manager import DataManager
+from albion_radar.core.resource_visibility import ResourceVisibility
+from albion_radar.handlers.harvestables_handler import HarvestablesHandler
+
+FIBER = 11
+
+ONLY_T4 = {f'e{enchant}': [tier == 4 for tier in range(1, 9)] for enchant in range(5)}
+
+
+def test_tables_follow_the_settings():
+    visibility = ResourceVisibility({'harvesting_static_fiber': ONLY_T4})
+
+    assert visibility.is_visible(FIBER, 4, 0)
+    assert not visibility.is_visible(FIBER, 5, 0)
+    # Categories without a setting use the default
+    assert visibility.is_visible(0, 5, 0)
+
+
+@pytest.mark.parametrize('default', [True, False])
+def test_combinations_outside_the_tables_use_the_default(default):
+    visibility = ResourceVisibility({}, default=default)
+
+    assert visibility.is_visible(FIBER, 9, 0) is default
+    assert visibility.is_visible(FIBER, 4, 5) is default
+    assert visibility.is_visible(40, 4, 0) is default
+    assert visibility.is_category_visible('unknown', 4, 0) is default
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_handler_keeps_out_of_table_resources(settings, columnar):
+    handler = HarvestablesHandler(settings, columnar=columnar)
+    handler.add_harvestable(1, FIBER, 4, 0.0, 0.0, charges=6, size=1)
+    handler.add_harvestable(2, FIBER, 12, 0.0, 0.0, charges=0, size=1)
+
+    assert handler.apply_visibility() == 0
+    assert len(handler.get_harvestable_list()) == 2
+
+
+def test_settings_change_applies_on_notification(settings, ignore_list):
+    data_manager = DataManager(settings, ignore_list=ignore_list)
+    data_manager.harvestables_handler.add_harvestable(1, FIBER, 5, 0.0, 0.0, size=1)
+    data_manager.end_tick()
+
+    settings.harvesting_static_fiber = ONLY_T4
+    assert len(data_manager.end_tick().resources) == 1
+
+    data_manager.settings_changed()
+    assert len(data_manager.end_tick().resources) == 0
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_living_resources_use_the_living_settings(settings, columnar):
+    handler = HarvestablesHandler(settings, columnar=columnar)
+    handler.handle_new_harvestable_object(1, {5: FIBER, 6: 65535, 7: 5, 8: [0.0, 0.0], 10: 1})
+    handler.handle_new_harvestable_object(2, {5: FIBER, 6: 412, 7: 5, 8: [1.0, 1.0], 10: 1})
+    assert len(handler.get_harvestable_list()) == 2
+
+    settings.harvesting_living_fiber = ONLY_T4
+    assert handler.refresh_visibility()
+    assert [h.id for h in handler.get_harvestable_list()] == [1]
+
+    # New living resources are filtered on ingestion too
+    handler.handle_new_harvestable_object(3, {5: FIBER, 6: 412, 7: 5, 8: [2.0, 2.0], 10: 1})
+    handler.handle_new_harvestable_object(4, {5: FIBER, 6: 412, 7: 4, 8: [3.0, 3.0], 10: 1})
+    assert [h.id for h in handler.get_harvestable_list()] == [1, 4]
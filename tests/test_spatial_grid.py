@@ -0,0 +1,52 @@
+"""
+Tests for the spatial grid against brute force distance checks
+"""
+
+import random
+
+import pytest
+
+from albion_radar.core.spatial_grid import SpatialGrid
+
+
+def brute_force(positions, center_x, center_y, radius):
+    return {key for key, (x, y) in positions.items()
+            if (x - center_x) ** 2 + (y - center_y) ** 2 <= radius * radius}
+
+
+@pytest.mark.parametrize('cell_size', [7.5, 40.0, 200.0])
+def test_queries_match_brute_force(cell_size):
+    rng = random.Random(3)
+    grid = SpatialGrid(cell_size)
+    positions = {}
+    for key in range(600):
+        positions[key] = (rng.uniform(-400, 400), rng.uniform(-400, 400))
+        grid.insert(key, *positions[key])
+
+    # Moves, including across cells, and removals keep the index current
+    for key in rng.sample(range(600), 200):
+        positions[key] = (rng.uniform(-400, 400), rng.uniform(-400, 400))
+        grid.move(key, *positions[key])
+    for key in rng.sample(range(600), 100):
+        grid.remove(key)
+        positions.pop(key, None)
+
+    assert len(grid) == len(positions)
+    for _ in range(50):
+        center_x, center_y = rng.uniform(-450, 450), rng.uniform(-450, 450)
+        radius = rng.choice((0.0, 10.0, 80.0, 333.0))
+        inside = brute_force(positions, center_x, center_y, radius)
+
+        assert set(grid.query(center_x, center_y, radius)) == inside
+        assert set(grid.query_outside(center_x, center_y, radius)) == set(positions) - inside
+
+
+def test_items_and_positions():
+    grid = SpatialGrid()
+    grid.insert('a', 1.0, 2.0, item='A')
+    grid.insert('a', 100.0, -50.0)
+
+    assert grid.get('a') == 'A'
+    assert grid.position('a') == (100.0, -50.0)
+    assert grid.query_with_distance(100.0, -47.0, 5.0) == [('A', 9.0)]
+    assert grid.remove('a') == 'A' and 'a' not in grid
@@ -0,0 +1,102 @@
+"""
+Tests for the timing wheel and DataManager entity expiry
+"""
+
+import random
+
+from albion_radar.core.data_manager import DataManager
+from albion_radar.core.timing_wheel import TimingWheel
+
+
+def test_keys_fire_at_their_deadline():
+    wheel = TimingWheel(resolution=0.5)
+    wheel.start(0.0)
+    wheel.schedule('a', 1.0)
+    wheel.schedule('b', 3.0)
+
+    assert wheel.advance(0.9) == []
+    assert wheel.advance(1.0) == ['a']
+    assert wheel.advance(2.9) == []
+    assert wheel.advance(3.0) == ['b']
+    assert len(wheel) == 0
+
+
+def test_reschedule_and_cancel():
+    wheel = TimingWheel(resolution=0.5)
+    wheel.start(0.0)
+    wheel.schedule('a', 1.0)
+    wheel.schedule('a', 5.0)
+    wheel.schedule('b', 2.0)
+    assert wheel.cancel('b')
+    assert not wheel.cancel('b')
+
+    assert wheel.advance(4.5) == []
+    assert wheel.advance(5.0) == ['a']
+
+
+def test_far_deadlines_cascade_down_exactly():
+    wheel = TimingWheel(resolution=0.5, slots=8, levels=3)
+    wheel.start(0.0)
+    rng = random.Random(3)
+    # Some deadlines are past the horizon of every level (8 ** 3 ticks)
+    deadlines = {key: rng.uniform(0.5, 400.0) for key in range(300)}
+    for key, deadline in deadlines.items():
+        wheel.schedule(key, deadline)
+
+    fired = {}
+    now = 0.0
+    while now < 401.0:
+        now += 0.5
+        for key in wheel.advance(now):
+            fired[key] = now
+
+    assert set(fired) == set(deadlines)
+    for key, deadline in deadlines.items():
+        # Fires on the first resolution step at or after its deadline
+        assert deadline <= fired[key] < deadline + 0.5
+
+
+def _player_event(player_id, nickname):
+    return {'type': 'event', 'code': 1, 'parameters': {0: player_id, 1: [0.0, 0.0], 2: nickname}}
+
+
+def test_idle_player_expires_after_ttl(clock, settings, ignore_list):
+    manager = DataManager(settings, entity_ttls={'player': 60.0}, ignore_list=ignore_list)
+    manager.process_packet_data(_player_event(7, 'Idle'))
+
+    clock.now += 59.0
+    manager.end_tick()
+    assert 7 in manager.players_handler.players
+
+    clock.now += 2.0
+    manager.end_tick()
+    assert 7 not in manager.players_handler.players
+
+
+def test_moving_player_survives_past_ttl(clock, settings, ignore_list):
+    manager = DataManager(settings, entity_ttls={'player': 60.0}, ignore_list=ignore_list)
+    manager.process_packet_data(_player_event(7, 'Mover'))
+
+    for second in range(1, 181):
+        clock.now += 1.0
+        manager.clock.tick()
+        manager.players_handler.update_player_position(7, float(second), 0.0)
+        manager.end_tick()
+    assert 7 in manager.players_handler.players
+
+    # Stops moving: gone once the TTL has passed since the last move
+    clock.now += 61.0
+    manager.end_tick()
+    assert 7 not in manager.players_handler.players
+
+
+def test_mob_updates_count_as_activity(clock, settings, ignore_list):
+    manager = DataManager(settings, entity_ttls={'mob': 30.0}, ignore_list=ignore_list)
+    manager.process_packet_data({'type': 'event', 'code': 3,
+                                 'parameters': {0: 5, 1: [0.0, 0.0], 2: 400, 3: 100}})
+
+    for step in range(1, 10):
+        clock.now += 10.0
+        manager.mobs_handler.update_mob_health(5, 100 - step)
+        manager.end_tick()
+    assert 5 in manager.mobs_handler.mob_list
@@ -0,0 +1,100 @@
+"""
+Tests for versioned entities and their cached serialization
+"""
+
+import copy
+
+import pytest
+
+from albion_radar.core.object_pool import ObjectPool
+from albion_radar.handlers.players_handler import PlayersHandler
+from albion_radar.models.mob import Mob
+from albion_radar.models.player import Player
+from albion_radar.models.resource import Resource, ResourceType
+from albion_radar.models.versioned import Versioned
+
+
+def test_base_class_cannot_be_instantiated():
+    with pytest.raises(TypeError):
+        Versioned()
+
+
+def test_to_dict_is_cached_until_a_change():
+    mob = Mob(id=1, name='Wolf', health=100)
+    first = mob.to_dict()
+
+    assert mob.to_dict() is first
+    mob.update_health(40)
+    assert mob.to_dict()['health'] == 40
+
+
+def test_copies_never_serve_each_others_dicts():
+    mob = Mob(id=1, name='Wolf', health=100)
+    frozen = copy.copy(mob)
+    assert frozen.to_dict() is mob.to_dict()
+
+    # Both change once, to different values, so their change counts match
+    mob.health = 50
+    frozen.health = 70
+    assert mob.to_dict()['health'] == 50
+    assert frozen.to_dict()['health'] == 70
+    assert mob.to_dict()['health'] == 50
+
+
+def test_recycled_instance_is_serialized_afresh():
+    pool = ObjectPool(Mob)
+    mob = pool.acquire(id=1, name='Wolf', health=100)
+    snapshot = copy.copy(mob)
+    assert snapshot.to_dict()['name'] == 'Wolf'
+
+    pool.release(mob)
+    reused = pool.acquire(id=2, name='Bear', health=300)
+    assert reused is mob
+    assert reused.to_dict()['id'] == 2
+    assert reused.to_dict()['name'] == 'Bear'
+    assert snapshot.to_dict()['name'] == 'Wolf'
+
+
+def test_range_queries_keep_the_cached_dict(settings, clock):
+    handler = PlayersHandler(settings)
+    handler.add_player(30.0, 40.0, 7, 'Someone')
+    player = handler.players[7]
+
+    assert handler.get_players_in_range() == [player]
+    first = player.to_dict()
+    clock.now += 1.0
+    assert handler.get_players_in_range() == [player]
+    assert player.distance == 50
+    assert player.to_dict() is first
+
+
+def test_writing_an_unchanged_value_keeps_the_version():
+    mob = Mob(id=1, name='Wolf', health=100)
+    version = mob.version
+    mob.health = 100
+    assert mob.version == version
+    mob.health = 90
+    assert mob.version != version
+
+
+@pytest.mark.parametrize('cls, fields', [
+    (Mob, dict(id=1, name='Wolf', health=100)),
+    (Player, dict(id=2, nickname='Someone', pos_x=3.0)),
+    (Resource, dict(id=3, type=ResourceType.WOOD, tier=4, pos_x=1.0, pos_y=2.0)),
+])
+def test_compact_entities_are_slotted_and_still_dataclasses(cls, fields, clock):
+    entity = cls(**fields)
+    assert '__slots__' in cls.__dict__
+    assert not hasattr(entity, '__dict__')
+
+    assert entity == cls(**fields)
+    clone = copy.copy(entity)
+    assert clone == entity
+    assert clone.version == entity.version
+    assert clone.to_dict() == entity.to_dict()
+
+
+def test_construction_takes_a_single_version():
+    first = Mob(id=1, name='Wolf', health=100)
+    second = Mob(id=2, name='Bear', health=300)
+    assert second.version == first.version + 1
@@ -0,0 +1,75 @@
+"""
+Tests for world snapshots and mob deltas
+"""
+
+import json
+
+from albion_radar.core.data_manager import DataManager
+
+
+def test_mob_delta_names_its_base_snapshot(settings, ignore_list, clock):
+    data_manager = DataManager(settings, ignore_list=ignore_list)
+    data_manager.mobs_handler.add_mob(1, 412, 5.0, 5.0, health=100)
+    first = data_manager.end_tick()
+
+    data_manager.mobs_handler.update_mob_health(1, 50)
+    data_manager.mobs_handler.add_mob(2, 412, 6.0, 6.0, health=100)
+    second = data_manager.end_tick()
+
+    delta = second.mob_delta()
+    assert (delta['base_sequence'], delta['base_generation']) == (first.sequence, first.generation)
+    assert sorted(mob['id'] for mob in delta['changed']) == [1, 2]
+    assert second.mob_delta_applies(first.sequence, first.generation)
+    # A client that missed a snapshot must not apply it
+    assert not second.mob_delta_applies(first.sequence - 1, first.generation)
+
+
+def test_mob_delta_does_not_apply_across_zones(settings, ignore_list, clock):
+    data_manager = DataManager(settings, ignore_list=ignore_list)
+    data_manager.mobs_handler.add_mob(1, 412, 5.0, 5.0, health=100)
+    before = data_manager.end_tick()
+
+    data_manager.change_zone()
+    data_manager.mobs_handler.add_mob(2, 412, 6.0, 6.0, health=100)
+    after = data_manager.end_tick()
+
+    assert after.generation != before.generation
+    assert not after.mob_delta_applies(before.sequence, before.generation)
+
+
+def test_snapshots_do_not_follow_later_mutation(settings, ignore_list, clock):
+    data_manager = DataManager(settings, ignore_list=ignore_list)
+    data_manager.process_packet_data({'type': 'event', 'code': 1, 'parameters': {
+        0: 7, 1: [10.0, 20.0], 2: 'Ganker', 5: 900, 6: 1000, 7: [101, 205]}})
+    data_manager.mobs_handler.add_mob(1, 412, 5.0, 5.0, health=100)
+    snapshot = data_manager.end_tick()
+    serialized = json.dumps(snapshot.to_dict(), sort_keys=True)
+
+    data_manager.players_handler.update_player_position(7, 30.0, 40.0)
+    data_manager.players_handler.update_player_items(7, [999, 0])
+    data_manager.mobs_handler.update_mob_health(1, 10)
+    data_manager.mobs_handler.remove_mob(1)
+    # Marks the world dirty, as processing a packet would
+    data_manager.update_local_player_position(1.0, 1.0)
+    later = data_manager.end_tick()
+
+    player = snapshot.players[0]
+    assert (player.pos_x, player.pos_y, player.items.tolist()) == (10.0, 20.0, [101, 205])
+    assert [mob.health for mob in snapshot.mobs] == [100]
+    assert json.dumps(snapshot.to_dict(), sort_keys=True) == serialized
+    assert later.sequence == snapshot.sequence + 1 and later.mobs == ()
+
+
+def test_pooled_entities_do_not_leak_into_old_snapshots(settings, ignore_list, clock):
+    data_manager = DataManager(settings, ignore_list=ignore_list, object_pooling=True)
+    data_manager.mobs_handler.add_mob(1, 412, 5.0, 5.0, health=100)
+    snapshot = data_manager.end_tick()
+
+    data_manager.mobs_handler.remove_mob(1)
+    data_manager.mobs_handler.add_mob(2, 500, 9.0, 9.0, health=300)
+    assert data_manager.mobs_handler.pool.reused == 1
+
+    assert [(mob.id, mob.health) for mob in snapshot.mobs] == [(1, 100)]
+    assert [mob['id'] for mob in snapshot.to_dict()['mobs']] == [1]
+    data_manager.update_local_player_position(1.0, 1.0)
+    assert [mob.id for mob in data_manager.end_tick().mobs] == [2]